@@ -0,0 +1,422 @@
+"""Benchmarks for the toolkit's hot paths.
+
+Each case runs in its own subprocess against a fixed-seed fixture generated by
+data/synthetic_data.py, and reports wall time, peak RSS and throughput.
+Results are appended to benchmarks/history.json; `compare` flags regressions
+between two recorded runs.
+
+    python benchmarks/bench.py run --scales 1k 10k
+    python benchmarks/bench.py compare --threshold 0.1
+"""
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+BENCH_DIR = Path(__file__).resolve().parent
+FIXTURE_DIR = BENCH_DIR / "fixtures"
+HISTORY_FILE = BENCH_DIR / "history.json"
+
+SCALES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1M": 1_000_000}
+SEED = 42
+CASES_PER_EVENT = 50
+
+
+def _load(name: str, path: Path):
+    """Load a module by file path (the repo's scripts are not a package)."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, str(path))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def synthetic():
+    return _load("synthetic_data", ROOT / "data" / "synthetic_data.py")
+
+
+# ------------------------------------------------------
+# Fixtures
+# ------------------------------------------------------
+def fixture(scale: str, seed: int = SEED) -> Path:
+    """Return the fixture directory for a scale, generating it on first use."""
+    n = SCALES[scale]
+    path = FIXTURE_DIR / f"{scale}-seed{seed}"
+    manifest = path / "manifest.json"
+    if manifest.exists():
+        return path
+
+    path.mkdir(parents=True, exist_ok=True)
+    syn = synthetic()
+    systems = max(2, n // 2000)
+    count = syn.write_requirements_json(
+        path / "requirements.json", syn.generate_requirements(n, systems, seed)
+    )
+    n_events, n_issues = syn.write_events_json(
+        path / "test_events.json",
+        path / "test_issues.json",
+        syn.generate_events(max(1, n // CASES_PER_EVENT), CASES_PER_EVENT, seed),
+    )
+    with open(path / "test_events.json", "r", encoding="utf-8") as f:
+        n_cases = sum(len(e["cases"]) for e in json.load(f).values())
+
+    manifest.write_text(json.dumps({
+        "scale": scale,
+        "seed": seed,
+        "systems": systems,
+        "requirements": count,
+        "events": n_events,
+        "cases": n_cases,
+        "issues": n_issues,
+    }, indent=2))
+    return path
+
+
+# ------------------------------------------------------
+# Cases: each returns (callable to time, records processed)
+# ------------------------------------------------------
+def case_burndown(fx: Path, info: Dict[str, Any]) -> Tuple[Callable, int]:
+    fb = _load("fun_burndown", ROOT / "data" / "requirements" / "fun_burndown.py")
+    data = fb.load_data(fx / "requirements.json")
+    return lambda: fb.compute_burndown(data), info["requirements"]
+
+
+def case_load_requirements(fx: Path, info: Dict[str, Any]) -> Tuple[Callable, int]:
+    import pandas as pd
+
+    loader = _load("requirements_loader", ROOT / "src" / "Requirements" / "loader.py")
+
+    def run():
+        df = pd.DataFrame(loader.load_requirements(fx / "requirements.json"))
+        loader.filter_requirements(df, status="Open", priority="High", tag="security")
+
+    return run, info["requirements"]
+
+
+def case_load_snapshot(fx: Path, info: Dict[str, Any]) -> Tuple[Callable, int]:
+    # Same work as load_requirements, from the compiled snapshot (built once here)
+    snapshot = _load("requirements_snapshot", ROOT / "src" / "Requirements" / "snapshot.py")
+    loader = _load("requirements_loader", ROOT / "src" / "Requirements" / "loader.py")
+    snap_path = Path(tempfile.mkdtemp(prefix="bench-")) / "requirements.snap"
+    snapshot.build_snapshot(fx / "requirements.json", snap_path)
+
+    def run():
+        df = snapshot.load_snapshot(fx / "requirements.json", snap_path).requirements_frame()
+        loader.filter_requirements(df, status="Open", priority="High", tag="security")
+
+    return run, info["requirements"]
+
+
+def case_slip_analytics(fx: Path, info: Dict[str, Any]) -> Tuple[Callable, int]:
+    # Uncached: SlipAnalytics directly, not slip.analyze(), so every repeat recomputes
+    snapshot = _load("requirements_snapshot", ROOT / "src" / "Requirements" / "snapshot.py")
+    slip = _load("requirements_slip", ROOT / "src" / "Requirements" / "slip.py")
+    snap_path = Path(tempfile.mkdtemp(prefix="bench-")) / "requirements.snap"
+    snapshot.build_snapshot(fx / "requirements.json", snap_path)
+
+    def run():
+        analytics = slip.SlipAnalytics(snapshot.load_snapshot(fx / "requirements.json", snap_path))
+        analytics.by_priority()
+        analytics.by_tag()
+
+    return run, info["requirements"]
+
+
+def case_baseline_diff(fx: Path, info: Dict[str, Any]) -> Tuple[Callable, int]:
+    # New baseline: 1% of statuses flipped; both snapshots compiled up front
+    snapshot = _load("requirements_snapshot", ROOT / "src" / "Requirements" / "snapshot.py")
+    baseline_diff = _load("requirements_baseline_diff", ROOT / "src" / "Requirements" / "baseline_diff.py")
+    with open(fx / "requirements.json", "r", encoding="utf-8") as f:
+        data = json.load(f)
+    for item in data[::100]:
+        for values in item.values():
+            values["status"] = "Closed" if values.get("status") != "Closed" else "Open"
+    new_path = Path(tempfile.mkdtemp(prefix="bench-")) / "requirements.json"
+    with open(new_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    del data
+    snapshot.load_snapshot(fx / "requirements.json")
+    snapshot.load_snapshot(new_path)
+
+    def run():
+        # Uncached: every repeat hashes both baselines again
+        baseline_diff._cache.clear()
+        baseline_diff._diff_cache.clear()
+        baseline_diff.compare(fx / "requirements.json", new_path).summary()
+
+    return run, info["requirements"]
+
+
+def _persistence(tmp: Path):
+    persistence = _load("test_persistence", ROOT / "src" / "Test" / "persistence.py")
+    persistence.DATA_DIR = tmp
+    persistence.ISSUES_DIR = tmp / "issues"
+    persistence.EVENTS_FILE = tmp / "test_events.json"
+    persistence.ISSUES_FILE = tmp / "issues" / "test_issues.json"
+    return persistence
+
+
+def case_save_events(fx: Path, info: Dict[str, Any]) -> Tuple[Callable, int]:
+    persistence = _persistence(Path(tempfile.mkdtemp(prefix="bench-")))
+    with open(fx / "test_events.json", "r", encoding="utf-8") as f:
+        events = json.load(f)
+    return lambda: persistence.save_events(events), info["cases"]
+
+
+def case_load_events(fx: Path, info: Dict[str, Any]) -> Tuple[Callable, int]:
+    tmp = Path(tempfile.mkdtemp(prefix="bench-"))
+    persistence = _persistence(tmp)
+    shutil.copy(fx / "test_events.json", tmp / "test_events.json")
+    return persistence.load_events, info["cases"]
+
+
+def case_event_summaries(fx: Path, info: Dict[str, Any]) -> Tuple[Callable, int]:
+    # Test Dashboard read path: the counters sidecar, not the cases
+    persistence = _persistence(Path(tempfile.mkdtemp(prefix="bench-")))
+    with open(fx / "test_events.json", "r", encoding="utf-8") as f:
+        persistence.save_events(json.load(f))
+    return persistence.load_event_summaries, info["cases"]
+
+
+def case_sqlite_ingest(fx: Path, info: Dict[str, Any]) -> Tuple[Callable, int]:
+    syn = synthetic()
+    records = list(syn.generate_requirements(info["requirements"], info["systems"], info["seed"]))
+    tmp = Path(tempfile.mkdtemp(prefix="bench-"))
+
+    def run():
+        db = tmp / "bench.db"
+        if db.exists():
+            db.unlink()
+        syn.write_sqlite(db, info["systems"], iter(records))
+
+    return run, info["requirements"]
+
+
+def case_cold_start(fx: Path, info: Dict[str, Any]) -> Tuple[Callable, int]:
+    # A fresh interpreter per run, so every repeat is a true cold start. Everything
+    # it touches is a temp copy: persistence reads ./data, so run from the copy.
+    tmp = Path(tempfile.mkdtemp(prefix="bench-"))
+    (tmp / "data").mkdir()
+    shutil.copy(fx / "requirements.json", tmp / "requirements.json")
+    shutil.copy(fx / "test_events.json", tmp / "data" / "test_events.json")
+    db = ROOT / "data" / "systems_of_systems.db"
+    if db.exists():
+        shutil.copy(db, tmp / "data" / "systems_of_systems.db")
+    env = dict(
+        os.environ,
+        SYSENG_REQUIREMENTS_JSON=str(tmp / "requirements.json"),
+        SYSENG_DB_PATH=str(tmp / "data" / "systems_of_systems.db"),
+        SYSENG_JOBS_DIR=str(tmp / "data" / "jobs"),
+    )
+    cmd = [sys.executable, str(ROOT / "src" / "warmup.py")]
+    run = lambda: subprocess.run(cmd, env=env, cwd=tmp, capture_output=True, check=True)
+    # Compile the snapshot once, as the other snapshot cases do up front
+    run()
+    return run, info["requirements"]
+
+
+CASES: Dict[str, Callable[[Path, Dict[str, Any]], Tuple[Callable, int]]] = {
+    "burndown": case_burndown,
+    "load_requirements": case_load_requirements,
+    "load_snapshot": case_load_snapshot,
+    "slip_analytics": case_slip_analytics,
+    "baseline_diff": case_baseline_diff,
+    "save_events": case_save_events,
+    "load_events": case_load_events,
+    "event_summaries": case_event_summaries,
+    "sqlite_ingest": case_sqlite_ingest,
+    "cold_start": case_cold_start,
+}
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_case_inline(case: str, fx: Path, repeat: int) -> Dict[str, Any]:
+    """Set up and time one case in this process."""
+    info = json.loads((fx / "manifest.json").read_text())
+    fn, records = CASES[case](fx, info)
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    best = min(times)
+    return {
+        "wall_s": best,
+        "wall_median_s": statistics.median(times),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "records": records,
+        "throughput": records / best if best > 0 else None,
+    }
+
+
+def run_case(case: str, scale: str, repeat: int, timeout: float) -> Dict[str, Any]:
+    """Time one case in a fresh interpreter so peak RSS is per case."""
+    fx = fixture(scale)
+    result = {"case": case, "scale": scale}
+    try:
+        proc = subprocess.run(
+            [sys.executable, __file__, "_case", case, str(fx), "--repeat", str(repeat)],
+            capture_output=True, text=True, timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        result["error"] = f"timeout after {timeout:.0f}s"
+        return result
+    if proc.returncode != 0:
+        result["error"] = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "failed"
+        return result
+    result.update(json.loads(proc.stdout.strip().splitlines()[-1]))
+    return result
+
+
+# ------------------------------------------------------
+# History
+# ------------------------------------------------------
+def load_history() -> List[Dict[str, Any]]:
+    if not HISTORY_FILE.exists():
+        return []
+    with open(HISTORY_FILE, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_history(history: List[Dict[str, Any]]) -> None:
+    with open(HISTORY_FILE, "w", encoding="utf-8") as f:
+        json.dump(history, f, indent=2)
+
+
+def _commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def compare_runs(old: Dict[str, Any], new: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    """Pair results by (case, scale) and flag slowdowns beyond `threshold`."""
+    before = {(r["case"], r["scale"]): r for r in old["results"] if "wall_s" in r}
+    rows = []
+    for r in new["results"]:
+        key = (r["case"], r["scale"])
+        if key not in before or "wall_s" not in r:
+            continue
+        b = before[key]
+        ratio = r["wall_s"] / b["wall_s"] if b["wall_s"] else float("inf")
+        rss_ratio = r["peak_rss_mb"] / b["peak_rss_mb"] if b["peak_rss_mb"] else 1.0
+        rows.append({
+            "case": r["case"],
+            "scale": r["scale"],
+            "old_s": b["wall_s"],
+            "new_s": r["wall_s"],
+            "ratio": ratio,
+            "rss_ratio": rss_ratio,
+            "regression": ratio > 1 + threshold or rss_ratio > 1 + threshold,
+        })
+    return rows
+
+
+def _print_header() -> None:
+    print(f"{'case':<20} {'scale':>6} {'wall s':>10} {'peak MB':>9} {'records/s':>12}")
+
+
+def _print_results(results: List[Dict[str, Any]]) -> None:
+    for r in results:
+        if "error" in r:
+            print(f"{r['case']:<20} {r['scale']:>6} {r['error']}")
+            continue
+        tput = f"{r['throughput']:.0f}" if r["throughput"] else "-"
+        print(f"{r['case']:<20} {r['scale']:>6} {r['wall_s']:>10.4f} {r['peak_rss_mb']:>9.1f} {tput:>12}")
+
+
+def cmd_run(args) -> int:
+    results = []
+    _print_header()
+    for scale in args.scales:
+        for case in args.cases:
+            result = run_case(case, scale, args.repeat, args.timeout)
+            results.append(result)
+            _print_results([result])
+    history = load_history()
+    history.append({
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "label": args.label,
+        "results": results,
+    })
+    save_history(history)
+    print(f"Recorded run #{len(history) - 1} in {HISTORY_FILE}")
+    return 0
+
+
+def cmd_compare(args) -> int:
+    history = load_history()
+    if len(history) < 2:
+        print("Need at least two recorded runs to compare.")
+        return 0
+    old, new = history[args.baseline], history[args.candidate]
+    rows = compare_runs(old, new, args.threshold)
+    print(f"baseline {old['timestamp']} ({old['commit']}) -> candidate {new['timestamp']} ({new['commit']})")
+    print(f"{'case':<20} {'scale':>6} {'old s':>10} {'new s':>10} {'ratio':>7} {'rss':>6}")
+    for r in rows:
+        flag = "  REGRESSION" if r["regression"] else ""
+        print(
+            f"{r['case']:<20} {r['scale']:>6} {r['old_s']:>10.4f} {r['new_s']:>10.4f} "
+            f"{r['ratio']:>7.2f} {r['rss_ratio']:>6.2f}{flag}"
+        )
+    return 1 if any(r["regression"] for r in rows) else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Toolkit benchmark harness.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_run = sub.add_parser("run", help="Run benchmarks and append to the history file")
+    p_run.add_argument("--scales", nargs="+", choices=list(SCALES), default=["1k", "10k"])
+    p_run.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    p_run.add_argument("--repeat", type=int, default=3)
+    p_run.add_argument("--timeout", type=float, default=600.0, help="Per-case timeout in seconds")
+    p_run.add_argument("--label", default="", help="Free-form note stored with the run")
+
+    p_cmp = sub.add_parser("compare", help="Compare two recorded runs")
+    p_cmp.add_argument("--baseline", type=int, default=-2, help="History index of the baseline run")
+    p_cmp.add_argument("--candidate", type=int, default=-1, help="History index of the candidate run")
+    p_cmp.add_argument("--threshold", type=float, default=0.10, help="Allowed slowdown, e.g. 0.1 = 10%%")
+
+    p_case = sub.add_parser("_case", help=argparse.SUPPRESS)
+    p_case.add_argument("case", choices=list(CASES))
+    p_case.add_argument("fixture")
+    p_case.add_argument("--repeat", type=int, default=3)
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        return cmd_run(args)
+    if args.command == "compare":
+        return cmd_compare(args)
+    print(json.dumps(run_case_inline(args.case, Path(args.fixture), args.repeat)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
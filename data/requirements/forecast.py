@@ -0,0 +1,223 @@
+import argparse
+import importlib.util
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Completion forecast from burndown history.
+#
+# Each trial replays the future one day at a time, drawing that day's closures
+# from the program's own daily closure counts (bootstrap), until the remaining
+# work is burned down. All trials, days and programs are drawn as NumPy blocks;
+# there is no Python loop per trial.
+
+PERCENTILES = (50, 85, 95)
+DEFAULT_TRIALS = 10_000
+DEFAULT_HORIZON = 730  # days; later completions are reported as beyond the horizon
+BLOCK_DAYS = 16
+CHUNK_ELEMENTS = 1 << 20  # random draws held in memory at once
+
+
+# ------------------------------------------------------
+# 1. THROUGHPUT HISTORY (FROM fun_burndown SECTION 5)
+# ------------------------------------------------------
+def daily_throughput(daily_closures, end=None, window_days=None):
+    """Closures per calendar day, days without closures counted as zero.
+
+    daily_closures is the output of fun_burndown.daily_closure_counts(). The
+    history runs from the first closure to `end` (default: the last closure);
+    window_days keeps only the most recent days.
+    """
+    if daily_closures.empty:
+        return np.zeros(0, dtype=np.int64)
+    per_day = daily_closures.groupby("Closure Date")["count"].sum()
+    last = max(per_day.index.max(), pd.Timestamp(end)) if end is not None else per_day.index.max()
+    days = pd.date_range(per_day.index.min(), last, freq="D")
+    counts = per_day.reindex(days, fill_value=0).to_numpy(dtype=np.int64)
+    return counts[-window_days:] if window_days else counts
+
+
+def remaining_at_end(latest):
+    """Open work plus technical debt left at the end of the history.
+
+    Equal to the last row of build_burndown()'s total_remaining, without
+    building the day-by-day table.
+    """
+    return int((~latest["is_closed"]).sum())
+
+
+# ------------------------------------------------------
+# 2. MONTE CARLO SIMULATION
+# ------------------------------------------------------
+def simulate_completion_days(histories, remaining, trials=DEFAULT_TRIALS, horizon=DEFAULT_HORIZON, seed=None):
+    """Days until each trial of each program burns down its remaining work.
+
+    histories: one daily-throughput array per program; remaining: work left
+    per program. Returns a (programs, trials) float array; trials that do not
+    finish within `horizon` days are inf.
+    """
+    rng = np.random.default_rng(seed)
+    remaining = np.asarray(remaining, dtype=np.int64)
+    n_programs = len(histories)
+    result = np.full((n_programs, trials), np.inf)
+    result[remaining <= 0] = 0
+
+    # Programs that can finish: work left and at least one closure in history
+    lengths = np.array([len(h) for h in histories], dtype=np.int64)
+    totals = np.array([h.sum() if len(h) else 0 for h in histories], dtype=np.int64)
+    active = np.flatnonzero((remaining > 0) & (totals > 0))
+    if not len(active):
+        return result
+
+    # All histories side by side; program p samples from pool[offsets[p]:offsets[p] + lengths[p]]
+    pool = np.concatenate([histories[p] for p in active]).astype(np.int32)
+    offsets = np.concatenate([[0], np.cumsum(lengths[active])[:-1]]).astype(np.int32)
+
+    # One row per unfinished (program, trial); finished rows are dropped after
+    # every block, so the work follows the trials still running, not the slowest
+    rows_program = np.repeat(np.arange(len(active), dtype=np.int32), trials)
+    rows_trial = np.tile(np.arange(trials, dtype=np.int32), len(active))
+    burned = np.zeros(len(rows_program), dtype=np.int32)
+    target = remaining[active].astype(np.int32)
+    lengths = lengths[active].astype(np.float32)
+    days = result[active]
+    for day0 in range(0, horizon, BLOCK_DAYS):
+        width = min(BLOCK_DAYS, horizon - day0)
+        still_running = []
+        for lo in range(0, len(rows_program), max(1, CHUNK_ELEMENTS // width)):
+            program = rows_program[lo:lo + CHUNK_ELEMENTS // width]
+            draws = (rng.random((len(program), width), dtype=np.float32) * lengths[program, None]).astype(np.int32)
+            np.minimum(draws, (lengths[program, None] - 1).astype(np.int32), out=draws)  # float rounding at the top end
+            cumulative = np.cumsum(pool[draws + offsets[program, None]], axis=1, dtype=np.int32)
+            cumulative += burned[lo:lo + len(program), None]
+            hit = cumulative >= target[program, None]
+            finished = hit[:, -1]
+            trial = rows_trial[lo:lo + len(program)]
+            days[program[finished], trial[finished]] = day0 + 1 + hit[finished].argmax(axis=1)
+            burned[lo:lo + len(program)] = cumulative[:, -1]
+            still_running.append(~finished)
+        keep = np.concatenate(still_running)
+        rows_program, rows_trial, burned = rows_program[keep], rows_trial[keep], burned[keep]
+        if not len(rows_program):
+            break
+    result[active] = days
+    return result
+
+
+def completion_percentiles(days, percentiles=PERCENTILES):
+    """Per program, the day by which the given share of trials has finished."""
+    # inverted_cdf picks an actual trial outcome, so inf means "beyond the horizon"
+    return np.percentile(days, percentiles, axis=-1, method="inverted_cdf").T
+
+
+def forecast_fan(history, remaining, trials=DEFAULT_TRIALS, horizon=DEFAULT_HORIZON, percentiles=PERCENTILES, seed=None):
+    """Remaining work per future day at each percentile, for one program.
+
+    Returns a DataFrame with a `day` column (1 = first day after the history)
+    and one column per percentile, e.g. p85 = the remaining work that 85% of
+    trials are at or below on that day. Stops once every percentile hits zero.
+    """
+    columns = {"day": [], **{f"p{p}": [] for p in percentiles}}
+    if remaining > 0 and len(history) and history.sum() > 0:
+        rng = np.random.default_rng(seed)
+        burned = np.zeros(trials, dtype=np.int64)
+        for day0 in range(0, horizon, BLOCK_DAYS):
+            width = min(BLOCK_DAYS, horizon - day0)
+            draws = history[rng.integers(0, len(history), size=(trials, width))]
+            cumulative = burned[:, None] + np.cumsum(draws, axis=1)
+            left = np.maximum(remaining - cumulative, 0)
+            levels = np.percentile(left, percentiles, axis=0, method="inverted_cdf")
+            columns["day"].extend(range(day0 + 1, day0 + width + 1))
+            for p, level in zip(percentiles, levels):
+                columns[f"p{p}"].extend(level.tolist())
+            burned = cumulative[:, -1]
+            if levels[:, -1].max() == 0:
+                break
+    return pd.DataFrame(columns)
+
+
+# ------------------------------------------------------
+# 3. FORECAST FOR ONE BURNDOWN
+# ------------------------------------------------------
+def forecast(burndown_df, daily_closures, latest, trials=DEFAULT_TRIALS, horizon=DEFAULT_HORIZON, window_days=None, seed=None):
+    """P50/P85/P95 completion dates and the forecast fan for one program.
+
+    The forecast starts the day after the last date of the burndown. Returns a
+    dict with `start`, `remaining`, `completion` ({percentile: Timestamp or
+    None if beyond the horizon}) and `fan` (forecast_fan() with a `date`
+    column).
+    """
+    start = burndown_df["date"].max()
+    remaining = remaining_at_end(latest)
+    history = daily_throughput(daily_closures, end=start, window_days=window_days)
+    days = simulate_completion_days([history], [remaining], trials, horizon, seed)
+    completion = {
+        p: (start + pd.Timedelta(days=int(d)) if np.isfinite(d) else None)
+        for p, d in zip(PERCENTILES, completion_percentiles(days)[0])
+    }
+    fan = forecast_fan(history, remaining, trials, horizon, seed=seed)
+    fan.insert(0, "date", start + pd.to_timedelta(fan["day"], unit="D"))
+    return {"start": start, "remaining": remaining, "completion": completion, "fan": fan}
+
+
+# ------------------------------------------------------
+# 4. NIGHTLY BATCH: ONE FORECAST PER PROGRAM FILE
+# ------------------------------------------------------
+def _burndown_module():
+    if "fun_burndown" not in sys.modules:
+        spec = importlib.util.spec_from_file_location("fun_burndown", str(Path(__file__).parent / "fun_burndown.py"))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["fun_burndown"] = module
+        spec.loader.exec_module(module)
+    return sys.modules["fun_burndown"]
+
+
+def forecast_programs(paths, trials=DEFAULT_TRIALS, horizon=DEFAULT_HORIZON, window_days=None, seed=None):
+    """Completion percentiles for many requirement files in one simulation."""
+    burndown = _burndown_module()
+    histories, remaining, starts = [], [], []
+    for path in paths:
+        df = burndown.load_history(Path(path))
+        latest = burndown.latest_status(df)
+        start = df[["Replanned Date", "Closure Date"]].max().max()
+        histories.append(daily_throughput(burndown.daily_closure_counts(df, latest), end=start, window_days=window_days))
+        remaining.append(remaining_at_end(latest))
+        starts.append(start)
+    days = simulate_completion_days(histories, remaining, trials, horizon, seed)
+    results = []
+    for path, start, left, row in zip(paths, starts, remaining, completion_percentiles(days)):
+        results.append({
+            "program": str(path),
+            "as_of": start.strftime("%Y-%m-%d"),
+            "remaining": left,
+            **{
+                f"p{p}": (start + pd.Timedelta(days=int(d))).strftime("%Y-%m-%d") if np.isfinite(d) else None
+                for p, d in zip(PERCENTILES, row)
+            },
+        })
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Monte Carlo completion forecast per requirements file.")
+    parser.add_argument("paths", nargs="+", help="fun_requirements.json style files, one per program")
+    parser.add_argument("--trials", type=int, default=DEFAULT_TRIALS)
+    parser.add_argument("--horizon", type=int, default=DEFAULT_HORIZON, help="Days to simulate")
+    parser.add_argument("--window", type=int, default=None, help="Only sample the last N days of throughput")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--out", default=None, help="Write results as JSON here instead of printing")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    results = forecast_programs(args.paths, args.trials, args.horizon, args.window, args.seed)
+    if args.out:
+        Path(args.out).write_text(json.dumps(results, indent=2))
+    else:
+        for r in results:
+            print(f"{r['program']}: {r['remaining']} left as of {r['as_of']}; "
+                  + ", ".join(f"P{p} {r[f'p{p}'] or 'beyond horizon'}" for p in PERCENTILES))
+    print(f"{len(results)} programs x {args.trials} trials in {time.perf_counter() - t0:.2f}s", file=sys.stderr)
@@ -1,187 +1,304 @@
+import importlib.util
 import json
+import sys
+from pathlib import Path
+
 import pandas as pd
-import plotly.graph_objects as go
 
 
 # ------------------------------------------------------
 # 1. LOAD JSON FILE
 # ------------------------------------------------------
-json_file = "/home/myintsai/Documents/syseng-toolkit/data/requirements/fun_requirements.json"  # <-- set your file here
+json_file = Path(__file__).parent / "fun_requirements.json"  # <-- set your file here
 
-with open(json_file, "r") as f:
-    data = json.load(f)
 
+def load_data(path=json_file):
+    with open(path, "r") as f:
+        return json.load(f)
 
-# ------------------------------------------------------
-# 2. NORMALIZE JSON INTO A FLAT TABLE
-# ------------------------------------------------------
-rows = []
 
-for item in data:
-    for req_id, values in item.items():
-        base = {k: v for k, v in values.items() if k != "Closure Details"}
-        base["req_id"] = req_id
-        
-        for cd in values["Closure Details"]:
-            row = base.copy()
-            row.update(cd)
-            rows.append(row)
+def _requirements_module(name, filename):
+    if name not in sys.modules:
+        module_py = Path(__file__).resolve().parents[2] / "src" / "Requirements" / filename
+        spec = importlib.util.spec_from_file_location(name, str(module_py))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
 
-df = pd.DataFrame(rows)
 
-# Convert dates
-df["Baseline Date"] = pd.to_datetime(df["Baseline Date"])
-df["Replanned Date"] = pd.to_datetime(df["Replanned Date"])
-df["Closure Date"]  = pd.to_datetime(df["Closure Date"], errors="coerce")
+def load_history(path=json_file):
+    """Section 2's table straight from the compiled snapshot of `path`.
+
+    The snapshot (src/Requirements/snapshot.py) is rebuilt only when the JSON
+    changes, so repeated runs skip JSON parsing and flattening. A directory
+    is read as one corpus: every requirements file in it (see
+    src/Requirements/corpus.py), compiled in parallel.
+    """
+    if Path(path).is_dir():
+        corpus = _requirements_module("requirements_corpus", "corpus.py")
+        return corpus.history_frame(corpus.discover(Path(path)))
+    return _requirements_module("requirements_snapshot", "snapshot.py").load_snapshot(Path(path)).history_frame()
+
+
+# ------------------------------------------------------
+# 2. NORMALIZE JSON INTO A FLAT TABLE
+# ------------------------------------------------------
+DATE_KEYS = ["Baseline Date", "Replanned Date", "Closure Date"]
+
+
+def invalid_dates(path=json_file):
+    """Dates load_history() could not parse (NaT in its table): req_id, entry, field, value."""
+    snapshot = _requirements_module("requirements_snapshot", "snapshot.py")
+    if Path(path).is_dir():
+        paths = _requirements_module("requirements_corpus", "corpus.py").discover(Path(path))
+    else:
+        paths = [Path(path)]
+    return pd.concat([snapshot.load_snapshot(p).invalid_dates_frame() for p in paths], ignore_index=True)
+
+
+def flatten_history(data):
+    """Closure entries of already parsed JSON, in the layout of load_history().
+
+    load_history() reads the same table from the compiled snapshot and is
+    what the script, the burndown job and forecast.py use. Only the columns
+    sections 3-5 read are built; requirement attributes are not copied per
+    entry. Unparseable dates become NaT (see invalid_dates()).
+    """
+    req_ids, codes = [], []
+    dates = {key: [] for key in DATE_KEYS}
+    for item in data:
+        for req_id, values in item.items():
+            for cd in values["Closure Details"]:
+                req_ids.append(req_id)
+                codes.append(cd.get("Closure Code"))
+                for key in DATE_KEYS:
+                    dates[key].append(cd.get(key))
+    df = pd.DataFrame({"req_id": req_ids, "Closure Code": pd.Categorical(codes)})
+    for key in DATE_KEYS:
+        df[key] = pd.to_datetime(pd.Series(dates[key], dtype=object), errors="coerce")
+    return df
 
 
 # ------------------------------------------------------
 # 3. IDENTIFY LATEST STATUS PER REQUIREMENT
 # ------------------------------------------------------
-latest = df.sort_values("Replanned Date").groupby("req_id").tail(1)
+def latest_status(df):
+    latest = df.sort_values("Replanned Date").groupby("req_id").tail(1).copy()
 
-# Technical Debt = failed rows
-latest["is_tech_debt"] = latest["Closure Code"].eq("Failed")
+    # Technical Debt = failed rows
+    latest["is_tech_debt"] = latest["Closure Code"].eq("Failed")
 
-# Closed = closed with actual closure date
-latest["is_closed"] = latest["Closure Code"].eq("Closed") & latest["Closure Date"].notna()
+    # Closed = closed with actual closure date
+    latest["is_closed"] = latest["Closure Code"].eq("Closed") & latest["Closure Date"].notna()
+    return latest
 
 
 # ------------------------------------------------------
 # 4. BUILD BURNDOWN DATA: REMAINING WORK PER DAY
 # ------------------------------------------------------
-start_date = df["Baseline Date"].min()
-end_date   = df[["Replanned Date", "Closure Date"]].max().max()
-
-date_range = pd.date_range(start=start_date, end=end_date, freq="D")
-
-records = []
-
-for date in date_range:
-    remaining = 0
-    tech_debt = 0
-    
-    for _, row in latest.iterrows():
-        
-        # If closed before this date → not remaining
-        if row["is_closed"] and date >= row["Closure Date"]:
-            continue
-        
-        # If failed and replanned date passed → technical debt
-        if row["is_tech_debt"] and date >= row["Replanned Date"]:
-            tech_debt += 1
-        
-        else:
-            remaining += 1
-    
-    records.append({
-        "date": date,
-        "remaining_work": remaining,
-        "technical_debt": tech_debt,
-        "total_remaining": remaining + tech_debt
-    })
-
-burndown_df = pd.DataFrame(records)
+def build_burndown(df, latest):
+    start_date = df["Baseline Date"].min()
+    end_date   = df[["Replanned Date", "Closure Date"]].max().max()
+
+    date_range = pd.date_range(start=start_date, end=end_date, freq="D")
+
+    records = []
+
+    for date in date_range:
+        remaining = 0
+        tech_debt = 0
+
+        for _, row in latest.iterrows():
+
+            # If closed before this date → not remaining
+            if row["is_closed"] and date >= row["Closure Date"]:
+                continue
+
+            # If failed and replanned date passed → technical debt
+            if row["is_tech_debt"] and date >= row["Replanned Date"]:
+                tech_debt += 1
+
+            else:
+                remaining += 1
+
+        records.append({
+            "date": date,
+            "remaining_work": remaining,
+            "technical_debt": tech_debt,
+            "total_remaining": remaining + tech_debt
+        })
+
+    return pd.DataFrame(records)
 
 
 # ------------------------------------------------------
 # 5. DAILY CLOSURE EVENTS (NORMAL VS TECH DEBT)
 # ------------------------------------------------------
-closure_events = df[df["Closure Code"].eq("Closed") & df["Closure Date"].notna()].copy()
+def daily_closure_counts(df, latest):
+    closure_events = df[df["Closure Code"].eq("Closed") & df["Closure Date"].notna()].copy()
 
-closure_events = closure_events.merge(
-    latest[["req_id", "is_tech_debt"]],
-    on="req_id",
-    how="left"
-)
+    closure_events = closure_events.merge(
+        latest[["req_id", "is_tech_debt"]],
+        on="req_id",
+        how="left"
+    )
 
-daily_closures = (
-    closure_events
-    .groupby(["Closure Date", "is_tech_debt"])
-    .size()
-    .reset_index(name="count")
-)
+    return (
+        closure_events
+        .groupby(["Closure Date", "is_tech_debt"])
+        .size()
+        .reset_index(name="count")
+    )
 
 
-# ------------------------------------------------------
-# 6. UNIFIED CHART: BURNDOWN LINES + DAILY CLOSURE BARS
-# ------------------------------------------------------
-fig = go.Figure()
-
-# --- Bar: Normal closures ---
-fig.add_trace(go.Bar(
-    x=daily_closures[daily_closures["is_tech_debt"] == False]["Closure Date"],
-    y=daily_closures[daily_closures["is_tech_debt"] == False]["count"],
-    name="Closed (Normal)",
-    marker_color="steelblue",
-    opacity=0.7,
-    yaxis="y2"
-))
-
-# --- Bar: Technical Debt closures ---
-fig.add_trace(go.Bar(
-    x=daily_closures[daily_closures["is_tech_debt"] == True]["Closure Date"],
-    y=daily_closures[daily_closures["is_tech_debt"] == True]["count"],
-    name="Closed (Technical Debt)",
-    marker_color="orange",
-    opacity=0.7,
-    yaxis="y2"
-))
-
-# --- Line: Total remaining work ---
-fig.add_trace(go.Scatter(
-    x=burndown_df["date"],
-    y=burndown_df["total_remaining"],
-    mode="lines",
-    name="Total Remaining Work",
-    line=dict(width=3, color="firebrick")
-))
-
-# --- Line: Technical debt ---
-fig.add_trace(go.Scatter(
-    x=burndown_df["date"],
-    y=burndown_df["technical_debt"],
-    mode="lines",
-    name="Technical Debt",
-    line=dict(width=3, dash="dash", color="orange")
-))
-
-# --- Line: Remaining (excluding technical debt) ---
-fig.add_trace(go.Scatter(
-    x=burndown_df["date"],
-    y=burndown_df["remaining_work"],
-    mode="lines",
-    name="Remaining (Excl. Tech Debt)",
-    line=dict(width=2, dash="dot", color="steelblue")
-))
+def compute_burndown(data):
+    """Run sections 2-5; returns (df, latest, burndown_df, daily_closures)."""
+    return compute_burndown_from_history(flatten_history(data))
+
+
+def compute_burndown_from_history(df):
+    """Run sections 3-5 on an already flattened table (flatten_history or load_history)."""
+    latest = latest_status(df)
+    burndown_df = build_burndown(df, latest)
+    daily_closures = daily_closure_counts(df, latest)
+    return df, latest, burndown_df, daily_closures
 
 
 # ------------------------------------------------------
-# 7. LAYOUT
+# 6. UNIFIED CHART: BURNDOWN LINES + DAILY CLOSURE BARS
 # ------------------------------------------------------
-fig.update_layout(
-    title="Unified Burndown Chart with Daily Closure Bars",
-    xaxis=dict(title="Date"),
-    
-    # Left Y-axis (burndown lines)
-    yaxis=dict(
-        title="Remaining Work",
-        side="left",
-        rangemode="tozero"
-    ),
-    
-    # Right Y-axis (closure bars)
-    yaxis2=dict(
-        title="Daily Closures",
-        overlaying="y",
-        side="right",
-        showgrid=False,
-        rangemode="tozero"
-    ),
-    
-    barmode="stack",
-    template="plotly_white",
-    legend=dict(x=0.01, y=0.99)
-)
-
-fig.show()
+def build_figure(burndown_df, daily_closures, forecast=None):
+    """forecast: optional result of forecast.py's forecast(), drawn as a fan."""
+    # plotly is only needed for the chart, not for the numbers
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+
+    # --- Bar: Normal closures ---
+    fig.add_trace(go.Bar(
+        x=daily_closures[daily_closures["is_tech_debt"] == False]["Closure Date"],
+        y=daily_closures[daily_closures["is_tech_debt"] == False]["count"],
+        name="Closed (Normal)",
+        marker_color="steelblue",
+        opacity=0.7,
+        yaxis="y2"
+    ))
+
+    # --- Bar: Technical Debt closures ---
+    fig.add_trace(go.Bar(
+        x=daily_closures[daily_closures["is_tech_debt"] == True]["Closure Date"],
+        y=daily_closures[daily_closures["is_tech_debt"] == True]["count"],
+        name="Closed (Technical Debt)",
+        marker_color="orange",
+        opacity=0.7,
+        yaxis="y2"
+    ))
+
+    # --- Line: Total remaining work ---
+    fig.add_trace(go.Scatter(
+        x=burndown_df["date"],
+        y=burndown_df["total_remaining"],
+        mode="lines",
+        name="Total Remaining Work",
+        line=dict(width=3, color="firebrick")
+    ))
+
+    # --- Line: Technical debt ---
+    fig.add_trace(go.Scatter(
+        x=burndown_df["date"],
+        y=burndown_df["technical_debt"],
+        mode="lines",
+        name="Technical Debt",
+        line=dict(width=3, dash="dash", color="orange")
+    ))
+
+    # --- Line: Remaining (excluding technical debt) ---
+    fig.add_trace(go.Scatter(
+        x=burndown_df["date"],
+        y=burndown_df["remaining_work"],
+        mode="lines",
+        name="Remaining (Excl. Tech Debt)",
+        line=dict(width=2, dash="dot", color="steelblue")
+    ))
+
+    # --- Forecast fan: remaining work at P50 / P85 / P95 ---
+    if forecast is not None and not forecast["fan"].empty:
+        fan = forecast["fan"]
+        last = burndown_df.iloc[-1]
+        # Start the fan at the last actual point so the lines join up
+        dates = pd.concat([pd.Series([last["date"]]), fan["date"]], ignore_index=True)
+        for column, name, fill in (
+            ("p50", "Forecast P50", None),
+            ("p85", "Forecast P85", None),
+            ("p95", "Forecast P95", "tonexty"),
+        ):
+            fig.add_trace(go.Scatter(
+                x=dates,
+                y=[last["total_remaining"]] + fan[column].tolist(),
+                mode="lines",
+                name=name,
+                line=dict(width=1, dash="dot", color="firebrick"),
+                fill=fill,
+                fillcolor="rgba(178, 34, 34, 0.12)"
+            ))
+        for p, date in forecast["completion"].items():
+            if date is not None:
+                fig.add_vline(
+                    x=date.timestamp() * 1000,
+                    line=dict(width=1, dash="dot", color="gray"),
+                    annotation_text=f"P{p} {date:%Y-%m-%d}"
+                )
+
+    # ------------------------------------------------------
+    # 7. LAYOUT
+    # ------------------------------------------------------
+    fig.update_layout(
+        title="Unified Burndown Chart with Daily Closure Bars",
+        xaxis=dict(title="Date"),
+
+        # Left Y-axis (burndown lines)
+        yaxis=dict(
+            title="Remaining Work",
+            side="left",
+            rangemode="tozero"
+        ),
+
+        # Right Y-axis (closure bars)
+        yaxis2=dict(
+            title="Daily Closures",
+            overlaying="y",
+            side="right",
+            showgrid=False,
+            rangemode="tozero"
+        ),
+
+        barmode="stack",
+        template="plotly_white",
+        legend=dict(x=0.01, y=0.99)
+    )
+    return fig
+
+
+def load_forecast_module():
+    """data/requirements/forecast.py, loaded by path like load_history() does."""
+    if "burndown_forecast" not in sys.modules:
+        spec = importlib.util.spec_from_file_location("burndown_forecast", str(Path(__file__).parent / "forecast.py"))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["burndown_forecast"] = module
+        spec.loader.exec_module(module)
+    return sys.modules["burndown_forecast"]
+
+
+if __name__ == "__main__":
+    # One burndown over every requirements file next to this script
+    df, latest, burndown_df, daily_closures = compute_burndown_from_history(load_history(Path(__file__).parent))
+    invalid = invalid_dates(Path(__file__).parent)
+    if len(invalid):
+        print(f"{len(invalid)} dates are not YYYY-MM-DD dates and were treated as missing:")
+        print(invalid.to_string(index=False))
+    forecast = load_forecast_module().forecast(burndown_df, daily_closures, latest)
+    for p, date in forecast["completion"].items():
+        print(f"P{p} completion: {date:%Y-%m-%d}" if date is not None else f"P{p} completion: beyond horizon")
+    fig = build_figure(burndown_df, daily_closures, forecast)
+    fig.show()
@@ -1,13 +1,29 @@
+import os
 import sqlite3
+import importlib.util
+from pathlib import Path
 
-db_path = "/home/myintsai/Documents/syseng-toolkit/data/systems_of_systems.db"
+# Coverage summary schema lives with the Requirements pages that read it
+_cov_path = Path(__file__).parent.parent / "src" / "Requirements" / "coverage.py"
+spec = importlib.util.spec_from_file_location("requirements_coverage", str(_cov_path))
+coverage = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(coverage)
+
+# JSON sync columns and watermark tables
+_sync_path = Path(__file__).parent.parent / "src" / "Requirements" / "sync.py"
+spec = importlib.util.spec_from_file_location("requirements_sync", str(_sync_path))
+sync = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(sync)
+
+# SYSENG_DB_PATH overrides the database shipped next to this script
+db_path = os.environ.get("SYSENG_DB_PATH", str(Path(__file__).parent / "systems_of_systems.db"))
 conn = sqlite3.connect(db_path)
 cur = conn.cursor()
 
 # --------------------------
 # Drop existing tables
 # --------------------------
-tables = [
+tables = coverage.COVERAGE_TABLES + sync.SYNC_TABLES + [
     "requirement_verification",
     "verification_method",
     "requirement",
@@ -79,6 +95,17 @@ cur.executemany(
     [(m,) for m in methods]
 )
 
+# --------------------------
+# Verification coverage summary (trigger-maintained)
+# --------------------------
+conn.commit()
+coverage.ensure_coverage(conn)
+
+# --------------------------
+# JSON sync columns and watermark
+# --------------------------
+sync.ensure_sync_schema(conn)
+
 conn.commit()
 conn.close()
 
@@ -1,6 +1,9 @@
+import os
 import sqlite3
+from pathlib import Path
 
-db = "/home/myintsai/Documents/syseng-toolkit/data/systems_of_systems.db"
+# SYSENG_DB_PATH overrides the database shipped next to this script
+db = os.environ.get("SYSENG_DB_PATH", str(Path(__file__).parent / "systems_of_systems.db"))
 conn = sqlite3.connect(db)
 cur = conn.cursor()
 
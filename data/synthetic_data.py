@@ -0,0 +1,379 @@
+"""Deterministic synthetic data for load testing.
+
+Produces requirements in the fun_requirements.json layout (with multi-entry
+Closure Details histories), the same requirements in the SQLite store with a
+system/functional hierarchy and verification links, and test events/issues in
+the layout used by RunTest.py. Everything is streamed, so output size is
+bounded by disk rather than memory.
+
+    python data/synthetic_data.py --requirements 100000 --events 200 --out /tmp/synth
+"""
+import argparse
+import importlib.util
+import json
+import os
+import random
+import runpy
+import sqlite3
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+DATA_DIR = Path(__file__).resolve().parent
+SRC_DIR = DATA_DIR.parent / "src"
+
+# Record hashes come from the sync engine so a generated store is already in sync
+_sync_path = SRC_DIR / "Requirements" / "sync.py"
+spec = importlib.util.spec_from_file_location("requirements_sync", str(_sync_path))
+sync = importlib.util.module_from_spec(spec)
+sys.modules["requirements_sync"] = sync
+spec.loader.exec_module(sync)
+
+PRIORITIES = ["High", "Medium", "Low"]
+OWNERS = ["Alice", "Bob", "Carol", "Charlie", "Dave", "Eve", "Frank", "Grace", "Heidi", "Ivan"]
+TAGS = [
+    "authentication", "user management", "profile", "security", "performance",
+    "storage", "navigation", "telemetry", "power", "thermal", "optics",
+    "communications", "software", "hardware", "safety", "interface",
+]
+SUBJECTS = [
+    "The system", "The spacecraft", "The vehicle", "The ground station",
+    "The payload", "The flight software", "The storage subsystem", "The radio",
+    "The navigation stack", "The power subsystem", "The user interface",
+]
+VERBS = [
+    "provide", "support", "maintain", "detect", "transmit", "store", "allow",
+    "log", "encrypt", "report", "recover from", "operate with",
+]
+OBJECTS = [
+    "telemetry at 1 Hz", "at least 1TB of imagery data", "obstacles at 50 meters",
+    "user credentials", "a downlink rate of 50 Mbps", "focus across ±10°C",
+    "localization within ±0.1m", "two-factor authentication", "fault events",
+    "power draw below 200 W", "a password recovery option", "audit records",
+]
+QUALIFIERS = [
+    "", " during nominal operations", " under degraded conditions",
+    " within 200 ms", " for the full mission lifetime", " without operator input",
+    " in accordance with the interface control document",
+]
+CASE_STATUSES = ["Not Started", "In Progress", "Completed", "Failed"]
+ISSUE_STATUSES = ["Open", "In Progress", "Resolved", "Closed"]
+SEVERITIES = ["Critical", "High", "Medium", "Low"]
+
+START = date(2024, 1, 1)
+
+
+def _key(prefix: str, i: int, count: int) -> str:
+    return f"{prefix}-{i:0{max(4, len(str(count)))}d}"
+
+
+def _description(rng: random.Random) -> str:
+    text = (
+        f"{rng.choice(SUBJECTS)} shall {rng.choice(VERBS)} "
+        f"{rng.choice(OBJECTS)}{rng.choice(QUALIFIERS)}."
+    )
+    # A minority of requirements carry long rationale text
+    if rng.random() < 0.1:
+        text += " Rationale: " + " ".join(
+            rng.choice(OBJECTS) for _ in range(rng.randint(5, 20))
+        ) + "."
+    return text
+
+
+def _closure_details(rng: random.Random) -> Tuple[List[Dict[str, str]], str]:
+    """Closure history of 1-5 entries: replans and failures, then a final state."""
+    baseline = START + timedelta(days=rng.randint(0, 720))
+    entries = []
+    n = 1 + min(4, int(rng.expovariate(1.2)))
+    for k in range(n):
+        replanned = baseline + timedelta(days=rng.randint(7, 60))
+        last = k == n - 1
+        if not last:
+            code = "Failed" if rng.random() < 0.4 else "Open"
+            closure_date = ""
+            comment = "Replanned after failed verification." if code == "Failed" else "Replanned."
+        else:
+            r = rng.random()
+            if r < 0.55:
+                code = "Closed"
+                closure_date = (replanned + timedelta(days=rng.randint(-20, 30))).isoformat()
+                comment = "Requirement implemented and tested successfully."
+            elif r < 0.75:
+                code = "In Progress"
+                closure_date = ""
+                comment = "Development is ongoing."
+            elif r < 0.9:
+                code = "Open"
+                closure_date = ""
+                comment = "Requirement is planned for future development."
+            else:
+                code = "Failed"
+                closure_date = ""
+                comment = "Requirement failed verification."
+        entries.append({
+            "Baseline Date": baseline.isoformat(),
+            "Replanned Date": replanned.isoformat(),
+            "Closure Code": code,
+            "Closure Date": closure_date,
+            "Closure Comments": comment,
+        })
+        baseline = replanned + timedelta(days=rng.randint(1, 14))
+    return entries, code
+
+
+def generate_requirements(
+    count: int, systems: int = 5, seed: int = 0
+) -> Iterator[Tuple[str, Dict[str, Any], Dict[str, Any]]]:
+    """Yield (req_id, values, meta) for `count` requirements.
+
+    `values` matches a fun_requirements.json record. `meta` carries the SQLite
+    placement: 1-based row id, system, level, parent row id, owner and the
+    verification method indexes (0-2) linked to it.
+    """
+    rng = random.Random(f"requirements-{seed}")
+    system_level: Dict[int, List[int]] = {s: [] for s in range(1, systems + 1)}
+    recent: List[str] = []
+
+    for i in range(1, count + 1):
+        system_id = rng.randint(1, systems)
+        parents = system_level[system_id]
+        if not parents or rng.random() < 0.2:
+            level, parent_id = "system", None
+            parents.append(i)
+        else:
+            level = "functional"
+            parent_id = parents[-1 - min(len(parents) - 1, int(rng.expovariate(0.5)))]
+
+        # About 2% are near-copies of a recent requirement
+        if recent and rng.random() < 0.02:
+            description = rng.choice(recent).replace(" shall ", " shall also ", 1)
+        else:
+            description = _description(rng)
+        recent.append(description)
+        if len(recent) > 100:
+            recent.pop(0)
+
+        history, final_code = _closure_details(rng)
+        status = {"Closed": "Closed", "Failed": "Failed", "In Progress": "In Progress"}.get(final_code, "Open")
+        values = {
+            "name": f"Requirement {i}",
+            "description": description,
+            "priority": rng.choice(PRIORITIES),
+            "status": status,
+            "tags": rng.sample(TAGS, rng.randint(1, 3)),
+            "Closure Details": history,
+        }
+
+        methods = [] if rng.random() < 0.1 else rng.sample(range(3), rng.randint(1, 3))
+        meta = {
+            "row_id": i,
+            "system_id": system_id,
+            "level": level,
+            "parent_id": parent_id,
+            "owner": rng.choice(OWNERS),
+            "methods": methods,
+        }
+        yield _key("FUN", i, count), values, meta
+
+
+def generate_events(
+    count: int, cases_per_event: int = 50, seed: int = 0
+) -> Iterator[Tuple[str, Dict[str, Any], List[Dict[str, Any]]]]:
+    """Yield (event_id, event, issues) in the RunTest.py session-state layout."""
+    rng = random.Random(f"events-{seed}")
+    case_no = 0
+    issue_no = 0
+    total_cases = count * cases_per_event
+
+    for e in range(1, count + 1):
+        event_id = _key("EVT", e, count)
+        cases = {}
+        issues = []
+        for _ in range(rng.randint(max(1, cases_per_event // 2), cases_per_event * 3 // 2)):
+            case_no += 1
+            test_id = _key("TEST", case_no, total_cases)
+            status = rng.choices(CASE_STATUSES, weights=[3, 2, 4, 1])[0]
+            issue_found = status == "Failed" or rng.random() < 0.05
+            steps = {}
+            n_steps = rng.randint(2, 6)
+            done = n_steps if status == "Completed" else rng.randint(0, n_steps)
+            for s in range(1, n_steps + 1):
+                steps[f"S{s}"] = {
+                    "description": f"Step {s}: {rng.choice(VERBS)} {rng.choice(OBJECTS)}",
+                    "completed": s <= done,
+                }
+            cases[test_id] = {
+                "name": f"Test case {case_no}",
+                "description": f"Verify that {_description(rng)[:-1].lower()}",
+                "expected_result": f"{rng.choice(SUBJECTS)} meets the requirement",
+                "completed": status == "Completed",
+                "status": status,
+                "issue_found": issue_found,
+                "issue_description": "Observed deviation from expected result." if issue_found else "",
+                "notes": "",
+                "steps": steps,
+            }
+            if issue_found:
+                issue_no += 1
+                issues.append({
+                    "issue_id": f"ISS-{issue_no:04d}",
+                    "event_id": event_id,
+                    "test_id": test_id,
+                    "test_name": cases[test_id]["name"],
+                    "title": f"Issue from {test_id}: {cases[test_id]['name']}",
+                    "description": cases[test_id]["issue_description"],
+                    "severity": rng.choices(SEVERITIES, weights=[1, 3, 4, 2])[0],
+                    "status": rng.choices(ISSUE_STATUSES, weights=[4, 2, 2, 3])[0],
+                    "created_date": (
+                        f"{(START + timedelta(days=rng.randint(0, 720))).isoformat()} "
+                        f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:00"
+                    ),
+                    "assigned_to": rng.choice(OWNERS + [""]),
+                })
+        events = {
+            "name": f"Test Event {e}",
+            "description": f"Synthetic test event {e}",
+            "cases": cases,
+        }
+        yield event_id, events, issues
+
+
+# ------------------------------------------------------
+# Writers
+# ------------------------------------------------------
+def write_requirements_json(path: Path, records: Iterator[Tuple[str, Dict[str, Any], Dict[str, Any]]]) -> int:
+    """Stream records to a fun_requirements.json-style file; returns the count."""
+    n = 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[\n")
+        for req_id, values, _ in records:
+            if n:
+                f.write(",\n")
+            f.write(json.dumps({req_id: values}, ensure_ascii=False))
+            n += 1
+        f.write("\n]\n")
+    return n
+
+
+def write_events_json(events_path: Path, issues_path: Path, events: Iterator) -> Tuple[int, int]:
+    """Stream events and their issues to the persistence.py JSON files."""
+    n_events = n_issues = 0
+    with open(events_path, "w", encoding="utf-8") as ef, open(issues_path, "w", encoding="utf-8") as issf:
+        ef.write("{\n")
+        issf.write("[\n")
+        for event_id, event, issues in events:
+            if n_events:
+                ef.write(",\n")
+            ef.write(f"{json.dumps(event_id)}: {json.dumps(event, ensure_ascii=False)}")
+            n_events += 1
+            for issue in issues:
+                if n_issues:
+                    issf.write(",\n")
+                issf.write(json.dumps(issue, ensure_ascii=False))
+                n_issues += 1
+        ef.write("\n}\n")
+        issf.write("\n]\n")
+    return n_events, n_issues
+
+
+def create_database(path: Path) -> None:
+    """Create an empty store by running the ETL script against `path`."""
+    previous = os.environ.get("SYSENG_DB_PATH")
+    os.environ["SYSENG_DB_PATH"] = str(path)
+    try:
+        runpy.run_path(str(DATA_DIR / "sqlite-etl.py"), run_name="__main__")
+    finally:
+        if previous is None:
+            del os.environ["SYSENG_DB_PATH"]
+        else:
+            os.environ["SYSENG_DB_PATH"] = previous
+
+
+def write_sqlite(
+    path: Path,
+    systems: int,
+    records: Iterator[Tuple[str, Dict[str, Any], Dict[str, Any]]],
+    chunk_size: int = 10000,
+) -> int:
+    """Stream records into a freshly created requirement store."""
+    create_database(path)
+    conn = sqlite3.connect(str(path))
+    method_ids = [mid for (mid,) in conn.execute("SELECT id FROM verification_method ORDER BY id")]
+
+    columns = list(sync.record_to_row("", {}).keys())
+    insert_req = (
+        f"INSERT INTO requirement(id, system_id, parent_requirement_id, level, owner, {', '.join(columns)}) "
+        f"VALUES (:row_id, :system_id, :parent_id, :level, :owner, {', '.join(':' + c for c in columns)})"
+    )
+
+    n = 0
+    with conn:
+        conn.executemany(
+            "INSERT INTO system(id, name) VALUES (?, ?)",
+            [(s, f"System {s}") for s in range(1, systems + 1)],
+        )
+        reqs, links, hashes = [], [], []
+
+        def flush():
+            conn.executemany(insert_req, reqs)
+            conn.executemany(
+                "INSERT INTO requirement_verification(requirement_id, verification_method_id) VALUES (?, ?)",
+                links,
+            )
+            conn.executemany(
+                "INSERT INTO requirement_sync(req_key, requirement_id, content_hash) VALUES (?, ?, ?)",
+                hashes,
+            )
+            reqs.clear()
+            links.clear()
+            hashes.clear()
+
+        for req_id, values, meta in records:
+            row = sync.record_to_row(req_id, values)
+            row.update(meta)
+            reqs.append(row)
+            links.extend((meta["row_id"], method_ids[m]) for m in meta["methods"])
+            hashes.append((req_id, meta["row_id"], sync.record_hash(req_id, values)))
+            n += 1
+            if len(reqs) >= chunk_size:
+                flush()
+        flush()
+    conn.close()
+    return n
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate seeded synthetic toolkit data.")
+    parser.add_argument("--out", default="synthetic", help="Output directory")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--systems", type=int, default=5)
+    parser.add_argument("--requirements", type=int, default=1000)
+    parser.add_argument("--events", type=int, default=10)
+    parser.add_argument("--cases-per-event", type=int, default=50)
+    parser.add_argument("--no-sqlite", action="store_true", help="Skip the SQLite store")
+    args = parser.parse_args()
+
+    out = Path(args.out)
+    out.mkdir(parents=True, exist_ok=True)
+
+    n = write_requirements_json(
+        out / "requirements.json",
+        generate_requirements(args.requirements, args.systems, args.seed),
+    )
+    print(f"Wrote {n} requirements to {out / 'requirements.json'}")
+
+    if not args.no_sqlite:
+        write_sqlite(
+            out / "systems_of_systems.db",
+            args.systems,
+            generate_requirements(args.requirements, args.systems, args.seed),
+        )
+        print(f"Wrote {n} requirements to {out / 'systems_of_systems.db'}")
+
+    n_events, n_issues = write_events_json(
+        out / "test_events.json",
+        out / "test_issues.json",
+        generate_events(args.events, args.cases_per_event, args.seed),
+    )
+    print(f"Wrote {n_events} events and {n_issues} issues to {out}")
@@ -0,0 +1,200 @@
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import streamlit as st
+
+# Database location: SYSENG_DB_PATH overrides the copy shipped under data/
+DEFAULT_DB = Path(__file__).resolve().parents[2] / "data" / "systems_of_systems.db"
+DB_PATH = Path(os.environ.get("SYSENG_DB_PATH", DEFAULT_DB))
+
+DEFAULT_TTL = 60.0
+# Idle readers kept for the next thread; Streamlit runs each rerun on a new one
+MAX_IDLE_READERS = 4
+
+# Named queries shared by the pages. sqlite3 keeps prepared statements per
+# connection, so reusing the same SQL text on a long-lived reader skips the
+# parse/plan step on every rerun.
+QUERIES: Dict[str, str] = {
+    "systems": "SELECT id, name FROM system ORDER BY id",
+    "verification_methods": "SELECT id, name FROM verification_method ORDER BY id",
+    "requirements": (
+        "SELECT id, system_id, parent_requirement_id, level, description, owner, "
+        "planned_closure_date, actual_closure_date FROM requirement ORDER BY id"
+    ),
+    "requirements_by_system": (
+        "SELECT id, parent_requirement_id, level, description, owner, "
+        "planned_closure_date, actual_closure_date FROM requirement "
+        "WHERE system_id = ? ORDER BY id"
+    ),
+    "requirement_links": (
+        "SELECT requirement_id, verification_method_id FROM requirement_verification"
+    ),
+}
+
+
+def register_query(name: str, sql: str) -> None:
+    """Add or replace a named query."""
+    QUERIES[name] = sql
+
+
+class _Reader:
+    """A pooled read-only connection and the data_version it last saw."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.data_version: Optional[int] = None
+
+
+class _Lease:
+    # Held in the thread's local storage; when the thread ends it is dropped
+    # and a weakref.finalize hands the reader back to the pool
+    def __init__(self, reader: _Reader):
+        self.reader = reader
+
+
+class Database:
+    """Shared access to one SQLite file.
+
+    Readers are read-only URI connections in a small lock-guarded pool. A
+    thread leases one on first use and keeps it until the thread ends, when
+    it goes back to the pool for the next thread, prepared statements and
+    page cache intact. All writes go through a single connection behind a
+    lock, and every committed write invalidates the query cache. Commits
+    made by other processes are picked up through PRAGMA data_version.
+    """
+
+    def __init__(self, path: Path = DB_PATH, read_only: bool = False, ttl: float = DEFAULT_TTL):
+        self.path = Path(path)
+        self.read_only = read_only
+        self.ttl = ttl
+        self._local = threading.local()
+        self._idle: List[_Reader] = []
+        self._pool_lock = threading.Lock()
+        self._closed = False
+        self._write_lock = threading.Lock()
+        self._writer: Optional[sqlite3.Connection] = None
+        self._cache: Dict[Tuple, Tuple[float, int, Any]] = {}
+        self._cache_lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------
+    # Connections
+    # ------------------------------
+    def _checkout(self) -> _Reader:
+        with self._pool_lock:
+            if self._idle:
+                return self._idle.pop()
+        uri = self.path.resolve().as_uri() + "?mode=ro"
+        # Used by one thread at a time, but not always the one that opened it
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False, cached_statements=256)
+        conn.execute("PRAGMA busy_timeout = 5000")
+        return _Reader(conn)
+
+    def _release(self, reader: _Reader) -> None:
+        with self._pool_lock:
+            if not self._closed and len(self._idle) < MAX_IDLE_READERS:
+                self._idle.append(reader)
+                return
+        reader.conn.close()
+
+    def _leased(self) -> _Reader:
+        lease = getattr(self._local, "lease", None)
+        if lease is None:
+            lease = _Lease(self._checkout())
+            weakref.finalize(lease, self._release, lease.reader)
+            self._local.lease = lease
+        return lease.reader
+
+    def reader(self) -> sqlite3.Connection:
+        """Return this thread's read-only connection, leased from the pool on first use."""
+        return self._leased().conn
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """Serialized write transaction; commits on exit and invalidates the cache."""
+        if self.read_only:
+            raise PermissionError(f"{self.path} is opened read-only")
+        with self._write_lock:
+            if self._writer is None:
+                self._writer = sqlite3.connect(
+                    str(self.path), check_same_thread=False, cached_statements=256
+                )
+                self._writer.execute("PRAGMA busy_timeout = 5000")
+            try:
+                with self._writer:
+                    yield self._writer
+            finally:
+                self.invalidate()
+
+    def close(self) -> None:
+        """Close the idle readers and the writer; leased readers close when their thread ends."""
+        with self._pool_lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for reader in idle:
+            reader.conn.close()
+        with self._write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+    # ------------------------------
+    # Cached reads
+    # ------------------------------
+    def invalidate(self) -> None:
+        with self._cache_lock:
+            self._generation += 1
+            self._cache.clear()
+
+    def _check_external_writes(self, reader: _Reader) -> None:
+        # data_version is per connection and cannot be compared across readers.
+        # A reader seeing its first version cannot tell what the cached values
+        # were read at, so it clears the cache too.
+        version = reader.conn.execute("PRAGMA data_version").fetchone()[0]
+        if version != reader.data_version:
+            if reader.data_version is not None or self._cache:
+                self.invalidate()
+            reader.data_version = version
+
+    def cached(self, key: Tuple, fn: Callable[[sqlite3.Connection], Any], ttl: Optional[float] = None) -> Any:
+        """Run fn(reader) once per key until the TTL expires or a write happens."""
+        reader = self._leased()
+        conn = reader.conn
+        self._check_external_writes(reader)
+        ttl = self.ttl if ttl is None else ttl
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[1] == self._generation and now - entry[0] < ttl:
+                self.hits += 1
+                return entry[2]
+            generation = self._generation
+            self.misses += 1
+        value = fn(conn)
+        with self._cache_lock:
+            if generation == self._generation:
+                self._cache[key] = (now, generation, value)
+        return value
+
+    def query(self, name: str, params: Tuple = (), ttl: Optional[float] = None) -> List[Tuple]:
+        """Run a named query through the cache."""
+        sql = QUERIES[name]
+        return self.cached(
+            ("query", name, tuple(params)),
+            lambda conn: conn.execute(sql, params).fetchall(),
+            ttl,
+        )
+
+
+@st.cache_resource
+def get_database(path: Optional[str] = None, read_only: bool = False) -> Database:
+    """Process-wide Database shared by every session and rerun."""
+    return Database(Path(path) if path else DB_PATH, read_only=read_only)
@@ -0,0 +1,109 @@
+import streamlit as st
+from pathlib import Path
+import importlib.util
+import sys
+
+
+# Load shared modules by file path to avoid package import issues; reuse across reruns
+def _load_module(name, path):
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, str(path))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+instrumentation = _load_module("instrumentation", Path(__file__).parent.parent / "instrumentation.py")
+warmup = _load_module("warmup", Path(__file__).parent.parent / "warmup.py")
+
+st.title("Diagnostics")
+st.caption("Per-rerun timings for this session. Navigate to a page to record its reruns.")
+
+# Opt-in instrumentation for this session
+if instrumentation.enabled_by_env():
+    st.info(f"Instrumentation is enabled for all sessions ({instrumentation.ENV_FLAG}=1).")
+else:
+    # Widget state is dropped when another page runs, so keep the flag under its own key
+    st.session_state["diagnostics_enabled"] = st.toggle(
+        "Record reruns in this session",
+        value=st.session_state.get("diagnostics_enabled", False)
+    )
+
+runs = st.session_state.get("diagnostics_runs", [])
+
+# ============== RECENT RERUNS ==============
+st.subheader("Recent Reruns")
+if not runs:
+    st.info("No reruns recorded yet.")
+else:
+    import pandas as pd
+
+    rows = []
+    for run in reversed(runs):
+        row = {
+            "Time": run["started"],
+            "Page": run["page"],
+            "Wall (ms)": round(run["wall_s"] * 1000, 1),
+            "Widgets": run["widgets"],
+            "Cache Hits": sum(run["cache_hits"].values()),
+            "Cache Misses": sum(run["cache_misses"].values()),
+            "Bytes Read": sum(run["bytes_read"].values()),
+        }
+        for name, seconds in run["sections"].items():
+            row[f"{name} (ms)"] = round(seconds * 1000, 1)
+        rows.append(row)
+    st.dataframe(pd.DataFrame(rows), width='stretch', hide_index=True)
+
+    latest = runs[-1]
+    with st.expander(f"Details of last rerun ({latest['page']})", expanded=False):
+        col1, col2 = st.columns(2)
+        with col1:
+            st.write("**Cache hits:**", latest["cache_hits"] or "none")
+            st.write("**Cache misses:**", latest["cache_misses"] or "none")
+        with col2:
+            st.write("**Files read:**", latest["bytes_read"] or "none")
+
+    if st.button("Clear recorded reruns"):
+        st.session_state["diagnostics_runs"] = []
+        st.rerun()
+
+st.divider()
+
+# ============== PROFILING ==============
+st.subheader("Profile a Rerun")
+st.write("Captures the next rerun of this session with cProfile.")
+if st.button("Profile next rerun"):
+    instrumentation.request_profile()
+    st.success("The next page rerun in this session will be profiled.")
+
+profile = st.session_state.get("diagnostics_profile")
+if profile:
+    st.write(f"**Last capture:** {profile['page']} at {profile['captured']}")
+    st.download_button(
+        label="Download .prof",
+        data=profile["data"],
+        file_name=f"rerun_{profile['captured'].replace(' ', '_').replace(':', '')}.prof",
+        mime="application/octet-stream"
+    )
+    with st.expander("Top functions by cumulative time", expanded=False):
+        st.code(profile["summary"])
+
+st.divider()
+
+# ============== STARTUP ==============
+st.subheader("Startup")
+timings = warmup.timings()
+col1, col2 = st.columns(2)
+with col1:
+    st.write("**Pre-warm**")
+    st.json({
+        name: round(t["seconds"], 4)
+        for section in ("imports", "prewarm")
+        for name, t in timings[section].items()
+    })
+with col2:
+    st.write("**Page runs (cold / last, seconds)**")
+    st.json({
+        title: [round(p["cold_seconds"], 4), round(p["last_seconds"], 4)]
+        for title, p in timings["pages"].items()
+    })
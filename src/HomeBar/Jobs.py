@@ -0,0 +1,114 @@
+import streamlit as st
+from pathlib import Path
+import importlib.util
+import sys
+
+
+# Load shared modules by file path to avoid package import issues; reuse across reruns
+def _load_module(name, path):
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, str(path))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+jobs = _load_module("jobs", Path(__file__).parent.parent / "jobs.py")
+job_handlers = _load_module("job_handlers", Path(__file__).parent.parent / "job_handlers.py")
+db = _load_module("data_db", Path(__file__).parent.parent / "Data" / "db.py")
+
+job_queue = jobs.get_queue()
+
+st.title("Background Jobs")
+st.caption("Long-running work runs here in the background. Identical requests share one job and its result.")
+
+# ============== SUBMIT ==============
+st.subheader("Start a Job")
+col1, col2, col3, col4 = st.columns(4)
+with col1:
+    st.write("**Burndown Report**")
+    burndown_path = st.text_input(
+        "Requirements JSON",
+        value=str(job_handlers.BURNDOWN_SCRIPT.parent / "fun_requirements.json"),
+        key="jobs_burndown_path"
+    )
+    if st.button("Build Burndown Report"):
+        job_id = job_queue.submit("burndown_report", {"path": burndown_path}, label="Burndown report")
+        st.success(f"Job #{job_id} submitted")
+with col2:
+    st.write("**Requirements Sync**")
+    sync_path = st.text_input(
+        "Requirements JSON",
+        value=str(job_handlers.BURNDOWN_SCRIPT.parent / "fun_requirements.json"),
+        key="jobs_sync_path"
+    )
+    if st.button("Sync into Database"):
+        job_id = job_queue.submit(
+            "requirements_sync",
+            {"json_path": sync_path, "db_path": str(db.DB_PATH)},
+            label="Requirements sync"
+        )
+        st.success(f"Job #{job_id} submitted")
+with col3:
+    st.write("**Corpus Validation**")
+    validation_path = st.text_input(
+        "Requirements JSON",
+        value=str(job_handlers.BURNDOWN_SCRIPT.parent / "fun_requirements.json"),
+        key="jobs_validation_path"
+    )
+    if st.button("Validate Requirements"):
+        job_id = job_queue.submit(
+            "requirements_validation",
+            {"json_path": validation_path, "db_path": str(db.DB_PATH)},
+            label="Requirements validation"
+        )
+        st.success(f"Job #{job_id} submitted")
+with col4:
+    st.write("**Duplicate Report**")
+    duplicate_threshold = st.slider("Minimum similarity", 0.5, 1.0, 0.8, 0.05, key="jobs_duplicate_threshold")
+    if st.button("Find Near-Duplicates"):
+        job_id = job_queue.submit(
+            "duplicate_report",
+            {"db_path": str(db.DB_PATH), "threshold": duplicate_threshold},
+            label="Duplicate report"
+        )
+        st.success(f"Job #{job_id} submitted")
+
+st.divider()
+
+
+# ============== JOB LIST ==============
+# Only this fragment reruns while polling, not the whole page
+@st.fragment(run_every=2)
+def job_list():
+    st.subheader("Recent Jobs")
+    recent = job_queue.jobs(limit=25)
+    if not recent:
+        st.info("No jobs yet.")
+        return
+    for job in recent:
+        col1, col2, col3 = st.columns([3, 3, 2])
+        with col1:
+            st.write(f"**#{job['job_id']}** {job['label']}")
+            st.caption(f"Submitted {job['submitted_at']}")
+        with col2:
+            if job["status"] in ("queued", "running"):
+                st.progress(job["progress"], text=job["message"] or job["status"].title())
+            elif job["status"] == "failed":
+                st.error(job["error"] or "Failed")
+            else:
+                st.write(f"✅ Finished {job['finished_at']}")
+        with col3:
+            path = job_queue.result_path(job["job_id"]) if job["status"] == "done" else None
+            if path is not None:
+                # Read the file only when the button is clicked, not on every poll
+                st.download_button(
+                    label="Download",
+                    data=path.read_bytes,
+                    file_name=job["result_name"],
+                    mime=job["result_mime"],
+                    key=f"job_download_{job['job_id']}"
+                )
+
+
+job_list()
@@ -0,0 +1,163 @@
+import streamlit as st
+import pandas as pd
+import sqlite3
+from pathlib import Path
+import importlib.util
+import sys
+
+# Load shared modules by file path to avoid package import issues; reuse across reruns
+def _load_module(name, path):
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, str(path))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+issue_store = _load_module("issue_store", Path(__file__).parent / "issue_store.py")
+db = _load_module("data_db", Path(__file__).parent.parent / "Data" / "db.py")
+persistence = _load_module("test_persistence", Path(__file__).parent.parent / "Test" / "persistence.py")
+instrumentation = _load_module("instrumentation", Path(__file__).parent.parent / "instrumentation.py")
+
+PAGE_SIZE = 50
+
+# Configure page
+st.set_page_config(page_title="Issue Management", layout="wide")
+st.title("🐞 Issue Management")
+
+
+@st.cache_resource
+def install_issue_store():
+    database = db.get_database()
+    with database.writer() as conn:
+        issue_store.ensure_issue_schema(conn)
+    return database
+
+
+try:
+    instrumentation.mark("load")
+    database = install_issue_store()
+
+    # Sidebar: bring in issues created on the Run Tests page
+    st.sidebar.header("Import")
+    if st.sidebar.button("Import Test Issues", key="import_issues"):
+        issues = persistence.load_issues() + st.session_state.get("created_issues", [])
+        with database.writer() as conn:
+            result = issue_store.import_issues(conn, issues)
+        st.sidebar.success(f"Imported {result['added']} new issues")
+        if result["kept"]:
+            st.sidebar.info(
+                "Kept the stored copy of issues changed on Run Tests since their import: "
+                + ", ".join(result["kept"])
+            )
+        if result["conflicts"]:
+            st.sidebar.warning(
+                "Not imported, the ID is already used by a different issue: "
+                + ", ".join(result["conflicts"])
+            )
+    st.sidebar.caption("Adds saved and this session's issues from Run Tests; existing issues keep their triage state.")
+
+    # Filters (values come straight from the column indexes)
+    st.subheader("Filters")
+    labels = {"status": "Status", "severity": "Severity", "assigned_to": "Assignee", "event_id": "Event"}
+    filters = {}
+    filter_cols = st.columns(len(labels))
+    for col, (column, label) in zip(filter_cols, labels.items()):
+        values = database.cached(
+            ("issue_values", column),
+            lambda conn, column=column: issue_store.distinct_values(conn, column)
+        )
+        with col:
+            filters[column] = st.selectbox(
+                label,
+                [None] + values,
+                format_func=lambda v: "All" if v is None else (v or "(unassigned)"),
+                key=f"issue_filter_{column}"
+            )
+
+    # Keyset pagination: keep the last issue_id of each visited page; reset on filter change
+    filter_key = tuple(filters[c] for c in issue_store.FILTER_COLUMNS)
+    if st.session_state.get("issue_filter_key") != filter_key:
+        st.session_state.issue_filter_key = filter_key
+        st.session_state.issue_page_starts = [None]
+    page_starts = st.session_state.issue_page_starts
+
+    total = database.cached(
+        ("issue_count", filter_key),
+        lambda conn: issue_store.count_issues(conn, filters)
+    )
+    rows = database.cached(
+        ("issue_page", filter_key, page_starts[-1]),
+        lambda conn: issue_store.fetch_page(conn, filters, after=page_starts[-1], limit=PAGE_SIZE)
+    )
+
+    instrumentation.mark("render")
+    if "issue_flash" in st.session_state:
+        st.success(st.session_state.pop("issue_flash"))
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        first = (len(page_starts) - 1) * PAGE_SIZE
+        st.write(f"**{total}** matching issues" + (f" — showing {first + 1}-{first + len(rows)}" if rows else ""))
+    with col2:
+        if st.button("◀ Previous", disabled=len(page_starts) == 1, width='stretch'):
+            page_starts.pop()
+            st.rerun()
+    with col3:
+        has_next = len(rows) == PAGE_SIZE and first + len(rows) < total
+        if st.button("Next ▶", disabled=not has_next, width='stretch'):
+            page_starts.append(rows[-1]["issue_id"])
+            st.rerun()
+
+    if not rows:
+        st.info("No issues match the current filters. Import issues from the sidebar.")
+    else:
+        # Edits inside a form are only sent on submit, so ticking rows doesn't rerun the page
+        with st.form("bulk_update"):
+            page_df = pd.DataFrame(rows)
+            page_df.insert(0, "select", False)
+            edited = st.data_editor(
+                page_df,
+                column_config={"select": st.column_config.CheckboxColumn("Select")},
+                disabled=issue_store.ISSUE_COLUMNS,
+                hide_index=True,
+                width='stretch',
+                key=f"issue_editor_{filter_key}_{page_starts[-1]}"
+            )
+
+            st.write("**Bulk Update**")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                new_status = st.selectbox("Set status", [None] + issue_store.ISSUE_STATUSES,
+                                          format_func=lambda v: "(unchanged)" if v is None else v)
+            with col2:
+                reassign = st.checkbox("Reassign")
+                new_assignee = st.text_input("Assign to", placeholder="Leave empty to unassign")
+            with col3:
+                scope = st.radio("Apply to", ["selected", "matching"],
+                                 format_func=lambda v: "Selected rows" if v == "selected" else f"All {total} matching issues")
+
+            submitted = st.form_submit_button("Apply", type="primary")
+
+        if submitted:
+            assigned_to = new_assignee.strip() if reassign else None
+            if new_status is None and assigned_to is None:
+                st.warning("Choose a status or tick Reassign first.")
+            elif scope == "selected":
+                selected = edited.loc[edited["select"], "issue_id"].tolist()
+                if not selected:
+                    st.warning("No rows selected.")
+                else:
+                    with database.writer() as conn:
+                        changed = issue_store.bulk_update(conn, selected, status=new_status, assigned_to=assigned_to)
+                    st.session_state.issue_flash = f"Updated {changed} issues"
+                    st.rerun()
+            else:
+                with database.writer() as conn:
+                    changed = issue_store.bulk_update_matching(conn, filters, status=new_status, assigned_to=assigned_to)
+                # Updated rows may no longer match the filters
+                st.session_state.issue_page_starts = [None]
+                st.session_state.issue_flash = f"Updated {changed} issues"
+                st.rerun()
+
+except sqlite3.Error as e:
+    st.error(f"Error reading issues: {str(e)}")
@@ -0,0 +1,177 @@
+import sqlite3
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+ISSUE_COLUMNS = [
+    "issue_id",
+    "event_id",
+    "test_id",
+    "test_name",
+    "title",
+    "description",
+    "severity",
+    "status",
+    "created_date",
+    "assigned_to",
+]
+
+ISSUE_STATUSES = ["Open", "In Progress", "Resolved", "Closed"]
+ISSUE_SEVERITIES = ["Critical", "High", "Medium", "Low"]
+
+# Filter fields map straight onto indexed columns. Every index ends in
+# issue_id so a filtered page is an index range scan in keyset order.
+FILTER_COLUMNS = ["status", "severity", "assigned_to", "event_id"]
+
+ISSUE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issue (
+    issue_id TEXT PRIMARY KEY,
+    event_id TEXT,
+    test_id TEXT,
+    test_name TEXT,
+    title TEXT NOT NULL,
+    description TEXT,
+    severity TEXT,
+    status TEXT NOT NULL DEFAULT 'Open',
+    created_date TEXT,
+    assigned_to TEXT NOT NULL DEFAULT ''
+);
+
+CREATE INDEX IF NOT EXISTS idx_issue_status ON issue(status, issue_id);
+CREATE INDEX IF NOT EXISTS idx_issue_severity ON issue(severity, issue_id);
+CREATE INDEX IF NOT EXISTS idx_issue_assigned ON issue(assigned_to, issue_id);
+CREATE INDEX IF NOT EXISTS idx_issue_event ON issue(event_id, issue_id);
+"""
+
+
+def ensure_issue_schema(conn: sqlite3.Connection) -> None:
+    conn.executescript(ISSUE_SCHEMA)
+
+
+# Together these say which issue a record is; issue_id alone is only unique
+# within one Run Tests session
+IDENTITY_COLUMNS = ["event_id", "test_id", "created_date"]
+
+
+def import_issues(conn: sqlite3.Connection, issues: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Add issues (persistence.py JSON layout) not already in the store.
+
+    An issue already in the store keeps its stored copy, so triage changes
+    made here win over edits made on the Run Tests page; those IDs are
+    reported under "kept". A record whose issue_id is taken by a different
+    issue (another session reused the ID) is not imported and is reported
+    under "conflicts". Returns {"added": n, "kept": [ids], "conflicts": [ids]}.
+    """
+    select = f"SELECT {', '.join(ISSUE_COLUMNS)} FROM issue WHERE issue_id = ?"
+    insert = (
+        f"INSERT INTO issue({', '.join(ISSUE_COLUMNS)}) "
+        f"VALUES ({', '.join(':' + c for c in ISSUE_COLUMNS)})"
+    )
+    summary: Dict[str, Any] = {"added": 0, "kept": [], "conflicts": []}
+    with conn:
+        for issue in issues:
+            row = {c: issue.get(c, "" if c == "assigned_to" else None) for c in ISSUE_COLUMNS}
+            stored = conn.execute(select, (row["issue_id"],)).fetchone()
+            if stored is None:
+                conn.execute(insert, row)
+                summary["added"] += 1
+                continue
+            stored = dict(zip(ISSUE_COLUMNS, stored))
+            if any(stored[c] != row[c] for c in IDENTITY_COLUMNS):
+                summary["conflicts"].append(row["issue_id"])
+            elif stored != row and row["issue_id"] not in summary["kept"]:
+                summary["kept"].append(row["issue_id"])
+    return summary
+
+
+def _where(filters: Dict[str, Optional[str]]) -> Tuple[str, List[Any]]:
+    clauses, params = [], []
+    for column in FILTER_COLUMNS:
+        value = filters.get(column)
+        if value is not None:
+            clauses.append(f"{column} = ?")
+            params.append(value)
+    return (" AND ".join(clauses) if clauses else "1"), params
+
+
+def count_issues(conn: sqlite3.Connection, filters: Dict[str, Optional[str]]) -> int:
+    where, params = _where(filters)
+    return conn.execute(f"SELECT COUNT(*) FROM issue WHERE {where}", params).fetchone()[0]
+
+
+def fetch_page(
+    conn: sqlite3.Connection,
+    filters: Dict[str, Optional[str]],
+    after: Optional[str] = None,
+    limit: int = 50,
+) -> List[Dict[str, Any]]:
+    """Return up to `limit` issues with issue_id greater than `after`.
+
+    Keyset pagination: the cost of a page does not grow with how deep into
+    the result set it is.
+    """
+    where, params = _where(filters)
+    if after is not None:
+        where += " AND issue_id > ?"
+        params.append(after)
+    rows = conn.execute(
+        f"SELECT {', '.join(ISSUE_COLUMNS)} FROM issue WHERE {where} "
+        f"ORDER BY issue_id LIMIT ?",
+        params + [limit],
+    ).fetchall()
+    return [dict(zip(ISSUE_COLUMNS, row)) for row in rows]
+
+
+def distinct_values(conn: sqlite3.Connection, column: str) -> List[str]:
+    """Values present in an indexed filter column (served from the index)."""
+    if column not in FILTER_COLUMNS:
+        raise ValueError(f"Not a filter column: {column}")
+    return [
+        v for (v,) in conn.execute(
+            f"SELECT DISTINCT {column} FROM issue WHERE {column} IS NOT NULL ORDER BY {column}"
+        )
+    ]
+
+
+def bulk_update(
+    conn: sqlite3.Connection,
+    issue_ids: Sequence[str],
+    status: Optional[str] = None,
+    assigned_to: Optional[str] = None,
+) -> int:
+    """Set status and/or assignee on many issues in one transaction."""
+    assignments, values = _assignments(status, assigned_to)
+    if not assignments or not issue_ids:
+        return 0
+    before = conn.total_changes
+    with conn:
+        conn.executemany(
+            f"UPDATE issue SET {assignments} WHERE issue_id = ?",
+            [values + [issue_id] for issue_id in issue_ids],
+        )
+    return conn.total_changes - before
+
+
+def bulk_update_matching(
+    conn: sqlite3.Connection,
+    filters: Dict[str, Optional[str]],
+    status: Optional[str] = None,
+    assigned_to: Optional[str] = None,
+) -> int:
+    """Set status and/or assignee on every issue matching the filters (one UPDATE)."""
+    assignments, values = _assignments(status, assigned_to)
+    if not assignments:
+        return 0
+    where, params = _where(filters)
+    with conn:
+        cur = conn.execute(f"UPDATE issue SET {assignments} WHERE {where}", values + params)
+    return cur.rowcount
+
+
+def _assignments(status: Optional[str], assigned_to: Optional[str]) -> Tuple[str, List[Any]]:
+    parts, values = [], []
+    if status is not None:
+        parts.append("status = ?")
+        values.append(status)
+    if assigned_to is not None:
+        parts.append("assigned_to = ?")
+        values.append(assigned_to)
+    return ", ".join(parts), values
@@ -0,0 +1,121 @@
+import streamlit as st
+import pandas as pd
+import sqlite3
+from pathlib import Path
+import importlib.util
+import sys
+
+# Load shared modules by file path to avoid package import issues; reuse across reruns
+def _load_module(name, path):
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, str(path))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+batch_edit = _load_module("requirements_batch", Path(__file__).parent / "batch_edit.py")
+sync = _load_module("requirements_sync", Path(__file__).parent / "sync.py")
+db = _load_module("data_db", Path(__file__).parent.parent / "Data" / "db.py")
+instrumentation = _load_module("instrumentation", Path(__file__).parent.parent / "instrumentation.py")
+
+# Configure page
+st.set_page_config(page_title="Requirements Management", layout="wide")
+st.title("Requirements Management")
+
+
+@st.cache_resource
+def install_batch_edit():
+    database = db.get_database()
+    with database.writer() as conn:
+        # name/priority/status/tags live in the sync columns
+        sync.ensure_sync_schema(conn)
+        batch_edit.ensure_batch_schema(conn)
+    return database
+
+
+try:
+    instrumentation.mark("load")
+    database = install_batch_edit()
+
+    # Sidebar: scope the grid to one system
+    st.sidebar.header("Filters")
+    systems = dict(database.query("systems"))
+    selected_system = st.sidebar.selectbox(
+        "System",
+        [None] + list(systems),
+        format_func=lambda s: "All Systems" if s is None else systems[s],
+        key="mgmt_system"
+    )
+    rows = database.cached(
+        ("requirement_rows", selected_system),
+        lambda conn: batch_edit.load_rows(conn, selected_system)
+    )
+
+    instrumentation.mark("render")
+    if "mgmt_flash" in st.session_state:
+        st.success(st.session_state.pop("mgmt_flash"))
+
+    # Undo the most recent committed batch
+    last = database.cached(("last_batch",), batch_edit.last_batch)
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        if last:
+            st.write(f"**Last batch:** #{last['batch_id']} — {last['change_count']} changes at {last['created_at']}")
+        else:
+            st.write("No edit batches to undo.")
+    with col2:
+        if st.button("↩️ Undo Last Batch", disabled=last is None, width='stretch'):
+            try:
+                with database.writer() as conn:
+                    undone = batch_edit.undo_last_batch(conn)
+                st.session_state.mgmt_flash = f"Undid batch #{undone}"
+                st.rerun()
+            except batch_edit.EditConflict as e:
+                st.error(f"Cannot undo: {e}")
+
+    st.divider()
+
+    if not rows:
+        st.info("No requirements found in the database.")
+    else:
+        original_df = pd.DataFrame(rows)
+        st.caption(f"{len(original_df)} requirements. Edits stay in the grid until you commit them as one batch.")
+
+        # The form holds every cell edit client-side; submit sends them in one round-trip
+        with st.form("requirements_grid"):
+            edited_df = st.data_editor(
+                original_df,
+                column_config={
+                    "id": st.column_config.NumberColumn("ID"),
+                    "req_key": "Key",
+                    "system_id": st.column_config.SelectboxColumn("System", options=list(systems)),
+                    "status": st.column_config.SelectboxColumn("Status", options=batch_edit.REQUIREMENT_STATUSES),
+                    "priority": st.column_config.SelectboxColumn("Priority", options=batch_edit.REQUIREMENT_PRIORITIES),
+                },
+                disabled=["id", "req_key", "system_id", "level"],
+                hide_index=True,
+                width='stretch',
+                key=f"requirements_grid_{selected_system}"
+            )
+            submitted = st.form_submit_button("💾 Commit Changes", type="primary")
+
+        if submitted:
+            edited_rows = edited_df.astype(object).where(edited_df.notna(), None).to_dict("records")
+            changes = batch_edit.diff_rows(rows, edited_rows)
+            if not changes:
+                st.info("No changes to commit.")
+            else:
+                try:
+                    with database.writer() as conn:
+                        batch_id = batch_edit.apply_batch(conn, changes)
+                    touched = len({change[0] for change in changes})
+                    st.session_state.mgmt_flash = (
+                        f"Committed batch #{batch_id}: {len(changes)} changes to {touched} requirements"
+                    )
+                    st.rerun()
+                except batch_edit.EditConflict as e:
+                    st.error(f"Nothing was saved: {e}. Reload the page and reapply your edits.")
+
+except sqlite3.Error as e:
+    st.error(f"Error accessing requirements: {str(e)}")
@@ -1,48 +1,106 @@
 import streamlit as st
 import pandas as pd
-import json
+from datetime import timedelta
 from pathlib import Path
+import importlib.util
+import sqlite3
+import sys
 
 # Configure page
 st.set_page_config(page_title="Requirements Management", layout="wide")
 st.title("Requirements Management")
 
-# Load requirements data
-@st.cache_data
-def load_requirements():
-    req_path = Path("/home/myintsai/Documents/syseng-toolkit/data/requirements/fun_requirements.json")
-    with open(req_path, 'r') as f:
-        data = json.load(f)
-    
-    # Flatten the nested structure
-    requirements = []
-    for item in data:
-        for req_id, details in item.items():
-            req_dict = {
-                "ID": req_id,
-                "Name": details.get("name", ""),
-                "Description": details.get("description", ""),
-                "Priority": details.get("priority", ""),
-                "Status": details.get("status", ""),
-                "Tags": ", ".join(details.get("tags", [])),
-            }
-            # Add manager info from closure details if available
-            closure_details = details.get("Closure Details", [])
-            if closure_details:
-                req_dict["Closure Code"] = closure_details[-1].get("Closure Code", "")
-                req_dict["Closure Comments"] = closure_details[-1].get("Closure Comments", "")
-            requirements.append(req_dict)
-    
-    return requirements
+# Load shared modules by file path to avoid package import issues; reuse across reruns
+def _load_module(name, path):
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, str(path))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+loader = _load_module("requirements_loader", Path(__file__).parent / "loader.py")
+requirements_corpus = _load_module("requirements_corpus", Path(__file__).parent / "corpus.py")
+baseline_diff = _load_module("requirements_baseline_diff", Path(__file__).parent / "baseline_diff.py")
+similarity = _load_module("requirements_similarity", Path(__file__).parent / "similarity.py")
+db = _load_module("data_db", Path(__file__).parent.parent / "Data" / "db.py")
+instrumentation = _load_module("instrumentation", Path(__file__).parent.parent / "instrumentation.py")
+
+# More unsigned requirements than this are left to the Duplicate Report job
+SIMILARITY_INLINE_MAX = 5000
+# Change report rows shown inline; the download has all of them
+BASELINE_CHANGES_SHOWN = 500
+
+
+def similarity_index():
+    """MinHash index of the requirement store, after signing newly added requirements.
+
+    None if the store cannot be written or too much is left to sign here.
+    """
+    try:
+        database = db.get_database()
+        pending = similarity.pending_count(database.reader())
+        if pending is None:
+            with database.writer() as conn:
+                similarity.ensure_similarity(conn)
+            pending = similarity.pending_count(database.reader())
+        if pending > SIMILARITY_INLINE_MAX:
+            return None
+        if pending:
+            with database.writer() as conn:
+                similarity.update_index(conn)
+        # Reloaded after any write to the store
+        return database.cached(("similarity_index",), similarity.SimilarityIndex.load, ttl=float("inf"))
+    except (PermissionError, sqlite3.Error):
+        return None
+
+
+def show_similar(text, threshold=similarity.DEFAULT_THRESHOLD, exclude_key=None):
+    index = similarity_index()
+    if index is None:
+        st.info("The duplicate index is not ready; run the Duplicate Report job on the Jobs page.")
+        return
+    matches = db.get_database().cached(
+        ("similar_requirements", text, threshold, exclude_key),
+        lambda conn: similarity.similar_requirements(conn, index, text, threshold, exclude_key=exclude_key),
+    )
+    if len(matches) > 0:
+        st.dataframe(matches, width='stretch', hide_index=True)
+    else:
+        st.info("No possible duplicates in the requirement store.")
 
 # Load data
 try:
-    requirements = load_requirements()
-    df = pd.DataFrame(requirements)
+    instrumentation.mark("load")
+    # Every requirements file, read from its compiled snapshot and shared across sessions; not modified below
+    # In-process: forking the app's threaded process for a pool is not safe
+    corpus = requirements_corpus.load_corpus(workers=1)
+    df = corpus.frame
     
     # Create sidebar filters
+    instrumentation.mark("filter")
     st.sidebar.header("Filters")
     
+    # Point-in-time view, answered from the Closure Details history index
+    try:
+        as_of_indexes = [loader.load_as_of_index(path) for path in corpus.files]
+    except OSError:
+        as_of_indexes = []
+    as_of_date = None
+    if any(index.first_date is not None for index in as_of_indexes):
+        as_of_date = st.sidebar.date_input(
+            "As of",
+            value=None,
+            help="Show each requirement's status on this date, reconstructed from its closure history"
+        )
+    if as_of_date is not None:
+        as_of = corpus.status_as_of(as_of_date)
+        df = df.assign(**{
+            "Current Status": df["Status"],
+            "Status": as_of["As-of Status"].astype(str).to_numpy(),
+            "Status Since": as_of["Since"].to_numpy(),
+        })
+    
     # Filter by Status
     status_options = ["All"] + sorted(df["Status"].unique().tolist())
     selected_status = st.sidebar.selectbox(
@@ -70,21 +128,25 @@ try:
         help="Select a tag to filter requirements"
     )
     
-    # Apply filters
-    filtered_df = df.copy()
-    
-    if selected_status != "All":
-        filtered_df = filtered_df[filtered_df["Status"] == selected_status]
-    
-    if selected_priority != "All":
-        filtered_df = filtered_df[filtered_df["Priority"] == selected_priority]
+    # Filter by source file, when the corpus spans several
+    if len(corpus.files) > 1:
+        selected_source = st.sidebar.selectbox(
+            "Filter by Source File",
+            ["All"] + [path.name for path in corpus.files],
+            help="Requirements files under data/requirements"
+        )
+    else:
+        selected_source = "All"
     
-    if selected_tag != "All":
-        filtered_df = filtered_df[
-            filtered_df["Tags"].str.contains(selected_tag, na=False, case=False)
-        ]
+    # Apply filters
+    filtered_df = loader.filter_requirements(
+        df, selected_status, selected_priority, selected_tag
+    )
+    if selected_source != "All":
+        filtered_df = filtered_df[filtered_df[requirements_corpus.SOURCE_COLUMN] == selected_source]
     
     # Display summary statistics
+    instrumentation.mark("render")
     col1, col2, col3, col4 = st.columns(4)
     with col1:
         st.metric("Total Requirements", len(df))
@@ -97,6 +159,29 @@ try:
         high_priority = len(df[df["Priority"] == "High"])
         st.metric("High Priority", high_priority)
     
+    if len(corpus.collisions) > 0:
+        st.warning(f"{len(corpus.collisions)} requirement IDs appear in more than one requirements file.")
+        with st.expander("ID collisions"):
+            st.dataframe(corpus.collisions, width='stretch', hide_index=True)
+    
+    if as_of_date is not None:
+        st.caption(f"Statuses as of {as_of_date:%Y-%m-%d}, reconstructed from closure history.")
+        with st.expander("Status changes"):
+            changes_since = st.date_input(
+                "Changes since",
+                value=as_of_date - timedelta(days=30),
+                max_value=as_of_date,
+                key="as_of_changes_since"
+            )
+            changes = pd.concat(
+                [index.changes_between(changes_since, as_of_date) for index in as_of_indexes],
+                ignore_index=True,
+            ).sort_values("Date", kind="stable")
+            if len(changes) > 0:
+                st.dataframe(changes, width='stretch', hide_index=True)
+            else:
+                st.info("No status changes in this period.")
+    
     st.divider()
     
     # Display requirements table
@@ -111,8 +196,13 @@ try:
                     st.write("**Priority:**", row['Priority'])
                 with col2:
                     st.write("**Status:**", row['Status'])
+                    if as_of_date is not None:
+                        since = row['Status Since']
+                        st.caption(f"Since {since:%Y-%m-%d}; now {row['Current Status']}" if pd.notna(since) else f"Now {row['Current Status']}")
                 with col3:
                     st.write("**Tags:**", row['Tags'])
+                if len(corpus.files) > 1:
+                    st.caption(f"From {row[requirements_corpus.SOURCE_COLUMN]}")
                 
                 st.write("**Description:**")
                 st.write(row['Description'])
@@ -122,24 +212,106 @@ try:
                 if pd.notna(row.get('Closure Comments')):
                     st.write("**Closure Comments:**", row['Closure Comments'])
                 
-                # Action buttons
+                # Action buttons; colliding IDs from different files need their own keys
+                card_key = row['ID'] if len(corpus.files) == 1 else f"{row[requirements_corpus.SOURCE_COLUMN]}:{row['ID']}"
                 col1, col2, col3 = st.columns(3)
                 with col1:
-                    if st.button("✏️ Edit", key=f"edit_{row['ID']}"):
-                        st.session_state[f"editing_{row['ID']}"] = True
+                    if st.button("✏️ Edit", key=f"edit_{card_key}"):
+                        st.session_state[f"editing_{card_key}"] = True
                         st.rerun()
                 with col2:
-                    if st.button("📋 Update Status", key=f"status_{row['ID']}"):
-                        st.session_state[f"status_update_{row['ID']}"] = True
+                    if st.button("📋 Update Status", key=f"status_{card_key}"):
+                        st.session_state[f"status_update_{card_key}"] = True
                         st.rerun()
                 with col3:
-                    if st.button("🗑️ Delete", key=f"delete_{row['ID']}"):
+                    if st.button("🗑️ Delete", key=f"delete_{card_key}"):
                         st.warning(f"Delete confirmation for {row['ID']} would be implemented here")
     else:
         st.info("No requirements match the selected filters.")
     
     st.divider()
     
+    # Near-duplicates from the MinHash index of the requirement store
+    st.subheader("Possible Duplicates")
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        duplicates_for = st.selectbox(
+            "Requirement",
+            [None] + filtered_df["ID"].tolist(),
+            format_func=lambda x: "Select a requirement" if x is None else x,
+            key="duplicates_for"
+        )
+    with col2:
+        duplicates_threshold = st.slider(
+            "Minimum similarity", 0.5, 1.0, similarity.DEFAULT_THRESHOLD, 0.05,
+            key="duplicates_threshold"
+        )
+    if duplicates_for is not None:
+        description = filtered_df.loc[filtered_df["ID"] == duplicates_for, "Description"].iloc[0]
+        show_similar(description, duplicates_threshold, exclude_key=duplicates_for)
+    
+    st.divider()
+    
+    # What changed between two baselines; hashes first, fields only where those differ
+    st.subheader("Compare Baselines")
+    baselines = baseline_diff.available_baselines(corpus.files)
+    if len(baselines) < 2:
+        st.info(f"Keep earlier baselines as requirements JSON files in `{baseline_diff.BASELINES_DIR}` to compare them with the current requirements.")
+    else:
+        col1, col2, col3 = st.columns([2, 2, 1])
+        with col1:
+            old_baseline = st.selectbox(
+                "Old baseline", baselines, index=len(baselines) - 1,
+                format_func=lambda p: p.name, key="baseline_old"
+            )
+        with col2:
+            new_baseline = st.selectbox(
+                "New baseline", baselines, index=0,
+                format_func=lambda p: p.name, key="baseline_new"
+            )
+        with col3:
+            st.write("")
+            if st.button("Compare", key="baseline_compare"):
+                st.session_state.baseline_pair = (old_baseline, new_baseline)
+        if st.session_state.get("baseline_pair") == (old_baseline, new_baseline):
+            try:
+                with st.spinner("Comparing baselines..."):
+                    # Shared across sessions until either file changes; not modified below
+                    baseline_result = baseline_diff.compare(old_baseline, new_baseline)
+                summary = baseline_result.summary()
+                col1, col2, col3, col4 = st.columns(4)
+                with col1:
+                    st.metric("Added", f"{summary['added']:,}")
+                with col2:
+                    st.metric("Removed", f"{summary['removed']:,}")
+                with col3:
+                    st.metric("Modified", f"{summary['modified']:,}")
+                with col4:
+                    st.metric("Unchanged", f"{summary['unchanged']:,}")
+                for side in ("old", "new"):
+                    if summary[f"repeated_ids_{side}"]:
+                        st.warning(f"{summary[f'repeated_ids_{side}']} repeated IDs in the {side} baseline; only their first occurrence is compared.")
+                field_counts = baseline_result.field_counts()
+                field_counts = field_counts[field_counts["Modified"] > 0]
+                if len(field_counts) > 0:
+                    st.dataframe(field_counts, width='stretch', hide_index=True)
+                changes = baseline_result.changes_frame(BASELINE_CHANGES_SHOWN)
+                if len(changes) > 0:
+                    st.caption(f"First {len(changes)} report rows; download the full report below.")
+                    st.dataframe(changes, width='stretch', hide_index=True)
+                    st.download_button(
+                        label="Download Change Report (CSV)",
+                        data=lambda: baseline_result.report_bytes("csv"),
+                        file_name=f"baseline_diff_{old_baseline.stem}_{new_baseline.stem}.csv",
+                        mime="text/csv"
+                    )
+                else:
+                    st.success("The baselines are identical.")
+            except (OSError, ValueError) as e:
+                st.error(f"Error comparing baselines: {str(e)}")
+    
+    st.divider()
+    
     # Add new requirement section
     st.subheader("Add New Requirement")
     with st.form("new_requirement_form"):
@@ -158,6 +330,8 @@ try:
         if submit:
             if new_id and new_name and new_description:
                 st.success(f"Requirement {new_id} would be added to the system")
+                st.write("**Possible duplicates of the new description:**")
+                show_similar(new_description)
             else:
                 st.error("Please fill in all required fields")
 
@@ -165,4 +339,23 @@ except FileNotFoundError:
     st.error("Requirements data file not found. Please check the data path.")
 except Exception as e:
     st.error(f"Error loading requirements: {str(e)}")
+    # Point at the offending records, not just the exception. The files may be
+    # what failed to load, so any error here leaves just the message above.
+    try:
+        validation = _load_module("requirements_validation", Path(__file__).parent / "validation.py")
+        corpus_paths = requirements_corpus.corpus_files()
+    except Exception:
+        corpus_paths = []
+    for path in corpus_paths:
+        try:
+            report = validation.validate(path, workers=1)
+        except Exception:
+            continue
+        if report["findings"]:
+            st.write(
+                f"**{report['by_severity']['error']}** errors and **{report['by_severity']['warning']}** "
+                f"warnings in `{path.name}` "
+                f"(full report: `python src/Requirements/validation.py {path}`)"
+            )
+            st.dataframe(pd.DataFrame(report["findings"][:500]), width='stretch', hide_index=True)
 
@@ -0,0 +1,92 @@
+import streamlit as st
+import pandas as pd
+import sqlite3
+from pathlib import Path
+import importlib.util
+import sys
+
+# Load shared modules by file path to avoid package import issues; reuse across reruns
+def _load_module(name, path):
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, str(path))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+requirements_corpus = _load_module("requirements_corpus", Path(__file__).parent / "corpus.py")
+slip = _load_module("requirements_slip", Path(__file__).parent / "slip.py")
+db = _load_module("data_db", Path(__file__).parent.parent / "Data" / "db.py")
+instrumentation = _load_module("instrumentation", Path(__file__).parent.parent / "instrumentation.py")
+
+MOST_SLIPPED = 50
+
+# Configure page
+st.set_page_config(page_title="Schedule Slip", layout="wide")
+st.title("Schedule Slip and Replans")
+
+
+def rollup_table(rollup, label):
+    st.dataframe(rollup.rename_axis(label).reset_index(), width='stretch', hide_index=True)
+
+
+try:
+    instrumentation.mark("load")
+    # Every requirements file, computed once per corpus and shared across sessions; not modified below
+    analytics = requirements_corpus.slip_analytics(workers=1)
+
+    instrumentation.mark("render")
+    summary = analytics.summary()
+    col1, col2, col3, col4, col5 = st.columns(5)
+    with col1:
+        st.metric("Requirements", f"{summary['requirements']:,}")
+    with col2:
+        st.metric("Replanned", f"{summary['replanned']:,}")
+    with col3:
+        st.metric("Replans", f"{summary['replans']:,}")
+    with col4:
+        st.metric("Mean Slip (days)", f"{summary['mean slip']:.1f}")
+    with col5:
+        close = summary["median days to close"]
+        st.metric("Median Days to Close", "-" if pd.isna(close) else f"{close:.0f}")
+    st.caption(
+        f"{summary['entries']:,} Closure Details entries. Slip is Replanned Date minus Baseline Date per entry; "
+        "time to close runs from the first Baseline Date to the Closure Date of a final Closed entry."
+    )
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("Slip per Entry")
+        st.bar_chart(analytics.histogram("slip days"), x="days", y="count")
+    with col2:
+        st.subheader("Time to Close")
+        st.bar_chart(analytics.histogram("days to close"), x="days", y="count")
+
+    st.divider()
+
+    st.subheader("Slip Rollups")
+    tab1, tab2, tab3 = st.tabs(["By Tag", "By Priority", "By Owner"])
+    with tab1:
+        rollup_table(analytics.by_tag(), "Tag")
+    with tab2:
+        rollup_table(analytics.by_priority(), "Priority")
+    with tab3:
+        # Owners live in the requirement store; recomputed after store writes
+        database = db.get_database()
+        by_owner = database.cached(
+            ("slip_by_owner", analytics.source_sha256),
+            lambda conn: analytics.by_owner(slip.load_owners(conn)),
+        )
+        rollup_table(by_owner, "Owner")
+        if list(by_owner.index) == [slip.UNASSIGNED]:
+            st.info("No owners found; owners come from requirements synced into the requirement store.")
+
+    st.divider()
+
+    st.subheader(f"Most Slipped Requirements (top {MOST_SLIPPED})")
+    st.dataframe(analytics.most_slipped(MOST_SLIPPED), width='stretch', hide_index=True)
+
+except FileNotFoundError:
+    st.error("Requirements file not found.")
+except sqlite3.Error as e:
+    st.error(f"Error reading requirement owners: {str(e)}")
@@ -0,0 +1,114 @@
+import streamlit as st
+import pandas as pd
+import sqlite3
+from pathlib import Path
+import importlib.util
+import sys
+
+# Load shared modules by file path to avoid package import issues; reuse across reruns
+def _load_module(name, path):
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, str(path))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+trace_index = _load_module("requirements_trace_index", Path(__file__).parent / "trace_index.py")
+db = _load_module("data_db", Path(__file__).parent.parent / "Data" / "db.py")
+persistence = _load_module("test_persistence", Path(__file__).parent.parent / "Test" / "persistence.py")
+instrumentation = _load_module("instrumentation", Path(__file__).parent.parent / "instrumentation.py")
+
+MAX_LISTED = 500
+
+# Configure page
+st.set_page_config(page_title="Traceability", layout="wide")
+st.title("Requirement Traceability")
+
+
+def rollup_frame(rollups, label, names=None):
+    df = pd.DataFrame.from_dict(rollups, orient="index", columns=trace_index.ROLLUP_COLUMNS)
+    df.index = [names.get(k, k) if names else k for k in df.index]
+    df["coverage %"] = (df["verified"] / df["requirements"].where(df["requirements"] > 0) * 100).round(1)
+    return df.rename_axis(label).reset_index()
+
+
+try:
+    instrumentation.mark("load")
+    database = db.get_database()
+    # The universe only changes with the requirement store, so no TTL
+    universe = database.cached(("trace_universe",), trace_index.load_universe, ttl=float("inf"))
+    systems = dict(database.query("systems"))
+
+    # Test cases come from the Run Tests session, or the saved events
+    events = st.session_state.get("test_events") or persistence.load_events()
+
+    # One index per session; refresh() only applies cases that changed since the last rerun
+    index = st.session_state.get("traceability_index")
+    if index is None or index.universe is not universe:
+        index = trace_index.TraceabilityIndex(universe)
+        st.session_state.traceability_index = index
+    changed = index.refresh(events)
+
+    instrumentation.mark("render")
+    totals = index.totals()
+    col1, col2, col3, col4, col5 = st.columns(5)
+    with col1:
+        st.metric("Requirements", totals["requirements"])
+    with col2:
+        st.metric("Linked to Tests", totals["linked"])
+    with col3:
+        st.metric("Verified", totals["verified"])
+    with col4:
+        st.metric("Failed", totals["failed"])
+    with col5:
+        st.metric("Untested", totals["untested"])
+    st.caption(f"{len(index.case_state)} test cases indexed; {changed} updated this rerun.")
+
+    if index.unknown_links:
+        with st.expander(f"⚠️ {len(index.unknown_links)} test cases link to unknown requirement IDs"):
+            st.json({
+                f"{event_id} / {case_id}": keys
+                for (event_id, case_id), keys in list(index.unknown_links.items())[:MAX_LISTED]
+            })
+
+    st.divider()
+
+    tab1, tab2, tab3 = st.tabs(["By System", "By Tag", "By Event"])
+    with tab1:
+        st.dataframe(rollup_frame(index.by_system(), "System", systems), width='stretch', hide_index=True)
+    with tab2:
+        by_tag = index.by_tag()
+        if by_tag:
+            st.dataframe(rollup_frame(by_tag, "Tag"), width='stretch', hide_index=True)
+        else:
+            st.info("No tagged requirements in the store.")
+    with tab3:
+        by_event = index.by_event()
+        if by_event:
+            st.dataframe(rollup_frame(by_event, "Event"), width='stretch', hide_index=True)
+        else:
+            st.info("No test events found.")
+
+    st.divider()
+
+    # Drill down into one status within a system
+    st.subheader("Requirements by Coverage Status")
+    col1, col2 = st.columns(2)
+    with col1:
+        selected_system = st.selectbox(
+            "System",
+            [None] + list(universe.system_masks),
+            format_func=lambda s: "All Systems" if s is None else systems.get(s, str(s)),
+            key="trace_system"
+        )
+    with col2:
+        selected_status = st.selectbox("Status", ["failed", "untested", "verified"], key="trace_status")
+    scope = None if selected_system is None else universe.system_masks[selected_system]
+    keys = index.requirements_with(selected_status, scope)
+    st.write(f"**{len(keys)}** requirements" + (f" (first {MAX_LISTED} shown)" if len(keys) > MAX_LISTED else ""))
+    if keys:
+        st.write(", ".join(keys[:MAX_LISTED]))
+
+except sqlite3.Error as e:
+    st.error(f"Error reading requirements: {str(e)}")
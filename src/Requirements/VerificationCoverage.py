@@ -0,0 +1,87 @@
+import streamlit as st
+import pandas as pd
+import sqlite3
+from pathlib import Path
+import importlib.util
+import sys
+
+# Load shared modules by file path to avoid package import issues; reuse across reruns
+def _load_module(name, path):
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, str(path))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+coverage = _load_module("requirements_coverage", Path(__file__).parent / "coverage.py")
+db = _load_module("data_db", Path(__file__).parent.parent / "Data" / "db.py")
+instrumentation = _load_module("instrumentation", Path(__file__).parent.parent / "instrumentation.py")
+
+# Configure page
+st.set_page_config(page_title="Verification Coverage", layout="wide")
+st.title("Verification Coverage")
+
+
+@st.cache_resource
+def install_coverage():
+    database = db.get_database()
+    with database.writer() as conn:
+        coverage.ensure_coverage(conn)
+    return database
+
+
+try:
+    instrumentation.mark("load")
+    database = install_coverage()
+
+    # Summary tables are trigger-maintained, so this is cheap on every rerun
+    matrix_df = pd.DataFrame(
+        database.cached(("coverage_matrix",), coverage.coverage_matrix)
+    )
+
+    instrumentation.mark("render")
+    if matrix_df.empty:
+        st.info("No requirements found in the database.")
+    else:
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Requirements", int(matrix_df["requirements"].sum()))
+        with col2:
+            st.metric("Uncovered", int(matrix_df["uncovered"].sum()))
+        with col3:
+            total = matrix_df["requirements"].sum()
+            covered_pct = (1 - matrix_df["uncovered"].sum() / total) * 100 if total else 0
+            st.metric("Coverage", f"{covered_pct:.1f}%")
+
+        st.divider()
+
+        st.subheader("Coverage by System and Level")
+        st.dataframe(
+            matrix_df.drop(columns=["system_id"]),
+            width='stretch',
+            hide_index=True
+        )
+
+        st.divider()
+
+        st.subheader("Requirements Without a Verification Method")
+        systems = matrix_df[["system_id", "system"]].drop_duplicates()
+        system_options = [None] + systems["system_id"].tolist()
+        system_names = dict(zip(systems["system_id"], systems["system"]))
+        selected_system = st.selectbox(
+            "System",
+            system_options,
+            format_func=lambda s: "All" if s is None else system_names[s]
+        )
+        uncovered = database.cached(
+            ("uncovered", selected_system),
+            lambda conn: coverage.uncovered_requirements(conn, system_id=selected_system)
+        )
+        if uncovered:
+            st.write(", ".join(str(rid) for rid in uncovered))
+        else:
+            st.success("Every requirement has at least one verification method.")
+
+except sqlite3.Error as e:
+    st.error(f"Error reading coverage: {str(e)}")
@@ -0,0 +1,182 @@
+"""Point-in-time requirement status from Closure Details histories.
+
+Each Closure Details entry is one plan iteration. From its Baseline Date a
+requirement is Open (Replanned if an earlier iteration exists, In Progress
+if the iteration is coded so). A Failed iteration turns Failed on its
+Replanned Date, a Closed one turns Closed on its Closure Date, and the next
+iteration's Baseline Date starts the cycle again. Before the first baseline
+a requirement is Not Baselined.
+
+The index keeps those transitions as sorted int64 day arrays. Status as of a
+date is one vectorised binary search over (requirement, day) keys; changes
+between two dates are a bisected slice of the transitions in date order.
+"""
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+AS_OF_STATUSES = ["Not Baselined", "Open", "In Progress", "Replanned", "Failed", "Closed"]
+NOT_BASELINED, OPEN, IN_PROGRESS, REPLANNED, FAILED, CLOSED = range(len(AS_OF_STATUSES))
+
+
+def _days(values) -> np.ndarray:
+    """datetime64 values as int64 day numbers; NaT stays NaT-valued (min int64)."""
+    return np.asarray(values, dtype="datetime64[D]").view(np.int64)
+
+
+def _to_day(date) -> int:
+    return int(np.datetime64(pd.Timestamp(date).date(), "D").view(np.int64))
+
+
+def _previous_status(rows: np.ndarray, status: np.ndarray) -> np.ndarray:
+    """Status before each transition: the prior one of the same requirement, if any."""
+    previous = np.full(len(status), NOT_BASELINED, dtype=np.int8)
+    same_req = rows[1:] == rows[:-1]
+    previous[1:][same_req] = status[:-1][same_req]
+    return previous
+
+
+class AsOfIndex:
+    """Requirement status at any date, built once from the closure history."""
+
+    def __init__(
+        self,
+        req_ids: List[str],
+        req_row: np.ndarray,
+        is_first: np.ndarray,
+        baseline: np.ndarray,
+        replanned: np.ndarray,
+        closure: np.ndarray,
+        closure_code: List[Optional[str]],
+    ):
+        """One array slot per Closure Details entry, grouped by requirement in history order."""
+        nat = np.iinfo(np.int64).min
+        req_row = np.asarray(req_row, dtype=np.int64)
+        closure_code = np.asarray(closure_code, dtype=object)
+        self.req_ids = np.asarray(req_ids, dtype=object)
+        n = len(self.req_ids)
+
+        # Transition 1 of each entry: the baseline starts an iteration
+        start_status = np.where(np.asarray(is_first), OPEN, REPLANNED)
+        start_status[closure_code == "In Progress"] = IN_PROGRESS
+        # Transition 2: the iteration's outcome, if it has one
+        failed = closure_code == "Failed"
+        closed = (closure_code == "Closed") & (closure != nat)
+        end_day = np.where(failed, replanned, np.where(closed, closure, nat))
+        end_status = np.where(failed, FAILED, CLOSED)
+
+        # Interleave per entry (start, end) so each requirement's transitions stay in history order
+        rows = np.repeat(req_row, 2)
+        days = np.column_stack([baseline, end_day]).ravel()
+        status = np.column_stack([start_status, end_status]).ravel().astype(np.int8)
+        keep = days != nat
+        rows, days, status = rows[keep], days[keep], status[keep]
+
+        # An outcome dated before its baseline still follows it: clamp days to
+        # be non-decreasing within each requirement (offset by row, running max)
+        span = (days.max() - days.min() + 1) if len(days) else 1
+        offset = rows * span
+        days = np.maximum.accumulate(days - days.min(initial=0) + offset) - offset + days.min(initial=0)
+
+        # Several transitions on one day: only the last is ever observed
+        last_of_day = np.ones(len(days), dtype=bool)
+        last_of_day[:-1] = (rows[1:] != rows[:-1]) | (days[1:] != days[:-1])
+        rows, days, status = rows[last_of_day], days[last_of_day], status[last_of_day]
+
+        # Drop no-op transitions (e.g. Open -> Open on a replan with no outcome)
+        changed = status != _previous_status(rows, status)
+        rows, days, status = rows[changed], days[changed], status[changed]
+        previous = _previous_status(rows, status)
+
+        # By requirement: key = row * span + (day - origin), sorted ascending
+        self._origin = int(days.min()) if len(days) else 0
+        self._span = int(days.max() - self._origin + 2) if len(days) else 1
+        self._keys = rows * self._span + (days - self._origin)
+        self._rows, self._days, self._status, self._previous = rows, days, status, previous
+        self._n = n
+
+        # By date: the same transitions, stably ordered by day
+        order = np.argsort(days, kind="stable")
+        self._order = order
+        self._days_sorted = days[order]
+
+    @classmethod
+    def from_snapshot(cls, snapshot) -> "AsOfIndex":
+        """Build from a requirements snapshot (snapshot.py) without touching the JSON."""
+        start = np.asarray(snapshot.column("history_start"))
+        req_row = np.asarray(snapshot.column("req_row"))
+        is_first = np.zeros(len(req_row), dtype=bool)
+        is_first[start[:-1][start[1:] > start[:-1]]] = True
+        return cls(
+            snapshot.column("id").to_list(),
+            req_row,
+            is_first,
+            _days(snapshot.column("baseline_date")),
+            _days(snapshot.column("replanned_date")),
+            _days(snapshot.column("closure_date")),
+            np.asarray(snapshot.categorical("closure_code"), dtype=object),
+        )
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def first_date(self) -> Optional[pd.Timestamp]:
+        return pd.Timestamp(np.datetime64(int(self._days_sorted[0]), "D")) if len(self._days_sorted) else None
+
+    @property
+    def last_date(self) -> Optional[pd.Timestamp]:
+        return pd.Timestamp(np.datetime64(int(self._days_sorted[-1]), "D")) if len(self._days_sorted) else None
+
+    def _last_transition(self, date) -> np.ndarray:
+        """Per requirement, the index of its last transition on or before date (-1 if none)."""
+        day = min(max(_to_day(date) - self._origin, -1), self._span - 1)
+        rows = np.arange(self._n, dtype=np.int64)
+        pos = np.searchsorted(self._keys, rows * self._span + day, side="right") - 1
+        valid = pos >= 0
+        valid[valid] = self._rows[pos[valid]] == rows[valid]
+        return np.where(valid, pos, -1)
+
+    def status_codes(self, date) -> np.ndarray:
+        """Status code (index into AS_OF_STATUSES) of every requirement as of date."""
+        pos = self._last_transition(date)
+        return np.where(pos >= 0, self._status[pos], NOT_BASELINED).astype(np.int8)
+
+    def status_as_of(self, date) -> pd.DataFrame:
+        """ID, As-of Status and the date it took effect, one row per requirement."""
+        pos = self._last_transition(date)
+        found = pos >= 0
+        since = np.full(self._n, np.datetime64("NaT"), dtype="datetime64[D]")
+        since[found] = self._days[pos[found]].astype("datetime64[D]")
+        return pd.DataFrame({
+            "ID": self.req_ids,
+            "As-of Status": pd.Categorical.from_codes(
+                np.where(found, self._status[pos], NOT_BASELINED), categories=AS_OF_STATUSES
+            ),
+            "Since": since,
+        })
+
+    def counts_as_of(self, date) -> Dict[str, int]:
+        counts = np.bincount(self.status_codes(date), minlength=len(AS_OF_STATUSES))
+        return dict(zip(AS_OF_STATUSES, counts.tolist()))
+
+    def changes_between(self, start, end) -> pd.DataFrame:
+        """Status transitions dated after start and on or before end, oldest first."""
+        lo = np.searchsorted(self._days_sorted, _to_day(start), side="right")
+        hi = np.searchsorted(self._days_sorted, _to_day(end), side="right")
+        picked = self._order[lo:hi]
+        return pd.DataFrame({
+            "Date": self._days[picked].astype("datetime64[D]"),
+            "ID": self.req_ids[self._rows[picked]],
+            "From": pd.Categorical.from_codes(self._previous[picked], categories=AS_OF_STATUSES),
+            "To": pd.Categorical.from_codes(self._status[picked], categories=AS_OF_STATUSES),
+        })
+
+    def history(self, req_index: int) -> List[Dict[str, Any]]:
+        """All transitions of one requirement (by position), oldest first."""
+        lo, hi = np.searchsorted(self._rows, [req_index, req_index + 1])
+        return [
+            {"date": pd.Timestamp(np.datetime64(int(day), "D")), "status": AS_OF_STATUSES[code]}
+            for day, code in zip(self._days[lo:hi], self._status[lo:hi])
+        ]
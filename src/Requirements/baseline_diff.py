@@ -0,0 +1,340 @@
+"""Diff two requirement baselines: added, removed and modified requirements.
+
+A baseline is a requirements JSON file, read through its compiled snapshot
+(snapshot.py), so neither side is ever held as parsed JSON. Every requirement
+gets one 64-bit hash per compared field; the Closure Details fields hash the
+requirement's whole entry list in order. The record hash folds the field
+hashes together.
+
+Requirements are matched by ID. Matched records are compared by record hash
+first, and only the mismatches are compared field by field (again on hashes).
+Field values are decoded only for the changes actually reported, which are
+streamed one at a time (iter_changes, write_report).
+"""
+import argparse
+import csv
+import io
+import importlib.util
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Sequence, TextIO, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.util import hash_array
+
+# Field label -> snapshot column, per requirement and per Closure Details entry
+REQUIREMENT_FIELDS = {
+    "Name": "name",
+    "Description": "description",
+    "Priority": "priority",
+    "Status": "status",
+    "Tags": "tags",
+}
+HISTORY_FIELDS = {
+    "Closure Code": "closure_code",
+    "Closure Comments": "closure_comments",
+    "Baseline Date": "baseline_date",
+    "Replanned Date": "replanned_date",
+    "Closure Date": "closure_date",
+}
+FIELDS = list(REQUIREMENT_FIELDS) + list(HISTORY_FIELDS)
+CATEGORY_FIELDS = {"priority", "status", "closure_code"}
+DATE_FIELDS = {"baseline_date", "replanned_date", "closure_date"}
+REPORT_COLUMNS = ["Change", "ID", "Field", "Old", "New"]
+HASH_CHUNK = 1 << 16  # strings decoded at once while hashing
+BASELINES_DIR = Path(__file__).resolve().parents[2] / "data" / "requirements" / "baselines"
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_cache: Dict[str, "Baseline"] = {}
+_diff_cache: Dict[Tuple, "BaselineDiff"] = {}
+_cache_lock = threading.Lock()
+
+
+def _load_module(name: str, filename: str):
+    # Loaded by path under the same name everywhere, like the pages do
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, str(Path(__file__).parent / filename))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+
+# ------------------------------
+# Hashing
+# ------------------------------
+def _entry_hashes(snapshot, column: str) -> np.ndarray:
+    """One uint64 per row of a snapshot column (requirement or history rows)."""
+    if column in CATEGORY_FIELDS:
+        # Hash the few categories once, then look the codes up; missing is its own value
+        categories = np.asarray(snapshot.categories[column] + [None], dtype=object)
+        return hash_array(categories)[np.asarray(snapshot.column(column), dtype=np.int64)]
+    if column in DATE_FIELDS:
+        hashes = hash_array(np.asarray(snapshot.column(column)).view(np.int64))
+        # Unparseable dates are NaT: hash their raw text so edits between them still show
+        invalid = snapshot.invalid_dates(column)
+        if invalid:
+            hashes[list(invalid)] = hash_array(np.asarray(list(invalid.values()), dtype=object))
+        return hashes
+    return _string_hashes(snapshot.column(column))
+
+
+def _string_hashes(strings) -> np.ndarray:
+    """hash_array() of a snapshot string column, decoding HASH_CHUNK strings at a time."""
+    snapshot_module = _load_module("requirements_snapshot", "snapshot.py")
+    out = np.empty(len(strings), dtype=np.uint64)
+    offsets = np.asarray(strings.offsets)
+    for lo in range(0, len(strings), HASH_CHUNK):
+        hi = min(lo + HASH_CHUNK, len(strings))
+        chunk = snapshot_module.StringColumn(offsets[lo:hi + 1] - offsets[lo], strings.data[offsets[lo]:offsets[hi]])
+        out[lo:hi] = hash_array(np.asarray(chunk.to_list(), dtype=object))
+    return out
+
+
+def _history_hashes(snapshot, column: str) -> np.ndarray:
+    """Per requirement, an order-sensitive hash of one Closure Details field over all its entries."""
+    start = np.asarray(snapshot.column("history_start"), dtype=np.int64)
+    counts = np.diff(start)
+    out = counts.astype(np.uint64) * _GOLDEN
+    if not snapshot.n_history:
+        return out
+    req_row = np.asarray(snapshot.column("req_row"), dtype=np.int64)
+    position = (np.arange(len(req_row)) - start[req_row]).astype(np.uint64)
+    mixed = hash_array(_entry_hashes(snapshot, column) ^ (position * _GOLDEN))
+    # Empty histories have zero-length segments, so the non-empty starts tile the entries
+    has = counts > 0
+    out[has] += np.add.reduceat(mixed, start[:-1][has])
+    return out
+
+
+class Baseline:
+    """IDs and per-field hashes of one requirements file, plus lazy access to its values."""
+
+    def __init__(self, path: Path, snapshot):
+        self.path = Path(path)
+        self.snapshot = snapshot
+        self.source_sha256 = self.snapshot.header["source_sha256"]
+        self.ids = np.asarray(self.snapshot.column("id").to_list(), dtype=object)
+        self.hashes: Dict[str, np.ndarray] = {}
+        for field, column in REQUIREMENT_FIELDS.items():
+            self.hashes[field] = _entry_hashes(self.snapshot, column)
+        for field, column in HISTORY_FIELDS.items():
+            self.hashes[field] = _history_hashes(self.snapshot, column)
+        self.record_hash = np.zeros(len(self.ids), dtype=np.uint64)
+        for field in FIELDS:
+            self.record_hash = self.record_hash * _GOLDEN + self.hashes[field]
+        self._start = np.asarray(self.snapshot.column("history_start"), dtype=np.int64)
+        self._invalid_dates = {column: self.snapshot.invalid_dates(column) for column in DATE_FIELDS}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _value(self, column: str, row: int) -> str:
+        if column in CATEGORY_FIELDS:
+            code = int(self.snapshot.column(column)[row])
+            return self.snapshot.categories[column][code] if code >= 0 else ""
+        if column in DATE_FIELDS:
+            value = self.snapshot.column(column)[row]
+            if np.isnat(value):
+                return self._invalid_dates[column].get(row, "")
+            return str(value.astype("datetime64[D]"))
+        return self.snapshot.column(column)[row]
+
+    def value(self, field: str, row: int) -> str:
+        """One field of one requirement as text; Closure Details fields list every entry, oldest first."""
+        if field in REQUIREMENT_FIELDS:
+            return self._value(REQUIREMENT_FIELDS[field], row)
+        column = HISTORY_FIELDS[field]
+        return "; ".join(self._value(column, i) for i in range(self._start[row], self._start[row + 1]))
+
+    def record(self, row: int) -> Dict[str, str]:
+        return {field: self.value(field, row) for field in FIELDS}
+
+
+def load_baseline(path: Path) -> Baseline:
+    """Baseline for a requirements file, hashed once per content (sha256) per process."""
+    snapshot = _load_module("requirements_snapshot", "snapshot.py").load_snapshot(Path(path))
+    key = snapshot.header["source_sha256"]
+    with _cache_lock:
+        if key in _cache:
+            return _cache[key]
+    baseline = Baseline(path, snapshot)
+    with _cache_lock:
+        # The two sides of the latest diff; each holds a few arrays per requirement
+        while len(_cache) >= 2:
+            _cache.pop(next(iter(_cache)))
+        _cache[key] = baseline
+    return baseline
+
+
+# ------------------------------
+# Diff
+# ------------------------------
+def _first_rows(ids: np.ndarray) -> Tuple[pd.Index, np.ndarray, int]:
+    """Index of the unique IDs, the row each maps to (first occurrence) and how many repeats were skipped."""
+    repeated = pd.Index(ids).duplicated(keep="first")
+    rows = np.flatnonzero(~repeated)
+    return pd.Index(ids[rows]), rows, int(repeated.sum())
+
+
+class BaselineDiff:
+    """Row-level result of diffing an old and a new baseline."""
+
+    def __init__(self, old: Baseline, new: Baseline):
+        self.old, self.new = old, new
+        old_index, old_rows, self.old_repeats = _first_rows(old.ids)
+        new_index, new_rows, self.new_repeats = _first_rows(new.ids)
+
+        # Match by ID; -1 means no counterpart
+        match = old_index.get_indexer(new_index)
+        found = match >= 0
+        self.added = new_rows[~found]
+        removed = np.ones(len(old_rows), dtype=bool)
+        removed[match[found]] = False
+        self.removed = old_rows[removed]
+
+        # Record hashes first; field hashes only where those differ
+        old_matched, new_matched = old_rows[match[found]], new_rows[found]
+        differs = old.record_hash[old_matched] != new.record_hash[new_matched]
+        self.modified_old, self.modified_new = old_matched[differs], new_matched[differs]
+        self.unchanged = int((~differs).sum())
+        self.changed = np.column_stack([
+            old.hashes[field][self.modified_old] != new.hashes[field][self.modified_new]
+            for field in FIELDS
+        ]) if len(self.modified_new) else np.zeros((0, len(FIELDS)), dtype=bool)
+
+    def summary(self) -> Dict[str, int]:
+        return {
+            "old": len(self.old),
+            "new": len(self.new),
+            "added": len(self.added),
+            "removed": len(self.removed),
+            "modified": len(self.modified_new),
+            "unchanged": self.unchanged,
+            "repeated_ids_old": self.old_repeats,
+            "repeated_ids_new": self.new_repeats,
+        }
+
+    def field_counts(self) -> pd.DataFrame:
+        """Modified requirements per field."""
+        return pd.DataFrame({"Field": FIELDS, "Modified": self.changed.sum(axis=0).astype(int)})
+
+    def iter_changes(self, kinds: Sequence[str] = ("modified", "added", "removed")) -> Iterator[Dict[str, Any]]:
+        """Changes one requirement at a time: modified (new order), then added, then removed."""
+        if "modified" in kinds:
+            for i, (o, n) in enumerate(zip(self.modified_old.tolist(), self.modified_new.tolist())):
+                fields = [FIELDS[j] for j in np.flatnonzero(self.changed[i])]
+                yield {
+                    "change": "modified",
+                    "id": self.new.ids[n],
+                    "fields": {f: {"old": self.old.value(f, o), "new": self.new.value(f, n)} for f in fields},
+                }
+        if "added" in kinds:
+            for n in self.added.tolist():
+                yield {"change": "added", "id": self.new.ids[n], "record": self.new.record(n)}
+        if "removed" in kinds:
+            for o in self.removed.tolist():
+                yield {"change": "removed", "id": self.old.ids[o], "record": self.old.record(o)}
+
+    def iter_rows(self, kinds: Sequence[str] = ("modified", "added", "removed")) -> Iterator[List[str]]:
+        """iter_changes() flattened to REPORT_COLUMNS: one row per changed field, one per added/removed requirement."""
+        for change in self.iter_changes(kinds):
+            if change["change"] == "modified":
+                for field, values in change["fields"].items():
+                    yield ["modified", change["id"], field, values["old"], values["new"]]
+            elif change["change"] == "added":
+                yield ["added", change["id"], "", "", change["record"]["Name"]]
+            else:
+                yield ["removed", change["id"], "", change["record"]["Name"], ""]
+
+    def changes_frame(self, limit: int = 500, kinds: Sequence[str] = ("modified", "added", "removed")) -> pd.DataFrame:
+        """The first `limit` report rows, for display."""
+        rows = []
+        for row in self.iter_rows(kinds):
+            if len(rows) >= limit:
+                break
+            rows.append(row)
+        return pd.DataFrame(rows, columns=REPORT_COLUMNS)
+
+    def write_report(self, out: TextIO, fmt: str = "jsonl") -> int:
+        """Stream the change report to `out` as JSON lines or CSV; returns the number of lines written."""
+        count = 0
+        if fmt == "csv":
+            writer = csv.writer(out)
+            writer.writerow(REPORT_COLUMNS)
+            for row in self.iter_rows():
+                writer.writerow(row)
+                count += 1
+        else:
+            out.write(json.dumps({"summary": self.summary()}) + "\n")
+            for change in self.iter_changes():
+                out.write(json.dumps(change, ensure_ascii=False) + "\n")
+                count += 1
+        return count
+
+    def report_bytes(self, fmt: str = "csv") -> bytes:
+        out = io.StringIO()
+        self.write_report(out, fmt)
+        return out.getvalue().encode("utf-8")
+
+
+def _file_key(path: Path) -> Tuple[str, int, int]:
+    stat = Path(path).stat()
+    return (str(Path(path).resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+def compare(old_path: Path, new_path: Path) -> BaselineDiff:
+    """BaselineDiff of two requirements files, shared across the process until either changes."""
+    key = (_file_key(old_path), _file_key(new_path))
+    with _cache_lock:
+        if key in _diff_cache:
+            return _diff_cache[key]
+    result = BaselineDiff(load_baseline(old_path), load_baseline(new_path))
+    with _cache_lock:
+        while len(_diff_cache) >= 4:
+            _diff_cache.pop(next(iter(_diff_cache)))
+        _diff_cache[key] = result
+    return result
+
+
+def available_baselines(extra: Sequence[Path] = ()) -> List[Path]:
+    """Requirements files that can be compared: `extra` (e.g. the corpus) and data/requirements/baselines/*.json."""
+    stored = sorted(BASELINES_DIR.glob("*.json")) if BASELINES_DIR.exists() else []
+    seen, result = set(), []
+    for path in [*extra, *stored]:
+        if Path(path).resolve() not in seen:
+            seen.add(Path(path).resolve())
+            result.append(Path(path))
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Diff two requirement baselines (requirements JSON files).")
+    parser.add_argument("old", help="Old baseline")
+    parser.add_argument("new", help="New baseline")
+    parser.add_argument("--out", default=None, help="Write the full change report here")
+    parser.add_argument("--format", choices=["jsonl", "csv"], default=None, help="Report format (default: from --out suffix)")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    result = compare(Path(args.old), Path(args.new))
+    summary = result.summary()
+    print(
+        f"{summary['old']} -> {summary['new']} requirements: {summary['added']} added, "
+        f"{summary['removed']} removed, {summary['modified']} modified, {summary['unchanged']} unchanged "
+        f"({time.perf_counter() - t0:.2f}s)"
+    )
+    for side in ("old", "new"):
+        if summary[f"repeated_ids_{side}"]:
+            print(f"{summary[f'repeated_ids_{side}']} repeated IDs in the {side} baseline; first occurrences compared")
+    counts = result.field_counts()
+    print(counts[counts["Modified"] > 0].to_string(index=False))
+    if args.out:
+        fmt = args.format or ("csv" if args.out.endswith(".csv") else "jsonl")
+        with open(args.out, "w", encoding="utf-8", newline="") as f:
+            lines = result.write_report(f, fmt)
+        print(f"Wrote {lines} changes to {args.out} in {time.perf_counter() - t0:.2f}s")
@@ -0,0 +1,165 @@
+import math
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Columns the Requirements Management grid may change
+EDITABLE_COLUMNS = [
+    "name",
+    "description",
+    "owner",
+    "priority",
+    "status",
+    "tags",
+    "planned_closure_date",
+    "actual_closure_date",
+]
+
+REQUIREMENT_STATUSES = ["Open", "In Progress", "Closed", "Failed"]
+REQUIREMENT_PRIORITIES = ["High", "Medium", "Low"]
+
+# Every committed batch is journalled with old and new values so it can be undone
+BATCH_SCHEMA = """
+CREATE TABLE IF NOT EXISTS requirement_edit_batch (
+    batch_id INTEGER PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    change_count INTEGER NOT NULL,
+    undone_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS requirement_edit (
+    batch_id INTEGER NOT NULL REFERENCES requirement_edit_batch(batch_id),
+    requirement_id INTEGER NOT NULL,
+    column_name TEXT NOT NULL,
+    old_value TEXT,
+    new_value TEXT,
+    PRIMARY KEY (batch_id, requirement_id, column_name)
+) WITHOUT ROWID;
+"""
+
+# (requirement_id, column, old value, new value)
+Change = Tuple[int, str, Optional[str], Optional[str]]
+
+
+class EditConflict(Exception):
+    """A requirement changed in the store after the grid was loaded."""
+
+
+def ensure_batch_schema(conn: sqlite3.Connection) -> None:
+    conn.executescript(BATCH_SCHEMA)
+
+
+def _normalize(value: Any) -> Optional[str]:
+    # Grid cells come back as NaN/None/"" for empty; store them all as NULL
+    if value is None or value == "" or (isinstance(value, float) and math.isnan(value)):
+        return None
+    return str(value)
+
+
+def diff_rows(
+    original: Iterable[Dict[str, Any]], edited: Iterable[Dict[str, Any]]
+) -> List[Change]:
+    """Field-level changes between two lists of rows keyed by `id`."""
+    before = {row["id"]: row for row in original}
+    changes = []
+    for row in edited:
+        old = before.get(row["id"])
+        if old is None:
+            continue
+        for column in EDITABLE_COLUMNS:
+            if column not in row:
+                continue
+            old_value, new_value = _normalize(old.get(column)), _normalize(row[column])
+            if old_value != new_value:
+                changes.append((row["id"], column, old_value, new_value))
+    return changes
+
+
+def load_rows(conn: sqlite3.Connection, system_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Requirement rows for the grid: identity columns plus the editable ones."""
+    columns = ["id", "req_key", "system_id", "level"] + EDITABLE_COLUMNS
+    sql = f"SELECT {', '.join(columns)} FROM requirement"
+    params: Tuple = ()
+    if system_id is not None:
+        sql += " WHERE system_id = ?"
+        params = (system_id,)
+    return [dict(zip(columns, row)) for row in conn.execute(sql + " ORDER BY id", params)]
+
+
+def _apply(conn: sqlite3.Connection, changes: List[Change], reverse: bool = False) -> None:
+    # One UPDATE per requirement, guarded on the values the edit was based on
+    by_requirement: Dict[int, List[Change]] = {}
+    for change in changes:
+        by_requirement.setdefault(change[0], []).append(change)
+    for requirement_id, row_changes in by_requirement.items():
+        sets, guards, params, guard_params = [], [], [], []
+        for _, column, old_value, new_value in row_changes:
+            if column not in EDITABLE_COLUMNS:
+                raise ValueError(f"Column is not editable: {column}")
+            expected, value = (new_value, old_value) if reverse else (old_value, new_value)
+            sets.append(f"{column} = ?")
+            params.append(value)
+            # Empty cells normalize to None, but sync stores '' for empty text
+            guards.append(f"COALESCE({column}, '') IS COALESCE(?, '')")
+            guard_params.append(expected)
+        cur = conn.execute(
+            f"UPDATE requirement SET {', '.join(sets)} WHERE id = ? AND {' AND '.join(guards)}",
+            params + [requirement_id] + guard_params,
+        )
+        if cur.rowcount != 1:
+            raise EditConflict(f"Requirement {requirement_id} was changed by someone else")
+
+
+def apply_batch(conn: sqlite3.Connection, changes: List[Change]) -> Optional[int]:
+    """Apply all changes in one transaction and journal them; returns the batch id.
+
+    Nothing is written if any requirement no longer holds the old value.
+    """
+    if not changes:
+        return None
+    with conn:
+        _apply(conn, changes)
+        cur = conn.execute(
+            "INSERT INTO requirement_edit_batch(created_at, change_count) VALUES (?, ?)",
+            (datetime.now().strftime("%Y-%m-%d %H:%M:%S"), len(changes)),
+        )
+        batch_id = cur.lastrowid
+        conn.executemany(
+            "INSERT INTO requirement_edit(batch_id, requirement_id, column_name, old_value, new_value) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [(batch_id,) + change for change in changes],
+        )
+    return batch_id
+
+
+def last_batch(conn: sqlite3.Connection) -> Optional[Dict[str, Any]]:
+    """Most recent batch that has not been undone."""
+    row = conn.execute(
+        "SELECT batch_id, created_at, change_count FROM requirement_edit_batch "
+        "WHERE undone_at IS NULL ORDER BY batch_id DESC LIMIT 1"
+    ).fetchone()
+    if row is None:
+        return None
+    return {"batch_id": row[0], "created_at": row[1], "change_count": row[2]}
+
+
+def batch_changes(conn: sqlite3.Connection, batch_id: int) -> List[Change]:
+    return conn.execute(
+        "SELECT requirement_id, column_name, old_value, new_value FROM requirement_edit "
+        "WHERE batch_id = ?",
+        (batch_id,),
+    ).fetchall()
+
+
+def undo_last_batch(conn: sqlite3.Connection) -> Optional[int]:
+    """Restore the old values of the latest batch in one transaction; returns its id."""
+    batch = last_batch(conn)
+    if batch is None:
+        return None
+    with conn:
+        _apply(conn, batch_changes(conn, batch["batch_id"]), reverse=True)
+        conn.execute(
+            "UPDATE requirement_edit_batch SET undone_at = ? WHERE batch_id = ?",
+            (datetime.now().strftime("%Y-%m-%d %H:%M:%S"), batch["batch_id"]),
+        )
+    return batch["batch_id"]
@@ -0,0 +1,245 @@
+"""A requirements corpus spread over several JSON files, one per subsystem.
+
+Files matching PATTERN under the requirements directory are compiled to
+their snapshots (snapshot.py) in a process pool, each file on its own, and
+read back through loader.load_requirements_frame(), which caches every file
+by path, mtime and size. Editing one file therefore re-parses only that file;
+the merged frame is rebuilt from the cached per-file frames.
+
+The merged frame keeps every row and adds a Source File column. A
+requirement ID that appears in more than one file is an ID collision; those
+are reported alongside the frame rather than silently dropped.
+
+SYSENG_REQUIREMENTS_JSON, when set, pins the corpus to that one file.
+
+The app passes workers=1: forking its threaded process for a pool is not
+safe, so it compiles in-process like validation.py does; the CLIs use the
+pool.
+"""
+import argparse
+import importlib.util
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+REQUIREMENTS_DIR = Path(os.environ.get(
+    "SYSENG_REQUIREMENTS_DIR", Path(__file__).resolve().parents[2] / "data" / "requirements"
+))
+PATTERN = "*requirements*.json"
+SOURCE_COLUMN = "Source File"
+
+# Optional callback(name, hit) run on each corpus cache lookup; set by diagnostics
+on_cache = None
+
+_cache: Dict[Tuple, "Corpus"] = {}
+_slip_cache: Dict[Tuple, object] = {}
+_cache_lock = threading.Lock()
+
+
+def _load_module(name: str, filename: str):
+    # Loaded by path under the same name everywhere, like the pages do
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, str(Path(__file__).parent / filename))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+
+class Corpus:
+    """The merged requirements of several files, plus where each came from."""
+
+    def __init__(self, files: List[Path], frame: pd.DataFrame, collisions: pd.DataFrame):
+        self.files = files
+        self.frame = frame
+        self.collisions = collisions
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def status_as_of(self, date) -> pd.DataFrame:
+        """as_of.AsOfIndex.status_as_of() per file, concatenated in frame order."""
+        loader = _load_module("requirements_loader", "loader.py")
+        return pd.concat(
+            [loader.load_as_of_index(path).status_as_of(date) for path in self.files],
+            ignore_index=True,
+        )
+
+
+def discover(directory: Path = REQUIREMENTS_DIR, pattern: str = PATTERN) -> List[Path]:
+    """Requirement files in directory, sorted by name."""
+    return sorted(p for p in Path(directory).glob(pattern) if p.is_file())
+
+
+def corpus_files() -> List[Path]:
+    """The files the app reads: SYSENG_REQUIREMENTS_JSON if set, else the requirements directory."""
+    loader = _load_module("requirements_loader", "loader.py")
+    if "SYSENG_REQUIREMENTS_JSON" in os.environ:
+        return [loader.REQUIREMENTS_JSON]
+    return discover() or [loader.REQUIREMENTS_JSON]
+
+
+def _file_key(path: Path) -> Tuple[str, int, int]:
+    stat = path.stat()
+    return (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+def _compile(path: str) -> str:
+    # Worker: parse one file into its snapshot; the parent maps the result
+    _load_module("requirements_snapshot", "snapshot.py").load_snapshot(Path(path))
+    return path
+
+
+def _needs_compile(path: Path) -> bool:
+    snapshot = _load_module("requirements_snapshot", "snapshot.py")
+    snap_path = snapshot.default_snapshot_path(path)
+    if not snap_path.exists():
+        return True
+    try:
+        snap = snapshot.Snapshot(snap_path)
+        try:
+            return not snapshot.is_current(snap, path)
+        finally:
+            snap.close()
+    except (ValueError, KeyError):
+        return True
+
+
+def compile_files(files: Sequence[Path], workers: Optional[int] = None) -> List[Path]:
+    """Bring every file's snapshot up to date, in parallel; returns the files compiled.
+
+    workers defaults to the CPU count; 1 compiles in-process (the app).
+    """
+    stale = [Path(p) for p in files if _needs_compile(Path(p))]
+    workers = min(workers or os.cpu_count() or 1, len(stale))
+    if "fork" not in multiprocessing.get_all_start_methods():
+        workers = 1
+    if workers <= 1:
+        for path in stale:
+            _compile(str(path))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")) as pool:
+            list(pool.map(_compile, [str(p) for p in stale]))
+    return stale
+
+
+def find_collisions(frame: pd.DataFrame) -> pd.DataFrame:
+    """IDs present in more than one source file: ID, Files (comma separated), Count."""
+    dup = frame.loc[frame["ID"].duplicated(keep=False), ["ID", SOURCE_COLUMN]]
+    if dup.empty:
+        return pd.DataFrame({"ID": [], "Files": [], "Count": []})
+    grouped = dup.astype({SOURCE_COLUMN: str}).groupby("ID", sort=True)[SOURCE_COLUMN]
+    files = grouped.agg(lambda s: ", ".join(sorted(set(s))))
+    result = pd.DataFrame({"ID": files.index, "Files": files.to_numpy(), "Count": grouped.size().to_numpy()})
+    # Repeats within one file are the validator's duplicate_id, not a collision
+    return result[result["Files"].str.contains(", ", regex=False)].reset_index(drop=True)
+
+
+def load_corpus(files: Optional[Sequence[Path]] = None, workers: Optional[int] = None) -> Corpus:
+    """Parse (in parallel, only what changed) and merge the corpus files.
+
+    files defaults to corpus_files(). The Corpus is shared across the process
+    until one of its files changes; callers must not modify its frame.
+    """
+    files = [Path(p) for p in (files if files is not None else corpus_files())]
+    key = tuple(_file_key(p) for p in files)
+    with _cache_lock:
+        corpus = _cache.get(key)
+    if on_cache is not None:
+        on_cache("load_corpus", corpus is not None)
+    if corpus is not None:
+        return corpus
+
+    loader = _load_module("requirements_loader", "loader.py")
+    compile_files(files, workers)
+    names = [p.name for p in files]
+    frames = []
+    for i, path in enumerate(files):
+        df = loader.load_requirements_frame(path)
+        source = pd.Categorical.from_codes(np.full(len(df), i), categories=names)
+        frames.append(df.assign(**{SOURCE_COLUMN: source}))
+    frame = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+    corpus = Corpus(files, frame, find_collisions(frame))
+
+    with _cache_lock:
+        _cache.clear()
+        _cache[key] = corpus
+    return corpus
+
+
+def slip_analytics(files: Optional[Sequence[Path]] = None, workers: Optional[int] = None):
+    """slip.SlipAnalytics over every corpus file, merged in file order.
+
+    files defaults to corpus_files(). Shared like load_corpus(); callers must
+    not modify it.
+    """
+    files = [Path(p) for p in (files if files is not None else corpus_files())]
+    key = tuple(_file_key(p) for p in files)
+    with _cache_lock:
+        analytics = _slip_cache.get(key)
+    if on_cache is not None:
+        on_cache("slip_analytics", analytics is not None)
+    if analytics is not None:
+        return analytics
+
+    loader = _load_module("requirements_loader", "loader.py")
+    compile_files(files, workers)
+    analytics = _load_module("requirements_slip", "slip.py").combine(
+        [loader.load_slip_analytics(path) for path in files]
+    )
+
+    with _cache_lock:
+        _slip_cache.clear()
+        _slip_cache[key] = analytics
+    return analytics
+
+
+def history_frame(files: Sequence[Path], workers: Optional[int] = None) -> pd.DataFrame:
+    """snapshot.Snapshot.history_frame() of every file, merged for the burndown.
+
+    Colliding IDs are qualified with their file name so each file's
+    requirement keeps its own closure history.
+    """
+    files = [Path(p) for p in files]
+    snapshot = _load_module("requirements_snapshot", "snapshot.py")
+    compile_files(files, workers)
+    frames = []
+    for path in files:
+        df = snapshot.load_snapshot(path).history_frame()
+        df[SOURCE_COLUMN] = path.name
+        frames.append(df)
+    df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+    if len(files) > 1:
+        ids = df[["req_id", SOURCE_COLUMN]].drop_duplicates()
+        colliding = ids["req_id"][ids["req_id"].duplicated(keep=False)]
+        clash = df["req_id"].isin(set(colliding))
+        df.loc[clash, "req_id"] = df.loc[clash, SOURCE_COLUMN] + ":" + df.loc[clash, "req_id"]
+    return df
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load every requirements file in a directory as one corpus.")
+    parser.add_argument("directory", nargs="?", default=str(REQUIREMENTS_DIR))
+    parser.add_argument("--pattern", default=PATTERN)
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    files = discover(Path(args.directory), args.pattern)
+    if not files:
+        sys.exit(f"No files matching {args.pattern} in {args.directory}")
+    corpus = load_corpus(files, args.workers)
+    for name, count in corpus.frame[SOURCE_COLUMN].value_counts(sort=False).items():
+        print(f"{name}: {count} requirements")
+    print(f"{len(corpus)} requirements from {len(files)} files in {time.perf_counter() - t0:.2f}s")
+    if len(corpus.collisions):
+        print(f"{len(corpus.collisions)} IDs appear in more than one file:")
+        print(corpus.collisions.to_string(index=False))
@@ -0,0 +1,326 @@
+import sqlite3
+from typing import Any, Dict, List, Optional
+
+# Summary tables for verification coverage. They are kept current by triggers
+# on `requirement` and `requirement_verification`, so reading the matrix never
+# has to scan the link table. Requirements without a system are stored under
+# system_id 0.
+COVERAGE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS verification_coverage (
+    system_id INTEGER NOT NULL,
+    level TEXT NOT NULL,
+    verification_method_id INTEGER NOT NULL,
+    requirement_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY(system_id, level, verification_method_id)
+);
+
+CREATE TABLE IF NOT EXISTS verification_coverage_total (
+    system_id INTEGER NOT NULL,
+    level TEXT NOT NULL,
+    requirement_count INTEGER NOT NULL DEFAULT 0,
+    uncovered_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY(system_id, level)
+);
+
+CREATE TABLE IF NOT EXISTS verification_uncovered (
+    requirement_id INTEGER PRIMARY KEY,
+    system_id INTEGER NOT NULL,
+    level TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_verification_uncovered_system
+    ON verification_uncovered(system_id, level);
+
+-- --------------------------
+-- requirement: add / remove
+-- --------------------------
+CREATE TRIGGER IF NOT EXISTS trg_cov_requirement_insert
+AFTER INSERT ON requirement
+BEGIN
+    INSERT INTO verification_coverage_total(system_id, level, requirement_count, uncovered_count)
+    VALUES (
+        IFNULL(NEW.system_id, 0), NEW.level, 1,
+        NOT EXISTS (SELECT 1 FROM requirement_verification WHERE requirement_id = NEW.id)
+    )
+    ON CONFLICT(system_id, level) DO UPDATE SET
+        requirement_count = requirement_count + 1,
+        uncovered_count = uncovered_count + excluded.uncovered_count;
+
+    INSERT INTO verification_uncovered(requirement_id, system_id, level)
+    SELECT NEW.id, IFNULL(NEW.system_id, 0), NEW.level
+    WHERE NOT EXISTS (SELECT 1 FROM requirement_verification WHERE requirement_id = NEW.id);
+
+    INSERT INTO verification_coverage(system_id, level, verification_method_id, requirement_count)
+    SELECT IFNULL(NEW.system_id, 0), NEW.level, verification_method_id, 1
+    FROM requirement_verification WHERE requirement_id = NEW.id
+    ON CONFLICT(system_id, level, verification_method_id) DO UPDATE SET
+        requirement_count = requirement_count + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_cov_requirement_delete
+AFTER DELETE ON requirement
+BEGIN
+    UPDATE verification_coverage_total
+    SET requirement_count = requirement_count - 1,
+        uncovered_count = uncovered_count
+            - EXISTS (SELECT 1 FROM verification_uncovered WHERE requirement_id = OLD.id)
+    WHERE system_id = IFNULL(OLD.system_id, 0) AND level = OLD.level;
+
+    DELETE FROM verification_uncovered WHERE requirement_id = OLD.id;
+
+    UPDATE verification_coverage
+    SET requirement_count = requirement_count - 1
+    WHERE system_id = IFNULL(OLD.system_id, 0) AND level = OLD.level
+      AND verification_method_id IN (
+          SELECT verification_method_id FROM requirement_verification
+          WHERE requirement_id = OLD.id
+      );
+END;
+
+-- Moving a requirement to another system or level is a remove plus an add.
+CREATE TRIGGER IF NOT EXISTS trg_cov_requirement_update
+AFTER UPDATE OF id, system_id, level ON requirement
+BEGIN
+    UPDATE verification_coverage_total
+    SET requirement_count = requirement_count - 1,
+        uncovered_count = uncovered_count
+            - EXISTS (SELECT 1 FROM verification_uncovered WHERE requirement_id = OLD.id)
+    WHERE system_id = IFNULL(OLD.system_id, 0) AND level = OLD.level;
+
+    DELETE FROM verification_uncovered WHERE requirement_id = OLD.id;
+
+    UPDATE verification_coverage
+    SET requirement_count = requirement_count - 1
+    WHERE system_id = IFNULL(OLD.system_id, 0) AND level = OLD.level
+      AND verification_method_id IN (
+          SELECT verification_method_id FROM requirement_verification
+          WHERE requirement_id = OLD.id
+      );
+
+    INSERT INTO verification_coverage_total(system_id, level, requirement_count, uncovered_count)
+    VALUES (
+        IFNULL(NEW.system_id, 0), NEW.level, 1,
+        NOT EXISTS (SELECT 1 FROM requirement_verification WHERE requirement_id = NEW.id)
+    )
+    ON CONFLICT(system_id, level) DO UPDATE SET
+        requirement_count = requirement_count + 1,
+        uncovered_count = uncovered_count + excluded.uncovered_count;
+
+    INSERT INTO verification_uncovered(requirement_id, system_id, level)
+    SELECT NEW.id, IFNULL(NEW.system_id, 0), NEW.level
+    WHERE NOT EXISTS (SELECT 1 FROM requirement_verification WHERE requirement_id = NEW.id);
+
+    INSERT INTO verification_coverage(system_id, level, verification_method_id, requirement_count)
+    SELECT IFNULL(NEW.system_id, 0), NEW.level, verification_method_id, 1
+    FROM requirement_verification WHERE requirement_id = NEW.id
+    ON CONFLICT(system_id, level, verification_method_id) DO UPDATE SET
+        requirement_count = requirement_count + 1;
+END;
+
+-- --------------------------
+-- requirement_verification: link / unlink
+-- --------------------------
+CREATE TRIGGER IF NOT EXISTS trg_cov_link_insert
+AFTER INSERT ON requirement_verification
+BEGIN
+    INSERT INTO verification_coverage(system_id, level, verification_method_id, requirement_count)
+    SELECT IFNULL(r.system_id, 0), r.level, NEW.verification_method_id, 1
+    FROM requirement r WHERE r.id = NEW.requirement_id
+    ON CONFLICT(system_id, level, verification_method_id) DO UPDATE SET
+        requirement_count = requirement_count + 1;
+
+    UPDATE verification_coverage_total
+    SET uncovered_count = uncovered_count - 1
+    WHERE (system_id, level) = (
+        SELECT system_id, level FROM verification_uncovered
+        WHERE requirement_id = NEW.requirement_id
+    );
+
+    DELETE FROM verification_uncovered WHERE requirement_id = NEW.requirement_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_cov_link_delete
+AFTER DELETE ON requirement_verification
+BEGIN
+    UPDATE verification_coverage
+    SET requirement_count = requirement_count - 1
+    WHERE verification_method_id = OLD.verification_method_id
+      AND (system_id, level) = (
+          SELECT IFNULL(r.system_id, 0), r.level FROM requirement r
+          WHERE r.id = OLD.requirement_id
+      );
+
+    INSERT INTO verification_uncovered(requirement_id, system_id, level)
+    SELECT r.id, IFNULL(r.system_id, 0), r.level
+    FROM requirement r
+    WHERE r.id = OLD.requirement_id
+      AND NOT EXISTS (SELECT 1 FROM requirement_verification WHERE requirement_id = OLD.requirement_id);
+
+    UPDATE verification_coverage_total
+    SET uncovered_count = uncovered_count + 1
+    WHERE changes() > 0
+      AND (system_id, level) = (
+          SELECT system_id, level FROM verification_uncovered
+          WHERE requirement_id = OLD.requirement_id
+      );
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_cov_link_update
+AFTER UPDATE ON requirement_verification
+BEGIN
+    UPDATE verification_coverage
+    SET requirement_count = requirement_count - 1
+    WHERE verification_method_id = OLD.verification_method_id
+      AND (system_id, level) = (
+          SELECT IFNULL(r.system_id, 0), r.level FROM requirement r
+          WHERE r.id = OLD.requirement_id
+      );
+
+    INSERT INTO verification_uncovered(requirement_id, system_id, level)
+    SELECT r.id, IFNULL(r.system_id, 0), r.level
+    FROM requirement r
+    WHERE r.id = OLD.requirement_id
+      AND NOT EXISTS (SELECT 1 FROM requirement_verification WHERE requirement_id = OLD.requirement_id);
+
+    UPDATE verification_coverage_total
+    SET uncovered_count = uncovered_count + 1
+    WHERE changes() > 0
+      AND (system_id, level) = (
+          SELECT system_id, level FROM verification_uncovered
+          WHERE requirement_id = OLD.requirement_id
+      );
+
+    INSERT INTO verification_coverage(system_id, level, verification_method_id, requirement_count)
+    SELECT IFNULL(r.system_id, 0), r.level, NEW.verification_method_id, 1
+    FROM requirement r WHERE r.id = NEW.requirement_id
+    ON CONFLICT(system_id, level, verification_method_id) DO UPDATE SET
+        requirement_count = requirement_count + 1;
+
+    UPDATE verification_coverage_total
+    SET uncovered_count = uncovered_count - 1
+    WHERE (system_id, level) = (
+        SELECT system_id, level FROM verification_uncovered
+        WHERE requirement_id = NEW.requirement_id
+    );
+
+    DELETE FROM verification_uncovered WHERE requirement_id = NEW.requirement_id;
+END;
+"""
+
+COVERAGE_TABLES = [
+    "verification_uncovered",
+    "verification_coverage_total",
+    "verification_coverage",
+]
+
+
+def ensure_coverage(conn: sqlite3.Connection) -> bool:
+    """Create the coverage tables and triggers if missing.
+
+    Returns True when the schema was just installed (and backfilled from the
+    existing rows), False if it was already present.
+    """
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'verification_coverage_total'"
+    ).fetchone()
+    if exists:
+        return False
+    conn.executescript(COVERAGE_SCHEMA)
+    rebuild_coverage(conn)
+    return True
+
+
+def rebuild_coverage(conn: sqlite3.Connection) -> None:
+    """Recompute the coverage tables from scratch in one transaction.
+
+    Only needed to backfill an existing database or to repair drift; normal
+    writes are tracked by the triggers.
+    """
+    with conn:
+        for t in COVERAGE_TABLES:
+            conn.execute(f"DELETE FROM {t}")
+
+        conn.execute("""
+            INSERT INTO verification_uncovered(requirement_id, system_id, level)
+            SELECT r.id, IFNULL(r.system_id, 0), r.level
+            FROM requirement r
+            WHERE NOT EXISTS (
+                SELECT 1 FROM requirement_verification rv WHERE rv.requirement_id = r.id
+            )
+        """)
+
+        conn.execute("""
+            INSERT INTO verification_coverage_total(system_id, level, requirement_count, uncovered_count)
+            SELECT IFNULL(r.system_id, 0), r.level, COUNT(*), COUNT(u.requirement_id)
+            FROM requirement r
+            LEFT JOIN verification_uncovered u ON u.requirement_id = r.id
+            GROUP BY IFNULL(r.system_id, 0), r.level
+        """)
+
+        conn.execute("""
+            INSERT INTO verification_coverage(system_id, level, verification_method_id, requirement_count)
+            SELECT IFNULL(r.system_id, 0), r.level, rv.verification_method_id, COUNT(*)
+            FROM requirement_verification rv
+            JOIN requirement r ON r.id = rv.requirement_id
+            GROUP BY IFNULL(r.system_id, 0), r.level, rv.verification_method_id
+        """)
+
+
+def coverage_matrix(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
+    """Return one row per system and level with a count per verification method.
+
+    Reads only the summary tables, so the cost depends on the number of
+    systems, levels and methods, not on the number of requirements.
+    """
+    methods = conn.execute(
+        "SELECT id, name FROM verification_method ORDER BY id"
+    ).fetchall()
+    systems = dict(conn.execute("SELECT id, name FROM system").fetchall())
+
+    matrix = {}
+    for system_id, level, total, uncovered in conn.execute(
+        "SELECT system_id, level, requirement_count, uncovered_count "
+        "FROM verification_coverage_total WHERE requirement_count > 0 "
+        "ORDER BY system_id, level"
+    ):
+        row = {
+            "system_id": system_id,
+            "system": systems.get(system_id, "(unassigned)"),
+            "level": level,
+            "requirements": total,
+        }
+        for _, name in methods:
+            row[name] = 0
+        row["uncovered"] = uncovered
+        matrix[(system_id, level)] = row
+
+    method_names = dict(methods)
+    for system_id, level, method_id, count in conn.execute(
+        "SELECT system_id, level, verification_method_id, requirement_count "
+        "FROM verification_coverage"
+    ):
+        row = matrix.get((system_id, level))
+        if row is not None and method_id in method_names:
+            row[method_names[method_id]] = count
+
+    return list(matrix.values())
+
+
+def uncovered_requirements(
+    conn: sqlite3.Connection,
+    system_id: Optional[int] = None,
+    level: Optional[str] = None,
+) -> List[int]:
+    """Return IDs of requirements with no verification method."""
+    query = "SELECT requirement_id FROM verification_uncovered"
+    clauses, params = [], []
+    if system_id is not None:
+        clauses.append("system_id = ?")
+        params.append(system_id)
+    if level is not None:
+        clauses.append("level = ?")
+        params.append(level)
+    if clauses:
+        query += " WHERE " + " AND ".join(clauses)
+    query += " ORDER BY requirement_id"
+    return [rid for (rid,) in conn.execute(query, params)]
@@ -0,0 +1,164 @@
+import importlib.util
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Requirements corpus: SYSENG_REQUIREMENTS_JSON overrides the bundled sample
+DEFAULT_JSON = Path(__file__).resolve().parents[2] / "data" / "requirements" / "fun_requirements.json"
+REQUIREMENTS_JSON = Path(os.environ.get("SYSENG_REQUIREMENTS_JSON", DEFAULT_JSON))
+
+# Optional callback(path, nbytes) run after each file read; set by diagnostics
+on_read = None
+# Optional callback(name, hit) run on each shared-cache lookup; set by diagnostics
+on_cache = None
+
+_cache: Dict[Tuple[str, int, int], List[Dict[str, Any]]] = {}
+_frame_cache: Dict[Tuple[str, int, int], "pd.DataFrame"] = {}
+_as_of_cache: Dict[Tuple[str, int, int], Any] = {}
+_slip_cache: Dict[Tuple[str, int, int], Any] = {}
+_cache_lock = threading.Lock()
+
+
+def _load_module(name: str, filename: str):
+    # Loaded by path under the same name everywhere, like the pages do
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, str(Path(__file__).parent / filename))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+
+def _shared(cache: Dict[Tuple[str, int, int], Any], req_path: Path, build: Callable[[], Any], name: str) -> Any:
+    """build() once per version of req_path (path, mtime, size), shared across the process."""
+    stat = Path(req_path).stat()
+    key = (str(Path(req_path).resolve()), stat.st_mtime_ns, stat.st_size)
+    with _cache_lock:
+        hit = key in cache
+        value = cache.get(key)
+    if on_cache is not None:
+        on_cache(name, hit)
+    if hit:
+        return value
+    value = build()
+    with _cache_lock:
+        for old in [k for k in cache if k[0] == key[0]]:
+            del cache[old]
+        cache[key] = value
+    return value
+
+
+def flatten_requirements(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Flatten the nested JSON structure into one dict per requirement."""
+    requirements = []
+    for item in data:
+        for req_id, details in item.items():
+            req_dict = {
+                "ID": req_id,
+                "Name": details.get("name", ""),
+                "Description": details.get("description", ""),
+                "Priority": details.get("priority", ""),
+                "Status": details.get("status", ""),
+                "Tags": ", ".join(details.get("tags", [])),
+            }
+            # Add manager info from closure details if available
+            closure_details = details.get("Closure Details", [])
+            if closure_details:
+                req_dict["Closure Code"] = closure_details[-1].get("Closure Code", "")
+                req_dict["Closure Comments"] = closure_details[-1].get("Closure Comments", "")
+            requirements.append(req_dict)
+    return requirements
+
+
+def load_requirements(req_path: Path = REQUIREMENTS_JSON) -> List[Dict[str, Any]]:
+    """Load and flatten the requirements JSON file."""
+    with open(req_path, 'r') as f:
+        data = json.load(f)
+    if on_read is not None:
+        on_read(Path(req_path), Path(req_path).stat().st_size)
+    return flatten_requirements(data)
+
+
+def load_requirements_cached(req_path: Path = REQUIREMENTS_JSON) -> List[Dict[str, Any]]:
+    """load_requirements() shared across the process until the file changes.
+
+    The returned list is shared; callers must not modify it.
+    """
+    return _shared(_cache, req_path, lambda: load_requirements(req_path), "load_requirements_cached")
+
+
+def load_requirements_frame(req_path: Path = REQUIREMENTS_JSON) -> "pd.DataFrame":
+    """Requirements as a DataFrame, read from the compiled snapshot of req_path.
+
+    The snapshot (snapshot.py) is rebuilt when the JSON changes, so only the
+    first load after an edit pays for JSON parsing. Falls back to parsing the
+    JSON if the snapshot cannot be written. The frame is shared across the
+    process until the file changes; callers must not modify it.
+    """
+    def build():
+        try:
+            snapshot = _load_module("requirements_snapshot", "snapshot.py").load_snapshot(Path(req_path))
+            df = snapshot.requirements_frame()
+            if on_read is not None:
+                on_read(snapshot.path, snapshot.path.stat().st_size)
+            return df
+        except OSError:
+            import pandas as pd
+
+            return pd.DataFrame(load_requirements(req_path))
+
+    return _shared(_frame_cache, req_path, build, "load_requirements_frame")
+
+
+def load_as_of_index(req_path: Path = REQUIREMENTS_JSON):
+    """as_of.AsOfIndex over the Closure Details of req_path, shared like the frame.
+
+    Rows line up with load_requirements_frame(); both follow the JSON order.
+    """
+    def build():
+        snapshot = _load_module("requirements_snapshot", "snapshot.py").load_snapshot(Path(req_path))
+        return _load_module("requirements_as_of", "as_of.py").AsOfIndex.from_snapshot(snapshot)
+
+    return _shared(_as_of_cache, req_path, build, "load_as_of_index")
+
+
+def load_slip_analytics(req_path: Path = REQUIREMENTS_JSON):
+    """slip.SlipAnalytics over the Closure Details of req_path, shared like the frame.
+
+    slip.analyze() also caches by corpus hash, so touching the file without
+    changing it does not recompute anything.
+    """
+    def build():
+        snapshot = _load_module("requirements_snapshot", "snapshot.py").load_snapshot(Path(req_path))
+        return _load_module("requirements_slip", "slip.py").analyze(snapshot)
+
+    return _shared(_slip_cache, req_path, build, "load_slip_analytics")
+
+
+def filter_requirements(
+    df: "pd.DataFrame",
+    status: str = "All",
+    priority: str = "All",
+    tag: str = "All",
+) -> "pd.DataFrame":
+    """Apply the sidebar filters used by the View Requirements page."""
+    filtered_df = df.copy()
+
+    if status != "All":
+        filtered_df = filtered_df[filtered_df["Status"] == status]
+
+    if priority != "All":
+        filtered_df = filtered_df[filtered_df["Priority"] == priority]
+
+    if tag != "All":
+        filtered_df = filtered_df[
+            filtered_df["Tags"].str.contains(tag, na=False, case=False)
+        ]
+
+    return filtered_df
@@ -0,0 +1,366 @@
+"""Near-duplicate requirements from MinHash signatures and LSH banding.
+
+Descriptions are normalised (lowercase, single spaces) and cut into
+character shingles. A requirement's MinHash signature holds, for each of
+NUM_PERM multiply-shift hash functions, the smallest hash of any of its
+shingles; the share of equal slots between two signatures estimates the
+Jaccard similarity of their shingle sets.
+
+Signatures are stored next to the requirements in requirement_minhash.
+Triggers queue inserted and edited requirements in
+requirement_minhash_pending, and update_index() signs only those, so the
+index grows with the store instead of being rebuilt.
+
+Candidates come from LSH: each signature is cut into BANDS bands of ROWS
+slots, and requirements that agree on a whole band share a bucket. Only
+requirements sharing a bucket are ever compared, never all pairs.
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_DB = Path(os.environ.get("SYSENG_DB_PATH", Path(__file__).resolve().parents[2] / "data" / "systems_of_systems.db"))
+
+SHINGLE = 5  # characters
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SEED = 20240101
+DEFAULT_THRESHOLD = 0.8
+SIGN_BATCH = 20000  # requirements signed per transaction
+HASH_CHUNK = 1 << 18  # shingles hashed at once (x NUM_PERM uint64)
+
+# Changing any of these makes stored signatures incomparable; they are re-signed
+PARAMS = f"char{SHINGLE}:{NUM_PERM}:{SEED}"
+
+EMPTY = np.uint32(0xFFFFFFFF)  # every slot of a text with no shingles
+
+SIMILARITY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS requirement_minhash (
+    requirement_id INTEGER PRIMARY KEY,
+    signature BLOB NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS requirement_minhash_pending (
+    requirement_id INTEGER PRIMARY KEY
+);
+
+CREATE TABLE IF NOT EXISTS requirement_minhash_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_minhash_requirement_insert
+AFTER INSERT ON requirement
+BEGIN
+    INSERT OR IGNORE INTO requirement_minhash_pending(requirement_id) VALUES (NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_minhash_requirement_update
+AFTER UPDATE OF id, description ON requirement
+BEGIN
+    DELETE FROM requirement_minhash WHERE requirement_id = OLD.id;
+    INSERT OR IGNORE INTO requirement_minhash_pending(requirement_id) VALUES (NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_minhash_requirement_delete
+AFTER DELETE ON requirement
+BEGIN
+    DELETE FROM requirement_minhash WHERE requirement_id = OLD.id;
+    DELETE FROM requirement_minhash_pending WHERE requirement_id = OLD.id;
+END;
+"""
+
+_rng = np.random.default_rng(SEED)
+# Multiply-shift hashing: ((a * x + b) mod 2^64) >> 32, a odd
+_A = _rng.integers(0, 1 << 63, NUM_PERM, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+_B = _rng.integers(0, 1 << 63, NUM_PERM, dtype=np.uint64)
+_BAND_MIX = _rng.integers(0, 1 << 63, ROWS, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+
+
+# ------------------------------
+# Signatures
+# ------------------------------
+def _normalize(text: Optional[str]) -> bytes:
+    return " ".join((text or "").lower().split()).encode("utf-8")
+
+
+def signatures(texts: Sequence[Optional[str]]) -> np.ndarray:
+    """MinHash signatures, one uint32 row of NUM_PERM slots per text."""
+    encoded = [_normalize(t) for t in texts]
+    result = np.full((len(encoded), NUM_PERM), EMPTY, dtype=np.uint32)
+    counts = np.array([max(len(b) - SHINGLE + 1, 0) for b in encoded], dtype=np.int64)
+    # Texts shorter than one shingle are a single shingle of themselves
+    short = (counts == 0) & np.array([len(b) > 0 for b in encoded], dtype=bool)
+    counts[short] = 1
+    encoded = [b.ljust(SHINGLE, b" ") if s else b for b, s in zip(encoded, short)]
+    if not counts.sum():
+        return result
+
+    # Shingle values: SHINGLE bytes packed into one integer, never spanning two texts
+    buf = np.frombuffer(b"".join(encoded) + b"\0" * SHINGLE, dtype=np.uint8).astype(np.uint64)
+    values = np.zeros(len(buf) - SHINGLE, dtype=np.uint64)
+    for k in range(SHINGLE):
+        values |= buf[k:k + len(values)] << np.uint64(8 * k)
+    lengths = np.array([len(b) for b in encoded], dtype=np.int64)
+    text_start = np.cumsum(lengths) - lengths
+    docs = np.flatnonzero(counts)
+    positions = np.repeat(text_start[docs], counts[docs]) + (
+        np.arange(counts.sum()) - np.repeat(np.cumsum(counts[docs]) - counts[docs], counts[docs])
+    )
+    shingles = values[positions]
+
+    # Min-hash in chunks of whole documents so reduceat stays within one chunk
+    doc_end = np.cumsum(counts[docs])
+    lo_doc = 0
+    while lo_doc < len(docs):
+        lo = doc_end[lo_doc - 1] if lo_doc else 0
+        hi_doc = max(lo_doc + 1, int(np.searchsorted(doc_end, lo + HASH_CHUNK, side="right")))
+        hi = doc_end[hi_doc - 1]
+        hashed = (shingles[lo:hi, None] * _A[None, :] + _B[None, :]) >> np.uint64(32)
+        offsets = np.concatenate([[0], doc_end[lo_doc:hi_doc - 1] - lo])
+        result[docs[lo_doc:hi_doc]] = np.minimum.reduceat(hashed, offsets, axis=0).astype(np.uint32)
+        lo_doc = hi_doc
+    return result
+
+
+def band_keys(sigs: np.ndarray) -> np.ndarray:
+    """One int64 bucket key per (requirement, band)."""
+    bands = sigs.reshape(len(sigs), BANDS, ROWS).astype(np.uint64)
+    return (bands * _BAND_MIX).sum(axis=2, dtype=np.uint64).view(np.int64)
+
+
+def similarity(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Estimated Jaccard similarity of signature rows a[i] and b[i]."""
+    return (a == b).mean(axis=-1)
+
+
+# ------------------------------
+# Stored index
+# ------------------------------
+def ensure_similarity(conn: sqlite3.Connection) -> bool:
+    """Create the signature tables and triggers if missing, queueing every requirement.
+
+    Also re-queues everything if the stored signatures were made with other
+    parameters. Returns True when (re)installed.
+    """
+    installed = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'requirement_minhash_meta'"
+    ).fetchone()
+    if installed:
+        params = conn.execute("SELECT value FROM requirement_minhash_meta WHERE key = 'params'").fetchone()
+        if params and params[0] == PARAMS:
+            return False
+    with conn:
+        conn.executescript(SIMILARITY_SCHEMA)
+        conn.execute("DELETE FROM requirement_minhash")
+        conn.execute("INSERT OR IGNORE INTO requirement_minhash_pending(requirement_id) SELECT id FROM requirement")
+        conn.execute(
+            "INSERT OR REPLACE INTO requirement_minhash_meta(key, value) VALUES ('params', ?)", (PARAMS,)
+        )
+    return True
+
+
+def pending_count(conn: sqlite3.Connection) -> Optional[int]:
+    """Requirements waiting to be signed; None if the index is not installed."""
+    installed = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'requirement_minhash_pending'"
+    ).fetchone()
+    if not installed:
+        return None
+    return conn.execute("SELECT COUNT(*) FROM requirement_minhash_pending").fetchone()[0]
+
+
+def update_index(conn: sqlite3.Connection, progress: Optional[Callable[[float, str], None]] = None) -> int:
+    """Sign the queued requirements, SIGN_BATCH per transaction. Returns how many."""
+    total = conn.execute("SELECT COUNT(*) FROM requirement_minhash_pending").fetchone()[0]
+    done = 0
+    while True:
+        rows = conn.execute(
+            "SELECT p.requirement_id, r.description FROM requirement_minhash_pending p "
+            "LEFT JOIN requirement r ON r.id = p.requirement_id "
+            "ORDER BY p.requirement_id LIMIT ?",
+            (SIGN_BATCH,),
+        ).fetchall()
+        if not rows:
+            return done
+        ids = [r[0] for r in rows]
+        sigs = signatures([r[1] for r in rows])
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO requirement_minhash(requirement_id, signature) VALUES (?, ?)",
+                [(i, s.tobytes()) for i, s in zip(ids, sigs)],
+            )
+            conn.executemany("DELETE FROM requirement_minhash_pending WHERE requirement_id = ?", [(i,) for i in ids])
+        done += len(rows)
+        if progress is not None:
+            progress(done / max(total, 1), f"Signed {done} of {total} requirements")
+
+
+class SimilarityIndex:
+    """Signatures of the whole store in memory, with their LSH bucket keys."""
+
+    def __init__(self, ids: np.ndarray, sigs: np.ndarray):
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.sigs = sigs
+        self.keys = band_keys(sigs)
+        self._signed = sigs[:, 0] != EMPTY if len(sigs) else np.zeros(0, dtype=bool)
+
+    @classmethod
+    def load(cls, conn: sqlite3.Connection) -> "SimilarityIndex":
+        rows = conn.execute("SELECT requirement_id, signature FROM requirement_minhash ORDER BY requirement_id").fetchall()
+        ids = np.array([r[0] for r in rows], dtype=np.int64)
+        sigs = np.frombuffer(b"".join(r[1] for r in rows), dtype=np.uint32).reshape(len(rows), NUM_PERM)
+        return cls(ids, sigs)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def similar(
+        self,
+        signature: np.ndarray,
+        threshold: float = DEFAULT_THRESHOLD,
+        limit: int = 10,
+        exclude: Optional[int] = None,
+    ) -> List[Tuple[int, float]]:
+        """(requirement_id, similarity) of the closest matches to one signature."""
+        if signature[0] == EMPTY:
+            return []
+        keys = band_keys(signature[None, :])[0]
+        candidates = np.flatnonzero((self.keys == keys).any(axis=1) & self._signed)
+        sims = similarity(self.sigs[candidates], signature)
+        keep = (sims >= threshold) & (self.ids[candidates] != (exclude if exclude is not None else -1))
+        order = np.argsort(-sims[keep], kind="stable")[:limit]
+        return [(int(i), float(s)) for i, s in zip(self.ids[candidates][keep][order], sims[keep][order])]
+
+    def candidate_pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Row pairs sharing a bucket in some band, as a star per bucket.
+
+        Each member is paired with the bucket's first row rather than with
+        every other member, so large buckets of identical text stay linear.
+        """
+        left, right = [], []
+        signed = np.flatnonzero(self._signed)
+        for band in range(BANDS):
+            order = signed[np.argsort(self.keys[signed, band], kind="stable")]
+            keys = self.keys[order, band]
+            new_bucket = np.ones(len(order), dtype=bool)
+            new_bucket[1:] = keys[1:] != keys[:-1]
+            first = order[np.maximum.accumulate(np.where(new_bucket, np.arange(len(order)), 0))]
+            member = ~new_bucket
+            left.append(first[member])
+            right.append(order[member])
+        left, right = np.concatenate(left), np.concatenate(right)
+        # Identical text shares every band: keep each pair once
+        pairs = np.unique(left * len(self.ids) + right)
+        return pairs // len(self.ids), pairs % len(self.ids)
+
+    def duplicate_groups(self, threshold: float = DEFAULT_THRESHOLD) -> pd.DataFrame:
+        """Groups of near-duplicates: group, requirement_id and similarity to the group's first requirement."""
+        left, right = self.candidate_pairs()
+        sims = np.concatenate([
+            similarity(self.sigs[left[i:i + HASH_CHUNK]], self.sigs[right[i:i + HASH_CHUNK]])
+            for i in range(0, len(left), HASH_CHUNK)
+        ]) if len(left) else np.zeros(0)
+        keep = sims >= threshold
+
+        # Union-find over the confirmed pairs
+        parent = np.arange(len(self.ids))
+
+        def root(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for a, b in zip(left[keep].tolist(), right[keep].tolist()):
+            ra, rb = root(a), root(b)
+            if ra != rb:
+                parent[max(ra, rb)] = min(ra, rb)
+        roots = np.array([root(i) for i in range(len(parent))], dtype=np.int64) if len(parent) else parent
+        sizes = np.bincount(roots, minlength=len(parent))
+        members = np.flatnonzero(sizes[roots] > 1)
+        if not len(members):
+            return pd.DataFrame({"group": [], "requirement_id": [], "similarity": [], "group size": []})
+
+        # Largest groups first; group numbers follow that order
+        rep = roots[members]
+        order = np.lexsort((members, rep, -sizes[rep]))
+        members, rep = members[order], rep[order]
+        group = np.cumsum(np.concatenate([[True], rep[1:] != rep[:-1]]))
+        return pd.DataFrame({
+            "group": group,
+            "requirement_id": self.ids[members],
+            "similarity": similarity(self.sigs[members], self.sigs[rep]).round(3),
+            "group size": sizes[rep],
+        })
+
+
+# ------------------------------
+# Reports
+# ------------------------------
+def _requirement_labels(conn: sqlite3.Connection, ids: Optional[List[int]] = None) -> pd.DataFrame:
+    """requirement_id, requirement (req_key, or #id if never synced), system and description."""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(requirement)")}
+    key = "COALESCE(r.req_key, '#' || r.id)" if "req_key" in columns else "'#' || r.id"
+    where = f"WHERE r.id IN ({', '.join('?' * len(ids))})" if ids is not None else ""
+    return pd.read_sql_query(
+        f"SELECT r.id AS requirement_id, {key} AS requirement, s.name AS system, r.description "
+        f"FROM requirement r LEFT JOIN system s ON s.id = r.system_id {where}",
+        conn,
+        params=ids,
+    )
+
+
+def similar_requirements(
+    conn: sqlite3.Connection,
+    index: SimilarityIndex,
+    text: str,
+    threshold: float = DEFAULT_THRESHOLD,
+    limit: int = 10,
+    exclude_key: Optional[str] = None,
+) -> pd.DataFrame:
+    """Stored requirements whose description is a near-duplicate of text."""
+    matches = index.similar(signatures([text])[0], threshold, limit + 1)
+    df = pd.DataFrame(matches, columns=["requirement_id", "similarity"])
+    if df.empty:
+        return df.assign(requirement=[], system=[], description=[])
+    df = df.merge(_requirement_labels(conn, df["requirement_id"].tolist()), on="requirement_id", how="left")
+    if exclude_key is not None:
+        df = df[df["requirement"] != exclude_key]
+    return df.head(limit)[["requirement", "system", "similarity", "description"]]
+
+
+def duplicate_report(conn: sqlite3.Connection, threshold: float = DEFAULT_THRESHOLD) -> pd.DataFrame:
+    """Every near-duplicate group in the store, one row per member."""
+    groups = SimilarityIndex.load(conn).duplicate_groups(threshold)
+    report = groups.merge(_requirement_labels(conn), on="requirement_id", how="left")
+    return report[["group", "group size", "requirement", "system", "similarity", "description"]]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Find near-duplicate requirements in the requirement store.")
+    parser.add_argument("--db", default=str(DEFAULT_DB), help="SQLite database")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Minimum estimated similarity")
+    parser.add_argument("--out", default=None, help="Write the report as CSV here instead of a summary")
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.db)
+    t0 = time.perf_counter()
+    ensure_similarity(conn)
+    signed = update_index(conn)
+    t1 = time.perf_counter()
+    report = duplicate_report(conn, args.threshold)
+    conn.close()
+    print(f"Signed {signed} requirements in {t1 - t0:.2f}s; grouped in {time.perf_counter() - t1:.2f}s", file=sys.stderr)
+
+    if args.out:
+        report.to_csv(args.out, index=False)
+    print(f"{report['group'].nunique()} groups, {len(report)} requirements")
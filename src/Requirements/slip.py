@@ -0,0 +1,251 @@
+"""Schedule slip and replan analytics over the full Closure Details history.
+
+Every Closure Details entry is one plan iteration: its slip is Replanned
+Date minus Baseline Date, and every entry after a requirement's first is a
+replan. A requirement's time to close runs from its first Baseline Date to
+the Closure Date of a final Closed entry.
+
+Everything is computed column-wise from the requirements snapshot
+(snapshot.py) and cached by the corpus hash in the snapshot header, so the
+same corpus is analysed once per process however often the file is
+touched or the page reruns.
+"""
+import hashlib
+import sqlite3
+import threading
+from typing import Dict, Sequence
+
+import numpy as np
+import pandas as pd
+
+ROLLUP_COLUMNS = [
+    "requirements", "replanned", "replans", "entries",
+    "mean slip", "median slip", "p90 slip", "total slip", "median days to close",
+]
+UNASSIGNED = "(unassigned)"
+HISTOGRAM_BIN_DAYS = 7
+
+_cache: Dict[str, "SlipAnalytics"] = {}
+_cache_lock = threading.Lock()
+
+
+class SlipAnalytics:
+    """Entry- and requirement-level slip tables for one corpus, plus rollups."""
+
+    def __init__(self, snapshot):
+        self.source_sha256 = snapshot.header["source_sha256"]
+        start = np.asarray(snapshot.column("history_start"), dtype=np.int64)
+        req_row = np.asarray(snapshot.column("req_row"), dtype=np.int64)
+        baseline = np.asarray(snapshot.column("baseline_date"), dtype="datetime64[D]")
+        replanned = np.asarray(snapshot.column("replanned_date"), dtype="datetime64[D]")
+        closure = np.asarray(snapshot.column("closure_date"), dtype="datetime64[D]")
+        code = snapshot.categorical("closure_code")
+
+        # One row per Closure Details entry
+        slip = (replanned - baseline).astype("timedelta64[D]").astype(float)
+        slip[np.isnat(replanned) | np.isnat(baseline)] = np.nan
+        self.entries = pd.DataFrame({
+            "req_row": req_row,
+            "entry": np.arange(len(req_row)) - start[req_row],
+            "slip days": slip,
+        })
+
+        # One row per requirement, from its first and last entries
+        counts = np.diff(start)
+        has_history = counts > 0
+        first = np.where(has_history, start[:-1], 0)
+        last = np.where(has_history, start[1:] - 1, 0)
+        n = len(counts)
+        first_baseline = np.full(n, np.datetime64("NaT"), dtype="datetime64[D]")
+        closed_on = np.full(n, np.datetime64("NaT"), dtype="datetime64[D]")
+        if len(req_row):
+            first_baseline[has_history] = baseline[first[has_history]]
+            final_closed = has_history & (np.asarray(code.codes)[last] == _category_code(code, "Closed"))
+            closed_on[final_closed] = closure[last[final_closed]]
+        days_to_close = (closed_on - first_baseline).astype("timedelta64[D]").astype(float)
+        days_to_close[np.isnat(closed_on) | np.isnat(first_baseline)] = np.nan
+        self.requirements = pd.DataFrame({
+            "ID": snapshot.column("id").to_list(),
+            "Priority": snapshot.categorical("priority"),
+            "Tags": snapshot.column("tags").to_list(),
+            "replans": np.maximum(counts - 1, 0),
+            "total slip": np.bincount(req_row, weights=np.nan_to_num(slip), minlength=n),
+            "days to close": days_to_close,
+        })
+
+        self._rollups: Dict[str, pd.DataFrame] = {}
+
+    # ------------------------------
+    # Rollups
+    # ------------------------------
+    def _rollup(self, pair_req: np.ndarray, pair_group: np.ndarray, names) -> pd.DataFrame:
+        """Roll up requirements and their entries by group.
+
+        (pair_req[i], pair_group[i]) puts requirement row pair_req[i] in group
+        code pair_group[i]; a requirement may be in several groups. names[code]
+        labels the groups.
+        """
+        n_groups = len(names)
+        replans = self.requirements["replans"].to_numpy()[pair_req]
+        close = self.requirements["days to close"].to_numpy()[pair_req]
+
+        # Entries follow their requirement into each of its groups
+        order = np.argsort(pair_req, kind="stable")
+        sorted_group = pair_group[order]
+        per_req = np.bincount(pair_req, minlength=len(self.requirements))
+        req_start = np.cumsum(per_req) - per_req
+        entry_req = self.entries["req_row"].to_numpy()
+        k = per_req[entry_req]
+        entry_ids = np.repeat(np.arange(len(entry_req)), k)
+        within = np.arange(len(entry_ids)) - np.repeat(np.cumsum(k) - k, k)
+        entry_group = sorted_group[req_start[entry_req[entry_ids]] + within]
+        slip = self.entries["slip days"].to_numpy()[entry_ids]
+
+        close_stats = _group_stats(pair_group, close, n_groups, (0.5,))
+        slip_stats = _group_stats(entry_group, slip, n_groups, (0.5, 0.9))
+        df = pd.DataFrame({
+            "requirements": np.bincount(pair_group, minlength=n_groups),
+            "replanned": np.bincount(pair_group, weights=replans > 0, minlength=n_groups).astype(int),
+            "replans": np.bincount(pair_group, weights=replans, minlength=n_groups).astype(int),
+            "entries": np.bincount(entry_group, minlength=n_groups),
+            "mean slip": slip_stats["mean"],
+            "median slip": slip_stats[0.5],
+            "p90 slip": slip_stats[0.9],
+            "total slip": slip_stats["sum"],
+            "median days to close": close_stats[0.5],
+        }, index=pd.Index(names, name="group"))
+        return df[df["requirements"] > 0][ROLLUP_COLUMNS].round(1)
+
+    def by_priority(self) -> pd.DataFrame:
+        if "priority" not in self._rollups:
+            codes, names = pd.factorize(self.requirements["Priority"].astype(object).fillna(""), sort=True)
+            self._rollups["priority"] = self._rollup(np.arange(len(codes)), codes, names)
+        return self._rollups["priority"]
+
+    def by_tag(self) -> pd.DataFrame:
+        """Requirements with several tags count once under each of them."""
+        if "tag" not in self._rollups:
+            # Few distinct tag combinations: split those, not every requirement
+            combo, combos = pd.factorize(self.requirements["Tags"])
+            tag_codes: Dict[str, int] = {}
+            combo_tags = [
+                [tag_codes.setdefault(t, len(tag_codes)) for t in c.split(", ") if t]
+                for c in combos
+            ]
+            sizes = np.array([len(t) for t in combo_tags], dtype=np.int64)
+            flat = np.array([t for tags in combo_tags for t in tags], dtype=np.int64)
+            starts = np.cumsum(sizes) - sizes
+            k = sizes[combo]
+            pair_req = np.repeat(np.arange(len(combo)), k)
+            within = np.arange(len(pair_req)) - np.repeat(np.cumsum(k) - k, k)
+            pair_group = flat[starts[combo[pair_req]] + within]
+            names = np.array(list(tag_codes), dtype=object)
+            self._rollups["tag"] = self._rollup(pair_req, pair_group, names).sort_index()
+        return self._rollups["tag"]
+
+    def by_owner(self, owners: Dict[str, str]) -> pd.DataFrame:
+        """owners maps requirement ID to owner; see load_owners()."""
+        groups = self.requirements["ID"].map(owners).fillna(UNASSIGNED).replace("", UNASSIGNED)
+        codes, names = pd.factorize(groups, sort=True)
+        return self._rollup(np.arange(len(codes)), codes, names)
+
+    # ------------------------------
+    # Distributions and lists
+    # ------------------------------
+    def summary(self) -> Dict[str, float]:
+        slip = self.entries["slip days"]
+        close = self.requirements["days to close"]
+        return {
+            "requirements": len(self.requirements),
+            "entries": len(self.entries),
+            "replanned": int((self.requirements["replans"] > 0).sum()),
+            "replans": int(self.requirements["replans"].sum()),
+            "mean slip": float(slip.mean()) if slip.notna().any() else 0.0,
+            "median days to close": float(close.median()) if close.notna().any() else float("nan"),
+        }
+
+    def histogram(self, column: str) -> pd.DataFrame:
+        """Weekly-binned counts of `slip days` (entries) or `days to close` (requirements)."""
+        values = (self.entries if column == "slip days" else self.requirements)[column].dropna().to_numpy()
+        if not len(values):
+            return pd.DataFrame({"days": [], "count": []})
+        low = np.floor(values.min() / HISTOGRAM_BIN_DAYS) * HISTOGRAM_BIN_DAYS
+        high = np.floor(values.max() / HISTOGRAM_BIN_DAYS) * HISTOGRAM_BIN_DAYS + HISTOGRAM_BIN_DAYS
+        counts, edges = np.histogram(values, bins=np.arange(low, high + 1, HISTOGRAM_BIN_DAYS))
+        return pd.DataFrame({"days": edges[:-1].astype(int), "count": counts})
+
+    def most_slipped(self, limit: int = 50) -> pd.DataFrame:
+        return self.requirements.nlargest(limit, "total slip")[
+            ["ID", "Priority", "Tags", "replans", "total slip", "days to close"]
+        ]
+
+
+def _group_stats(groups: np.ndarray, values: np.ndarray, n_groups: int, quantiles=()) -> Dict:
+    """Per-group sum, mean and linear-interpolated quantiles of whole-day values, ignoring NaN."""
+    valid = ~np.isnan(values)
+    groups, values = groups[valid], values[valid]
+    count = np.bincount(groups, minlength=n_groups)
+    total = np.bincount(groups, weights=values, minlength=n_groups)
+    stats = {"sum": total, "mean": np.divide(total, count, out=np.full(n_groups, np.nan), where=count > 0)}
+    # Whole days: one int64 sort on (group, value) keys instead of a lexsort
+    low = values.min() if len(values) else 0.0
+    span = int(values.max() - low) + 1 if len(values) else 1
+    keys = groups.astype(np.int64) * span + (values - low).astype(np.int64)
+    ordered = (np.sort(keys) % span + low).astype(float)
+    start = np.cumsum(count) - count
+    has = count > 0
+    for q in quantiles:
+        pos = start + (count - 1) * q
+        lo, hi = np.floor(pos).astype(np.int64), np.ceil(pos).astype(np.int64)
+        result = np.full(n_groups, np.nan)
+        result[has] = ordered[lo[has]] + (ordered[hi[has]] - ordered[lo[has]]) * (pos[has] - lo[has])
+        stats[q] = result
+    return stats
+
+
+def _category_code(categorical: pd.Categorical, value: str) -> int:
+    categories = list(categorical.categories)
+    return categories.index(value) if value in categories else -2
+
+
+def combine(parts: Sequence[SlipAnalytics]) -> SlipAnalytics:
+    """One SlipAnalytics over several files' analytics, requirements in the given order."""
+    if len(parts) == 1:
+        return parts[0]
+    combined = SlipAnalytics.__new__(SlipAnalytics)
+    combined.source_sha256 = hashlib.sha256(
+        "".join(part.source_sha256 for part in parts).encode("ascii")
+    ).hexdigest()
+    offsets = np.cumsum([0] + [len(part.requirements) for part in parts[:-1]])
+    combined.entries = pd.concat(
+        [part.entries.assign(req_row=part.entries["req_row"] + offset) for part, offset in zip(parts, offsets)],
+        ignore_index=True,
+    )
+    combined.requirements = pd.concat([part.requirements for part in parts], ignore_index=True)
+    combined._rollups = {}
+    return combined
+
+
+def analyze(snapshot) -> SlipAnalytics:
+    """SlipAnalytics for a snapshot, computed once per corpus hash."""
+    key = snapshot.header["source_sha256"]
+    with _cache_lock:
+        if key in _cache:
+            return _cache[key]
+    analytics = SlipAnalytics(snapshot)
+    with _cache_lock:
+        # Keep the latest few corpora; older versions are not coming back
+        while len(_cache) >= 4:
+            _cache.pop(next(iter(_cache)))
+        _cache[key] = analytics
+    return analytics
+
+
+def load_owners(conn: sqlite3.Connection) -> Dict[str, str]:
+    """Requirement ID -> owner from the requirement store (synced rows only)."""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(requirement)")}
+    if "req_key" not in columns:
+        return {}
+    return dict(conn.execute(
+        "SELECT req_key, owner FROM requirement WHERE req_key IS NOT NULL AND owner IS NOT NULL"
+    ))
@@ -0,0 +1,352 @@
+"""Compiled, memory-mapped snapshot of a requirements JSON corpus.
+
+File layout (all sections 64-byte aligned):
+
+    magic "SYSSNAP1" | header length (uint64 LE) | JSON header | column data
+
+Column offsets in the header are relative to the start of the column data.
+
+The header records the source file's sha256, size and mtime, the row counts,
+the category tables and the offset/dtype of every column. Requirement
+columns have one row per requirement and history columns one row per
+Closure Details entry. Low-cardinality text (priority, status, closure
+code) is stored as int16 codes into a category table, dates as
+datetime64[s] and free text as a string table (int64 offsets plus UTF-8
+bytes). A date that does not parse is NaT in its column; its raw text is
+kept in a sparse side table (<column>_invalid_row, <column>_invalid) so it
+can still be shown and reported. Readers map the file read-only, so every
+process opening the same snapshot shares its pages.
+"""
+import argparse
+import hashlib
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+MAGIC = b"SYSSNAP1"
+VERSION = 2
+ALIGN = 64
+
+CATEGORY_COLUMNS = ["priority", "status", "closure_code"]
+# Snapshot column -> Closure Details key
+DATE_COLUMNS = {"baseline_date": "Baseline Date", "replanned_date": "Replanned Date", "closure_date": "Closure Date"}
+
+
+def default_snapshot_path(json_path: Path) -> Path:
+    return Path(json_path).with_suffix(".snap")
+
+
+def _file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _pad(n: int) -> int:
+    return (-n) % ALIGN
+
+
+# ------------------------------
+# Writing
+# ------------------------------
+class _Writer:
+    def __init__(self):
+        self.blobs: List[bytes] = []
+        self.offset = 0
+        self.columns: Dict[str, Dict[str, Any]] = {}
+
+    def _add(self, data: bytes) -> int:
+        start = self.offset
+        self.blobs.append(data)
+        self.blobs.append(b"\0" * _pad(len(data)))
+        self.offset += len(data) + _pad(len(data))
+        return start
+
+    def array(self, name: str, values: np.ndarray) -> None:
+        values = np.ascontiguousarray(values)
+        self.columns[name] = {
+            "kind": "array",
+            "dtype": values.dtype.str,
+            "offset": self._add(values.tobytes()),
+            "length": len(values),
+        }
+
+    def strings(self, name: str, values: List[str]) -> None:
+        encoded = [v.encode("utf-8") for v in values]
+        offsets = np.zeros(len(encoded) + 1, dtype="<i8")
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+        self.columns[name] = {
+            "kind": "strings",
+            "offsets": self._add(offsets.tobytes()),
+            "data": self._add(b"".join(encoded)),
+            "length": len(encoded),
+        }
+
+
+def _codes(values: List[Optional[str]], categories: Dict[str, int]) -> np.ndarray:
+    # -1 marks a missing value
+    out = np.empty(len(values), dtype="<i2")
+    for i, v in enumerate(values):
+        if v is None:
+            out[i] = -1
+        else:
+            out[i] = categories.setdefault(v, len(categories))
+    return out
+
+
+def _dates(values: List[Optional[str]]) -> Tuple[np.ndarray, Dict[int, str]]:
+    """Parsed dates plus {row: raw text} of the non-empty values that did not parse."""
+    import pandas as pd
+
+    # Same coercion as fun_burndown.py: unparseable or empty dates become NaT
+    parsed = pd.to_datetime(pd.Series(values, dtype=object), errors="coerce").to_numpy(dtype="datetime64[s]")
+    invalid = {}
+    for i in np.flatnonzero(np.isnat(parsed)).tolist():
+        if values[i] not in (None, ""):
+            invalid[i] = str(values[i])
+    return parsed, invalid
+
+
+def build_snapshot(json_path: Path, snap_path: Optional[Path] = None) -> Path:
+    """Compile `json_path` into a snapshot file; returns its path."""
+    json_path = Path(json_path)
+    snap_path = Path(snap_path) if snap_path else default_snapshot_path(json_path)
+    stat = json_path.stat()
+    raw = json_path.read_bytes()
+    data = json.loads(raw)
+
+    req = {"id": [], "name": [], "description": [], "tags": [], "priority": [], "status": []}
+    hist = {"req_row": [], "closure_code": [], "closure_comments": [], **{c: [] for c in DATE_COLUMNS}}
+    history_start = [0]
+    for item in data:
+        for req_id, values in item.items():
+            row = len(req["id"])
+            req["id"].append(req_id)
+            req["name"].append(values.get("name", ""))
+            req["description"].append(values.get("description", ""))
+            req["tags"].append(", ".join(values.get("tags", [])))
+            req["priority"].append(values.get("priority", ""))
+            req["status"].append(values.get("status", ""))
+            for cd in values.get("Closure Details", []):
+                hist["req_row"].append(row)
+                hist["closure_code"].append(cd.get("Closure Code"))
+                hist["closure_comments"].append(cd.get("Closure Comments") or "")
+                for column, key in DATE_COLUMNS.items():
+                    hist[column].append(cd.get(key))
+            history_start.append(len(hist["req_row"]))
+
+    categories: Dict[str, Dict[str, int]] = {c: {} for c in CATEGORY_COLUMNS}
+    w = _Writer()
+    for column in ("id", "name", "description", "tags"):
+        w.strings(column, req[column])
+    w.array("priority", _codes(req["priority"], categories["priority"]))
+    w.array("status", _codes(req["status"], categories["status"]))
+    w.array("history_start", np.asarray(history_start, dtype="<i8"))
+    w.array("req_row", np.asarray(hist["req_row"], dtype="<i4"))
+    w.array("closure_code", _codes(hist["closure_code"], categories["closure_code"]))
+    for column in DATE_COLUMNS:
+        parsed, invalid = _dates(hist[column])
+        w.array(column, parsed)
+        w.array(f"{column}_invalid_row", np.asarray(list(invalid), dtype="<i8"))
+        w.strings(f"{column}_invalid", list(invalid.values()))
+    w.strings("closure_comments", hist["closure_comments"])
+
+    header = json.dumps({
+        "version": VERSION,
+        "source": str(json_path.resolve()),
+        "source_sha256": hashlib.sha256(raw).hexdigest(),
+        "source_size": stat.st_size,
+        "source_mtime_ns": stat.st_mtime_ns,
+        "requirements": len(req["id"]),
+        "history": len(hist["req_row"]),
+        "categories": {c: list(v) for c, v in categories.items()},
+        "columns": w.columns,
+    }).encode("utf-8")
+    prefix = MAGIC + struct.pack("<Q", len(header)) + header
+    prefix += b"\0" * _pad(len(prefix))
+
+    # Write beside the target and rename, so readers never see a partial file
+    tmp = snap_path.with_name(f"{snap_path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(prefix)
+        for blob in w.blobs:
+            f.write(blob)
+    os.replace(tmp, snap_path)
+    return snap_path
+
+
+# ------------------------------
+# Reading
+# ------------------------------
+class StringColumn:
+    """Read-only view of a string table; entries are decoded on access."""
+
+    def __init__(self, offsets: np.ndarray, data: np.ndarray):
+        self.offsets = offsets
+        self.data = data
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        return self.data[self.offsets[i]:self.offsets[i + 1]].tobytes().decode("utf-8")
+
+    def to_list(self) -> List[str]:
+        blob = self.data.tobytes()
+        bounds = self.offsets.tolist()
+        text = blob.decode("utf-8")
+        if len(text) != len(blob):
+            # Multi-byte characters: byte offsets no longer index the decoded text
+            return [blob[bounds[i]:bounds[i + 1]].decode("utf-8") for i in range(len(bounds) - 1)]
+        return [text[bounds[i]:bounds[i + 1]] for i in range(len(bounds) - 1)]
+
+
+class Snapshot:
+    """A snapshot file mapped read-only; array columns are zero-copy views."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._map = np.memmap(self.path, dtype=np.uint8, mode="r")
+        if self._map[:8].tobytes() != MAGIC:
+            raise ValueError(f"{self.path} is not a requirements snapshot")
+        (length,) = struct.unpack("<Q", self._map[8:16].tobytes())
+        self.header: Dict[str, Any] = json.loads(self._map[16:16 + length].tobytes())
+        if self.header["version"] != VERSION:
+            raise ValueError(f"{self.path} has snapshot version {self.header['version']}, expected {VERSION}")
+        self.categories: Dict[str, List[str]] = self.header["categories"]
+        self._base = 16 + length + _pad(16 + length)
+
+    @property
+    def n_requirements(self) -> int:
+        return self.header["requirements"]
+
+    @property
+    def n_history(self) -> int:
+        return self.header["history"]
+
+    def _view(self, offset: int, dtype: str, length: int) -> np.ndarray:
+        dtype = np.dtype(dtype)
+        start = self._base + offset
+        return self._map[start:start + dtype.itemsize * length].view(dtype)
+
+    def column(self, name: str) -> Union[np.ndarray, StringColumn]:
+        spec = self.header["columns"][name]
+        if spec["kind"] == "strings":
+            offsets = self._view(spec["offsets"], "<i8", spec["length"] + 1)
+            start = self._base + spec["data"]
+            return StringColumn(offsets, self._map[start:start + int(offsets[-1])])
+        return self._view(spec["offset"], spec["dtype"], spec["length"])
+
+    def categorical(self, name: str):
+        """A category column as pandas.Categorical (missing values as NaN)."""
+        import pandas as pd
+
+        return pd.Categorical.from_codes(self.column(name), categories=self.categories[name])
+
+    def requirements_frame(self):
+        """One row per requirement, in the layout of loader.flatten_requirements()."""
+        import pandas as pd
+
+        start = self.column("history_start")
+        has_history = start[1:] > start[:-1]
+        df = pd.DataFrame({
+            "ID": self.column("id").to_list(),
+            "Name": self.column("name").to_list(),
+            "Description": self.column("description").to_list(),
+            "Priority": np.asarray(self.categorical("priority"), dtype=object),
+            "Status": np.asarray(self.categorical("status"), dtype=object),
+            "Tags": self.column("tags").to_list(),
+        })
+        if has_history.any():
+            # Like the loader, show the most recent closure entry
+            last = np.where(has_history, start[1:] - 1, 0)
+            codes = np.asarray(self.categorical("closure_code"), dtype=object)
+            codes[pd.isna(codes)] = ""
+            comments = np.asarray(self.column("closure_comments").to_list(), dtype=object)
+            df["Closure Code"] = np.where(has_history, codes[last], None)
+            df["Closure Comments"] = np.where(has_history, comments[last], None)
+        return df
+
+    def invalid_dates(self, column: str) -> Dict[int, str]:
+        """History row -> raw text, for the dates of `column` that did not parse (NaT in the column)."""
+        rows = self.column(f"{column}_invalid_row").tolist()
+        return dict(zip(rows, self.column(f"{column}_invalid").to_list()))
+
+    def invalid_dates_frame(self):
+        """Every date that did not parse: req_id, entry (index in Closure Details), field and raw value."""
+        import pandas as pd
+
+        start = self.column("history_start")
+        req_row = self.column("req_row")
+        ids = self.column("id")
+        rows = []
+        for column, key in DATE_COLUMNS.items():
+            for row, value in self.invalid_dates(column).items():
+                req = int(req_row[row])
+                rows.append((ids[req], row - int(start[req]), key, value))
+        rows.sort(key=lambda r: (r[0], r[1]))
+        return pd.DataFrame(rows, columns=["req_id", "entry", "field", "value"])
+
+    def history_frame(self):
+        """One row per closure entry with the columns fun_burndown.py works on.
+
+        Dates that did not parse are NaT here; see invalid_dates_frame().
+        """
+        import pandas as pd
+
+        req_row = self.column("req_row")
+        ids = np.asarray(self.column("id").to_list(), dtype=object)
+        df = pd.DataFrame({
+            "req_id": ids[req_row],
+            "Closure Code": self.categorical("closure_code"),
+        })
+        for column, key in DATE_COLUMNS.items():
+            df[key] = self.column(column)
+        return df
+
+    def close(self) -> None:
+        self._map._mmap.close()
+
+
+def is_current(snapshot: Snapshot, json_path: Path) -> bool:
+    """True if the snapshot was built from the current contents of json_path."""
+    stat = Path(json_path).stat()
+    header = snapshot.header
+    if header["source_size"] == stat.st_size and header["source_mtime_ns"] == stat.st_mtime_ns:
+        return True
+    # Touched but possibly unchanged: fall back to the content hash
+    return header["source_size"] == stat.st_size and header["source_sha256"] == _file_sha256(Path(json_path))
+
+
+def load_snapshot(json_path: Path, snap_path: Optional[Path] = None) -> Snapshot:
+    """Open the snapshot for json_path, rebuilding it first if it is missing or stale."""
+    snap_path = Path(snap_path) if snap_path else default_snapshot_path(json_path)
+    if snap_path.exists():
+        try:
+            snapshot = Snapshot(snap_path)
+            if is_current(snapshot, json_path):
+                return snapshot
+        except (ValueError, KeyError):
+            pass
+    build_snapshot(json_path, snap_path)
+    return Snapshot(snap_path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compile a requirements JSON file into a snapshot.")
+    parser.add_argument("json", help="Requirements JSON file")
+    parser.add_argument("--out", default=None, help="Snapshot path (default: <json>.snap)")
+    args = parser.parse_args()
+
+    path = build_snapshot(Path(args.json), Path(args.out) if args.out else None)
+    snapshot = Snapshot(path)
+    print(
+        f"Wrote {path} ({path.stat().st_size} bytes): "
+        f"{snapshot.n_requirements} requirements, {snapshot.n_history} closure entries"
+    )
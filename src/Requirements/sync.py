@@ -0,0 +1,281 @@
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+DEFAULT_JSON = DATA_DIR / "requirements" / "fun_requirements.json"
+DEFAULT_DB = Path(os.environ.get("SYSENG_DB_PATH", DATA_DIR / "systems_of_systems.db"))
+
+# Columns added to `requirement` so a JSON record round-trips without loss
+SYNC_COLUMNS = {
+    "req_key": "TEXT",
+    "name": "TEXT",
+    "priority": "TEXT",
+    "status": "TEXT",
+    "tags": "TEXT",
+    "closure_details": "TEXT",
+}
+
+SYNC_SCHEMA = """
+CREATE UNIQUE INDEX IF NOT EXISTS idx_requirement_req_key ON requirement(req_key);
+
+CREATE TABLE IF NOT EXISTS requirement_sync (
+    req_key TEXT PRIMARY KEY,
+    requirement_id INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    source TEXT
+);
+
+CREATE TABLE IF NOT EXISTS sync_watermark (
+    source TEXT PRIMARY KEY,
+    source_hash TEXT NOT NULL,
+    corpus_hash TEXT NOT NULL,
+    record_count INTEGER NOT NULL,
+    synced_at TEXT NOT NULL
+);
+"""
+
+# Created after the column migration below; stores from before per-source sync lack `source`
+SYNC_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_requirement_sync_source ON requirement_sync(source);
+"""
+
+SYNC_TABLES = ["sync_watermark", "requirement_sync"]
+
+
+def ensure_sync_schema(conn: sqlite3.Connection) -> None:
+    """Add the sync columns and tables to an existing requirement store."""
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(requirement)")}
+    for column, decl in SYNC_COLUMNS.items():
+        if column not in existing:
+            conn.execute(f"ALTER TABLE requirement ADD COLUMN {column} {decl}")
+    conn.executescript(SYNC_SCHEMA)
+    if "source" not in {row[1] for row in conn.execute("PRAGMA table_info(requirement_sync)")}:
+        conn.execute("ALTER TABLE requirement_sync ADD COLUMN source TEXT")
+    conn.executescript(SYNC_INDEXES)
+
+
+def record_hash(req_id: str, values: Dict[str, Any]) -> str:
+    """Stable content hash of one requirement record."""
+    canonical = json.dumps(
+        {req_id: values}, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def corpus_hash(hashes: Dict[str, str]) -> str:
+    """Hash of the whole corpus, derived from the per-record hashes."""
+    h = hashlib.sha256()
+    for key in sorted(hashes):
+        h.update(key.encode("utf-8"))
+        h.update(hashes[key].encode("ascii"))
+    return h.hexdigest()
+
+
+def record_to_row(req_id: str, values: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a fun_requirements.json record onto requirement columns."""
+    closure_details = values.get("Closure Details", [])
+    latest = closure_details[-1] if closure_details else {}
+    return {
+        "req_key": req_id,
+        "description": values.get("description", ""),
+        "name": values.get("name", ""),
+        "priority": values.get("priority", ""),
+        "status": values.get("status", ""),
+        "tags": ", ".join(values.get("tags", [])),
+        "closure_details": json.dumps(closure_details, ensure_ascii=False),
+        "planned_closure_date": latest.get("Replanned Date") or latest.get("Baseline Date") or None,
+        "actual_closure_date": latest.get("Closure Date") or None,
+    }
+
+
+def load_corpus(json_path: Path) -> Tuple[str, Dict[str, Dict[str, Any]]]:
+    """Read the JSON corpus; returns (raw file hash, {req_id: values})."""
+    raw = Path(json_path).read_bytes()
+    records = {}
+    for item in json.loads(raw):
+        for req_id, values in item.items():
+            records[req_id] = values
+    return hashlib.sha256(raw).hexdigest(), records
+
+
+def diff_corpus(
+    records: Dict[str, Dict[str, Any]],
+    stored: Dict[str, str],
+) -> Tuple[Dict[str, str], List[str], List[str], List[str]]:
+    """Compare JSON records with stored hashes.
+
+    Returns (hashes, inserts, updates, deletes), where the three lists hold
+    requirement keys.
+    """
+    hashes = {req_id: record_hash(req_id, values) for req_id, values in records.items()}
+    inserts = [k for k in hashes if k not in stored]
+    updates = [k for k in hashes if k in stored and stored[k] != hashes[k]]
+    deletes = [k for k in stored if k not in hashes]
+    return hashes, inserts, updates, deletes
+
+
+def sync_requirements(
+    conn: sqlite3.Connection,
+    json_path: Path = DEFAULT_JSON,
+    system_id: Optional[int] = None,
+    level: str = "functional",
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """Bring the requirement table in line with the JSON corpus.
+
+    Only records whose content hash differs from the last sync are written,
+    all in a single transaction. If the file itself is unchanged since the
+    recorded watermark, nothing is parsed or diffed.
+
+    Each synced row records its source file, and the diff only covers rows
+    from this source, so syncing one file never deletes another's
+    requirements. Rows without a source (stores written before this) are
+    claimed by the first file that contains them. A key already synced from
+    another file is a conflict and is left alone.
+    """
+    ensure_sync_schema(conn)
+    source = str(Path(json_path).resolve())
+
+    source_hash = hashlib.sha256(Path(json_path).read_bytes()).hexdigest()
+    mark = conn.execute(
+        "SELECT source_hash FROM sync_watermark WHERE source = ?", (source,)
+    ).fetchone()
+    if mark and mark[0] == source_hash:
+        return {"inserted": 0, "updated": 0, "deleted": 0, "conflicts": 0, "unchanged": True}
+
+    _, records = load_corpus(json_path)
+    stored, unowned, other = {}, set(), set()
+    for req_key, content_hash, row_source in conn.execute(
+        "SELECT req_key, content_hash, source FROM requirement_sync"
+    ):
+        if row_source == source or row_source is None:
+            stored[req_key] = content_hash
+            if row_source is None:
+                unowned.add(req_key)
+        else:
+            other.add(req_key)
+    conflicts = [k for k in records if k in other]
+    for k in conflicts:
+        del records[k]
+    hashes, inserts, updates, deletes = diff_corpus(records, stored)
+    # Unowned rows missing from this file may belong to another one
+    deletes = [k for k in deletes if k not in unowned]
+    claims = [k for k in hashes if k in unowned]
+
+    summary = {
+        "inserted": len(inserts),
+        "updated": len(updates),
+        "deleted": len(deletes),
+        "conflicts": len(conflicts),
+        "unchanged": False,
+    }
+    if dry_run:
+        return summary
+
+    columns = list(record_to_row("", {}).keys())
+    with conn:
+        if deletes:
+            conn.executemany(
+                "DELETE FROM requirement_verification WHERE requirement_id = "
+                "(SELECT requirement_id FROM requirement_sync WHERE req_key = ?)",
+                [(k,) for k in deletes],
+            )
+            conn.executemany(
+                "DELETE FROM requirement WHERE id = "
+                "(SELECT requirement_id FROM requirement_sync WHERE req_key = ?)",
+                [(k,) for k in deletes],
+            )
+            conn.executemany(
+                "DELETE FROM requirement_sync WHERE req_key = ?",
+                [(k,) for k in deletes],
+            )
+
+        if updates:
+            assignments = ", ".join(f"{c} = :{c}" for c in columns if c != "req_key")
+            conn.executemany(
+                f"UPDATE requirement SET {assignments} WHERE req_key = :req_key",
+                [record_to_row(k, records[k]) for k in updates],
+            )
+            conn.executemany(
+                "UPDATE requirement_sync SET content_hash = ? WHERE req_key = ?",
+                [(hashes[k], k) for k in updates],
+            )
+
+        if inserts:
+            placeholders = ", ".join(f":{c}" for c in columns)
+            rows = []
+            for k in inserts:
+                row = record_to_row(k, records[k])
+                row["system_id"] = system_id
+                row["level"] = level
+                rows.append(row)
+            conn.executemany(
+                f"INSERT INTO requirement(system_id, level, {', '.join(columns)}) "
+                f"VALUES (:system_id, :level, {placeholders})",
+                rows,
+            )
+            conn.executemany(
+                "INSERT INTO requirement_sync(req_key, requirement_id, content_hash, source) "
+                "SELECT req_key, id, ?, ? FROM requirement WHERE req_key = ?",
+                [(hashes[k], source, k) for k in inserts],
+            )
+
+        if claims:
+            conn.executemany(
+                "UPDATE requirement_sync SET source = ? WHERE req_key = ?",
+                [(source, k) for k in claims],
+            )
+
+        conn.execute(
+            """
+            INSERT INTO sync_watermark(source, source_hash, corpus_hash, record_count, synced_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(source) DO UPDATE SET
+                source_hash = excluded.source_hash,
+                corpus_hash = excluded.corpus_hash,
+                record_count = excluded.record_count,
+                synced_at = excluded.synced_at
+            """,
+            (
+                source,
+                source_hash,
+                corpus_hash(hashes),
+                len(hashes),
+                datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            ),
+        )
+
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Sync fun_requirements.json into the SQLite requirement table."
+    )
+    parser.add_argument("--json", default=str(DEFAULT_JSON), help="Requirements JSON file")
+    parser.add_argument("--db", default=str(DEFAULT_DB), help="SQLite database")
+    parser.add_argument("--system-id", type=int, default=None, help="System for new requirements")
+    parser.add_argument("--dry-run", action="store_true", help="Report the diff without writing")
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.db)
+    result = sync_requirements(
+        conn, Path(args.json), system_id=args.system_id, dry_run=args.dry_run
+    )
+    conn.close()
+
+    if result["unchanged"]:
+        print("Source unchanged since last sync.")
+    else:
+        print(
+            f"Inserted {result['inserted']}, updated {result['updated']}, "
+            f"deleted {result['deleted']}."
+        )
+        if result["conflicts"]:
+            print(f"Skipped {result['conflicts']} IDs already synced from another file.")
@@ -0,0 +1,252 @@
+import sqlite3
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Test cases (RunTest.py layout) list the requirements they verify under this key
+LINK_FIELD = "requirements"
+
+PASSED_STATUS = "Completed"
+FAILED_STATUS = "Failed"
+
+ROLLUP_COLUMNS = ["requirements", "verified", "failed", "untested"]
+
+# (event_id, case_id): case IDs repeat across events
+CaseKey = Tuple[str, str]
+
+
+def _bits(mask: int) -> List[int]:
+    # Positions of the set bits, lowest first; one pass over the binary string
+    # instead of peeling bits off a 100k-bit int one at a time
+    digits = bin(mask)[:1:-1]
+    return [pos for pos, digit in enumerate(digits) if digit == "1"]
+
+
+class RequirementUniverse:
+    """Requirement positions plus per-system and per-tag bitmasks.
+
+    Bitsets are plain Python ints, bit i standing for requirement i, so a
+    rollup over 100k requirements is a couple of ANDs and popcounts.
+    """
+
+    def __init__(self, rows: Iterable[Tuple[str, Optional[Any], Optional[str]]]):
+        self.keys: List[str] = []
+        self.position: Dict[str, int] = {}
+        self.system_masks: Dict[Any, int] = {}
+        self.tag_masks: Dict[str, int] = {}
+        for key, system, tags in rows:
+            if key in self.position:
+                continue
+            bit = 1 << len(self.keys)
+            self.position[key] = len(self.keys)
+            self.keys.append(key)
+            self.system_masks[system] = self.system_masks.get(system, 0) | bit
+            for tag in (tags or "").split(","):
+                tag = tag.strip()
+                if tag:
+                    self.tag_masks[tag] = self.tag_masks.get(tag, 0) | bit
+        self.all_mask = (1 << len(self.keys)) - 1
+
+
+def load_universe(conn: sqlite3.Connection) -> RequirementUniverse:
+    """Requirements from the store, keyed by req_key (row id until synced)."""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(requirement)")}
+    key = "COALESCE(req_key, CAST(id AS TEXT))" if "req_key" in columns else "CAST(id AS TEXT)"
+    tags = "tags" if "tags" in columns else "NULL"
+    return RequirementUniverse(
+        conn.execute(f"SELECT {key}, system_id, {tags} FROM requirement ORDER BY id")
+    )
+
+
+# bytes.translate tables turning per-requirement status bytes into bit strings
+_UNTESTED, _VERIFIED, _FAILED = 0, 1, 2
+_AS_VERIFIED = bytes.maketrans(b"\x00\x01\x02", b"010")
+_AS_FAILED = bytes.maketrans(b"\x00\x01\x02", b"001")
+_AS_SET = bytes.maketrans(b"\x00\x01", b"01")
+STATUS_NAMES = {_UNTESTED: "untested", _VERIFIED: "verified", _FAILED: "failed"}
+
+
+def _to_mask(flags: bytearray, table: bytes) -> int:
+    # Byte i is requirement i; int() wants the most significant bit first
+    return int(flags.translate(table)[::-1] or b"0", 2)
+
+
+class TraceabilityIndex:
+    """Case-to-requirement links with incrementally maintained coverage.
+
+    Each requirement keeps counts of its linked, passing and failing cases
+    and a status byte: failed if any linked case failed, verified if one
+    passed and none failed, untested otherwise. `refresh()` diffs the events
+    against the last seen case state, so only changed cases touch the
+    counters. The verified/failed bitsets used for rollups are rebuilt from
+    the status bytes only after a change.
+
+    Case IDs are only unique within an event, so cases are keyed by
+    (event_id, case_id).
+    """
+
+    def __init__(self, universe: RequirementUniverse):
+        self.universe = universe
+        n = len(universe.keys)
+        self.case_state: Dict[CaseKey, Tuple[Optional[str], Tuple[str, ...]]] = {}
+        self.case_reqs: Dict[CaseKey, Tuple[int, ...]] = {}
+        self.event_cases: Dict[str, set] = {}
+        self.link_counts = array("l", bytes(array("l").itemsize * n))
+        self.pass_counts = array("l", bytes(array("l").itemsize * n))
+        self.fail_counts = array("l", bytes(array("l").itemsize * n))
+        self.status = bytearray(n)
+        self.linked_flags = bytearray(n)
+        self.unknown_links: Dict[CaseKey, List[str]] = {}
+        self._masks: Optional[Tuple[int, int, int]] = None
+        self._event_rollups: Dict[str, Dict[str, int]] = {}
+
+    # ------------------------------
+    # Incremental maintenance
+    # ------------------------------
+    @staticmethod
+    def _outcome(status: str) -> Optional[str]:
+        if status == PASSED_STATUS:
+            return "pass"
+        if status == FAILED_STATUS:
+            return "fail"
+        return None
+
+    def _positions(self, case: CaseKey, links: Tuple[str, ...]) -> Tuple[int, ...]:
+        positions, unknown = [], []
+        for key in links:
+            pos = self.universe.position.get(key)
+            if pos is None:
+                unknown.append(key)
+            else:
+                positions.append(pos)
+        if unknown:
+            self.unknown_links[case] = unknown
+        else:
+            self.unknown_links.pop(case, None)
+        return tuple(positions)
+
+    def _count(self, positions: Tuple[int, ...], outcome: Optional[str], delta: int) -> None:
+        counts = self.pass_counts if outcome == "pass" else self.fail_counts if outcome == "fail" else None
+        for pos in positions:
+            self.link_counts[pos] += delta
+            self.linked_flags[pos] = self.link_counts[pos] > 0
+            if counts is not None:
+                counts[pos] += delta
+            if self.fail_counts[pos]:
+                self.status[pos] = _FAILED
+            elif self.pass_counts[pos]:
+                self.status[pos] = _VERIFIED
+            else:
+                self.status[pos] = _UNTESTED
+
+    def _remove_case(self, case: CaseKey) -> None:
+        event_id, case_id = case
+        outcome, _ = self.case_state.pop(case)
+        self._count(self.case_reqs.pop(case), outcome, -1)
+        self.event_cases[event_id].discard(case_id)
+        if not self.event_cases[event_id]:
+            del self.event_cases[event_id]
+        self.unknown_links.pop(case, None)
+        self._event_rollups.pop(event_id, None)
+
+    def _add_case(self, case: CaseKey, outcome: Optional[str], links: Tuple[str, ...]) -> None:
+        event_id, case_id = case
+        positions = self._positions(case, links)
+        self.case_state[case] = (outcome, links)
+        self.case_reqs[case] = positions
+        self.event_cases.setdefault(event_id, set()).add(case_id)
+        self._count(positions, outcome, +1)
+        self._event_rollups.pop(event_id, None)
+
+    def refresh(self, events: Dict[str, Dict[str, Any]]) -> int:
+        """Bring the index in line with `events`; returns the number of cases changed."""
+        seen = set()
+        changed = 0
+        for event_id, event in events.items():
+            for case_id, case in event.get("cases", {}).items():
+                key = (event_id, case_id)
+                seen.add(key)
+                state = (self._outcome(case.get("status", "")), tuple(case.get(LINK_FIELD, ())))
+                if self.case_state.get(key) == state:
+                    continue
+                if key in self.case_state:
+                    self._remove_case(key)
+                self._add_case(key, *state)
+                changed += 1
+        if len(seen) != len(self.case_state):
+            for key in [c for c in self.case_state if c not in seen]:
+                self._remove_case(key)
+                changed += 1
+        if changed:
+            self._masks = None
+        return changed
+
+    # ------------------------------
+    # Rollups
+    # ------------------------------
+    def masks(self) -> Tuple[int, int, int]:
+        """(verified, failed, linked) requirement bitsets."""
+        if self._masks is None:
+            self._masks = (
+                _to_mask(self.status, _AS_VERIFIED),
+                _to_mask(self.status, _AS_FAILED),
+                _to_mask(self.linked_flags, _AS_SET),
+            )
+        return self._masks
+
+    def _rollup(self, scope: int) -> Dict[str, int]:
+        verified, failed, _ = self.masks()
+        verified &= scope
+        failed &= scope
+        return {
+            "requirements": scope.bit_count(),
+            "verified": verified.bit_count(),
+            "failed": failed.bit_count(),
+            "untested": scope.bit_count() - verified.bit_count() - failed.bit_count(),
+        }
+
+    def totals(self) -> Dict[str, int]:
+        rollup = self._rollup(self.universe.all_mask)
+        rollup["linked"] = self.masks()[2].bit_count()
+        return rollup
+
+    def by_system(self) -> Dict[Any, Dict[str, int]]:
+        return {system: self._rollup(mask) for system, mask in self.universe.system_masks.items()}
+
+    def by_tag(self) -> Dict[str, Dict[str, int]]:
+        return {tag: self._rollup(mask) for tag, mask in sorted(self.universe.tag_masks.items())}
+
+    def by_event(self) -> Dict[str, Dict[str, int]]:
+        """Coverage of the requirements each event's cases verify, from that event's results only."""
+        for event_id, cases in self.event_cases.items():
+            if event_id in self._event_rollups:
+                continue
+            scope, passed, failed = set(), set(), set()
+            for case_id in cases:
+                positions = self.case_reqs[(event_id, case_id)]
+                scope.update(positions)
+                outcome = self.case_state[(event_id, case_id)][0]
+                if outcome == "pass":
+                    passed.update(positions)
+                elif outcome == "fail":
+                    failed.update(positions)
+            verified = passed - failed
+            self._event_rollups[event_id] = {
+                "requirements": len(scope),
+                "verified": len(verified),
+                "failed": len(failed),
+                "untested": len(scope) - len(verified) - len(failed),
+            }
+        return {event_id: self._event_rollups[event_id] for event_id in sorted(self.event_cases)}
+
+    def requirement_status(self, key: str) -> str:
+        return STATUS_NAMES[self.status[self.universe.position[key]]]
+
+    def requirements_with(self, status: str, scope: Optional[int] = None) -> List[str]:
+        """Requirement keys with `status`, optionally limited to a system/tag mask."""
+        verified, failed, _ = self.masks()
+        mask = {"verified": verified, "failed": failed}.get(status)
+        if mask is None:
+            mask = self.universe.all_mask & ~(verified | failed)
+        if scope is not None:
+            mask &= scope
+        return [self.universe.keys[pos] for pos in _bits(mask)]
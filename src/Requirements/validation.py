@@ -0,0 +1,466 @@
+"""Rule-based validation of the requirements corpus.
+
+Rules are registered by name with a scope and a severity:
+
+    record  fn(req_id, values) -> messages, run on every requirement record
+    corpus  fn(ids) -> (req_id, message) pairs, over all IDs in file order
+    store   fn(conn) -> (req_id, message) pairs, over the SQLite requirement store
+
+Record results are cached per top-level JSON item, keyed by a hash of the
+item's raw text, so after an edit only the changed items are parsed and
+checked again. Large batches of changed items are spread over a process
+pool. The cache lives next to the corpus (<name>.vcache) and is dropped
+whenever a rule's source file changes. An unchanged file skips the record
+scan entirely; store rules always run, since the database changes
+independently of the file.
+"""
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+DEFAULT_JSON = DATA_DIR / "requirements" / "fun_requirements.json"
+DEFAULT_DB = Path(os.environ.get("SYSENG_DB_PATH", DATA_DIR / "systems_of_systems.db"))
+
+SCOPES = ("record", "corpus", "store")
+SEVERITIES = ("error", "warning")
+REQUIRED_FIELDS = ("name", "description", "priority", "status")
+DATE_KEYS = ("Baseline Date", "Replanned Date", "Closure Date")
+
+CACHE_VERSION = 1
+DIGEST_SIZE = 16
+CHUNK_ITEMS = 5000  # items per process pool task
+PARALLEL_MIN_ITEMS = 20000  # fewer changed items than this are checked in-process
+
+# Findings about the file itself rather than a registered rule
+SYNTAX_RULE = "json_syntax"
+STRUCTURE_RULE = "item_structure"
+
+Finding = Dict[str, Any]  # rule, severity, id, message
+Progress = Callable[[float, str], None]
+
+_rules: Dict[str, Tuple[str, str, Callable]] = {}
+_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def register(name: str, fn: Callable, scope: str = "record", severity: str = "error") -> None:
+    """Register a rule; see the module docstring for the signature of each scope."""
+    if scope not in SCOPES:
+        raise ValueError(f"Unknown rule scope: {scope}")
+    if severity not in SEVERITIES:
+        raise ValueError(f"Unknown severity: {severity}")
+    _rules[name] = (scope, severity, fn)
+
+
+def rules(scope: Optional[str] = None) -> List[Dict[str, str]]:
+    return [
+        {"name": name, "scope": s, "severity": severity}
+        for name, (s, severity, _) in _rules.items()
+        if scope is None or s == scope
+    ]
+
+
+def rules_fingerprint() -> str:
+    """Changes whenever a rule is added, removed, re-scoped or its source file edited."""
+    h = hashlib.sha256(str(CACHE_VERSION).encode())
+    sources: Dict[str, bytes] = {}
+    for name in sorted(_rules):
+        scope, severity, fn = _rules[name]
+        h.update(f"{name}:{scope}:{severity}:{fn.__qualname__};".encode("utf-8"))
+        filename = fn.__code__.co_filename
+        if filename not in sources:
+            try:
+                sources[filename] = Path(filename).read_bytes()
+            except OSError:
+                sources[filename] = b""
+    for filename in sorted(sources):
+        h.update(sources[filename])
+    return h.hexdigest()
+
+
+def _finding(rule: str, severity: str, req_id: Optional[str], message: str) -> Finding:
+    return {"rule": rule, "severity": severity, "id": req_id, "message": message}
+
+
+# ------------------------------
+# Built-in rules
+# ------------------------------
+def _parse_date(value: Any) -> Optional[date]:
+    """A YYYY-MM-DD string as a date; None if it is anything else."""
+    if not isinstance(value, str) or not _DATE.fullmatch(value):
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _entries(values: Dict[str, Any]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    details = values.get("Closure Details")
+    if isinstance(details, list):
+        for i, entry in enumerate(details):
+            if isinstance(entry, dict):
+                yield i, entry
+
+
+def check_required_fields(req_id: str, values: Dict[str, Any]) -> Iterator[str]:
+    for field in REQUIRED_FIELDS:
+        value = values.get(field)
+        if not isinstance(value, str) or not value.strip():
+            yield f"missing {field}"
+    tags = values.get("tags", [])
+    if not isinstance(tags, list) or not all(isinstance(t, str) for t in tags):
+        yield "tags is not a list of strings"
+
+
+def check_closure_details_present(req_id: str, values: Dict[str, Any]) -> Iterator[str]:
+    if "Closure Details" not in values:
+        yield "no Closure Details"
+    elif values["Closure Details"] == []:
+        yield "Closure Details is empty"
+
+
+def check_closure_details_shape(req_id: str, values: Dict[str, Any]) -> Iterator[str]:
+    details = values.get("Closure Details", [])
+    if not isinstance(details, list):
+        yield "Closure Details is not a list"
+        return
+    for i, entry in enumerate(details):
+        if not isinstance(entry, dict):
+            yield f"entry {i} is not an object"
+
+
+def check_dates(req_id: str, values: Dict[str, Any]) -> Iterator[str]:
+    for i, entry in _entries(values):
+        for key in DATE_KEYS:
+            value = entry.get(key)
+            if value not in (None, "") and _parse_date(value) is None:
+                yield f"entry {i}: {key} {value!r} is not a YYYY-MM-DD date"
+
+
+def check_replanned_before_baseline(req_id: str, values: Dict[str, Any]) -> Iterator[str]:
+    for i, entry in _entries(values):
+        baseline = _parse_date(entry.get("Baseline Date"))
+        replanned = _parse_date(entry.get("Replanned Date"))
+        if baseline and replanned and replanned < baseline:
+            yield f"entry {i}: Replanned Date {replanned} is before Baseline Date {baseline}"
+
+
+def check_closed_without_date(req_id: str, values: Dict[str, Any]) -> Iterator[str]:
+    for i, entry in _entries(values):
+        if entry.get("Closure Code") == "Closed" and entry.get("Closure Date") in (None, ""):
+            yield f"entry {i}: Closed without a Closure Date"
+
+
+def check_duplicate_ids(ids: List[str]) -> Iterator[Tuple[str, str]]:
+    seen: Dict[str, int] = {}
+    for req_id in ids:
+        seen[req_id] = seen.get(req_id, 0) + 1
+    for req_id, count in seen.items():
+        if count > 1:
+            yield req_id, f"ID appears {count} times"
+
+
+def check_dangling_parents(conn: sqlite3.Connection) -> Iterator[Tuple[str, str]]:
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(requirement)")}
+    label = "COALESCE(r.req_key, '#' || r.id)" if "req_key" in columns else "'#' || r.id"
+    for req_id, parent in conn.execute(
+        f"SELECT {label}, r.parent_requirement_id FROM requirement r "
+        "LEFT JOIN requirement p ON p.id = r.parent_requirement_id "
+        "WHERE r.parent_requirement_id IS NOT NULL AND p.id IS NULL"
+    ):
+        yield req_id, f"parent_requirement_id {parent} does not exist"
+
+
+register("required_fields", check_required_fields)
+register("closure_details_missing", check_closure_details_present, severity="warning")
+register("closure_details_shape", check_closure_details_shape)
+register("date_format", check_dates)
+register("replanned_before_baseline", check_replanned_before_baseline, severity="warning")
+register("closed_without_date", check_closed_without_date, severity="warning")
+register("duplicate_id", check_duplicate_ids, scope="corpus")
+register("dangling_parent", check_dangling_parents, scope="store")
+
+
+# ------------------------------
+# Checking items
+# ------------------------------
+def check_item(item: Any) -> List[Finding]:
+    """Record rule findings for one top-level item of the corpus array."""
+    if not isinstance(item, dict) or not item:
+        return [_finding(STRUCTURE_RULE, "error", None, "item is not an object mapping requirement IDs to fields")]
+    findings = []
+    for req_id, values in item.items():
+        if not isinstance(values, dict):
+            findings.append(_finding(STRUCTURE_RULE, "error", req_id, "requirement is not an object"))
+            continue
+        for name, (scope, severity, fn) in _rules.items():
+            if scope == "record":
+                findings.extend(_finding(name, severity, req_id, message) for message in fn(req_id, values))
+    return findings
+
+
+def _check_chunk(texts: List[str]) -> List[List[Finding]]:
+    # Process pool task: items travel as raw JSON text, cheaper to send than parsed dicts
+    return [check_item(json.loads(text)) for text in texts]
+
+
+def scan_items(text: str) -> Iterator[Tuple[int, int, Any]]:
+    """(start, end, item) for each top-level item of the corpus array, in order.
+
+    Raises json.JSONDecodeError at the first syntax error.
+    """
+    decoder = json.JSONDecoder()
+    space = re.compile(r"\s*")
+    pos = space.match(text, 0).end()
+    if text[pos:pos + 1] != "[":
+        raise json.JSONDecodeError("Expected the corpus to be a JSON array", text, pos)
+    pos = space.match(text, pos + 1).end()
+    if text[pos:pos + 1] == "]":
+        return
+    while True:
+        item, end = decoder.raw_decode(text, pos)
+        yield pos, end, item
+        pos = space.match(text, end).end()
+        if text[pos:pos + 1] == "]":
+            return
+        if text[pos:pos + 1] != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, pos)
+        pos = space.match(text, pos + 1).end()
+
+
+def _check_parallel(texts: List[str], workers: int, progress: Optional[Progress]) -> List[List[Finding]]:
+    chunks = [texts[i:i + CHUNK_ITEMS] for i in range(0, len(texts), CHUNK_ITEMS)]
+    results: List[List[Finding]] = []
+    # fork: workers inherit the rule registry, including rules registered at runtime
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")) as pool:
+        for i, chunk_results in enumerate(pool.map(_check_chunk, chunks)):
+            results.extend(chunk_results)
+            if progress is not None:
+                progress(0.3 + 0.6 * (i + 1) / len(chunks), f"Checked {len(results)} of {len(texts)} changed items")
+    return results
+
+
+# ------------------------------
+# Cache
+# ------------------------------
+def default_cache_path(json_path: Path) -> Path:
+    return Path(json_path).with_suffix(".vcache")
+
+
+def _load_cache(path: Path, fingerprint: str) -> Tuple[Dict[str, Any], Set[bytes]]:
+    """(header, clean item digests); an empty cache if missing, unreadable or stale.
+
+    Layout: one line of JSON (header plus findings of items that have any),
+    then the digests of clean items back to back.
+    """
+    try:
+        with open(path, "rb") as f:
+            header = json.loads(f.readline())
+            data = f.read()
+    except (OSError, ValueError):
+        return {}, set()
+    if header.get("version") != CACHE_VERSION or header.get("rules") != fingerprint:
+        return {}, set()
+    clean = {data[i:i + DIGEST_SIZE] for i in range(0, len(data), DIGEST_SIZE)}
+    return header, clean
+
+
+def _save_cache(path: Path, header: Dict[str, Any], clean: Iterable[bytes]) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(json.dumps(header, ensure_ascii=False).encode("utf-8") + b"\n")
+            f.write(b"".join(clean))
+        os.replace(tmp, path)
+    except OSError:
+        pass  # read-only location: validate without a cache
+
+
+# ------------------------------
+# Report
+# ------------------------------
+def validate(
+    json_path: Path = DEFAULT_JSON,
+    conn: Optional[sqlite3.Connection] = None,
+    cache_path: Optional[Path] = None,
+    use_cache: bool = True,
+    workers: Optional[int] = None,
+    progress: Optional[Progress] = None,
+) -> Dict[str, Any]:
+    """Validate a corpus (and the requirement store, if conn is given) into a findings report.
+
+    workers defaults to the CPU count; 1 checks everything in-process.
+    """
+    t0 = time.perf_counter()
+    json_path = Path(json_path)
+    cache_path = Path(cache_path) if cache_path else default_cache_path(json_path)
+    workers = workers or os.cpu_count() or 1
+    if "fork" not in multiprocessing.get_all_start_methods():
+        workers = 1
+
+    raw = json_path.read_bytes()
+    source_sha256 = hashlib.sha256(raw).hexdigest()
+    fingerprint = rules_fingerprint()
+    header, clean = _load_cache(cache_path, fingerprint) if use_cache else ({}, set())
+    if progress is not None:
+        progress(0.05, "Scanning corpus")
+
+    if header.get("source_sha256") == source_sha256:
+        # Unchanged file: the cached record and corpus findings still hold
+        findings, items, requirements, checked = header["findings"], header["items"], header["requirements"], 0
+    else:
+        scan = _validate_text(raw.decode("utf-8"), header.get("dirty", {}), clean, workers, progress)
+        findings, items, requirements, checked = scan["findings"], scan["items"], scan["requirements"], scan["checked"]
+        # A file that does not parse keeps the previous cache for when it is fixed
+        if use_cache and scan["complete"]:
+            _save_cache(cache_path, {
+                "version": CACHE_VERSION,
+                "rules": fingerprint,
+                "source_sha256": source_sha256,
+                "items": items,
+                "requirements": requirements,
+                "findings": findings,
+                "dirty": scan["dirty"],
+            }, scan["clean"])
+
+    findings = list(findings)
+    if conn is not None:
+        if progress is not None:
+            progress(0.95, "Checking requirement store")
+        for name, (scope, severity, fn) in _rules.items():
+            if scope == "store":
+                findings.extend(_finding(name, severity, req_id, message) for req_id, message in fn(conn))
+
+    by_rule: Dict[str, int] = {}
+    by_severity = {severity: 0 for severity in SEVERITIES}
+    for f in findings:
+        by_rule[f["rule"]] = by_rule.get(f["rule"], 0) + 1
+        by_severity[f["severity"]] += 1
+    return {
+        "source": str(json_path),
+        "source_sha256": source_sha256,
+        "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "rules": rules(),
+        "items": items,
+        "requirements": requirements,
+        "checked": checked,
+        "cached": items - checked,
+        "seconds": round(time.perf_counter() - t0, 3),
+        "by_severity": by_severity,
+        "by_rule": by_rule,
+        "findings": findings,
+    }
+
+
+def _validate_text(
+    text: str,
+    dirty: Dict[str, List[Finding]],
+    clean: Set[bytes],
+    workers: int,
+    progress: Optional[Progress],
+) -> Dict[str, Any]:
+    """Record and corpus findings for the corpus text, reusing cached item results.
+
+    dirty maps the hex digest of each cached item with findings to them;
+    clean holds the digests of cached items without any.
+    """
+    digests: List[bytes] = []
+    item_results: List[Optional[List[Finding]]] = []
+    pending: List[Tuple[int, str]] = []  # (item index, raw text) left for the process pool
+    ids: List[str] = []
+    checked = 0
+    try:
+        for start, end, item in scan_items(text):
+            item_text = text[start:end]
+            digest = hashlib.blake2b(item_text.encode("utf-8"), digest_size=DIGEST_SIZE).digest()
+            digests.append(digest)
+            if isinstance(item, dict):
+                ids.extend(item)
+            if digest in clean:
+                item_results.append([])
+            elif digest.hex() in dirty:
+                item_results.append(dirty[digest.hex()])
+            elif workers <= 1:
+                item_results.append(check_item(item))
+                checked += 1
+            else:
+                item_results.append(None)
+                pending.append((len(item_results) - 1, item_text))
+    except json.JSONDecodeError as e:
+        return {
+            "findings": [_finding(SYNTAX_RULE, "error", None, f"line {e.lineno} column {e.colno}: {e.msg}")],
+            "items": len(digests),
+            "requirements": len(ids),
+            "checked": len(digests),
+            "complete": False,
+        }
+
+    if pending:
+        texts = [item_text for _, item_text in pending]
+        if len(texts) < PARALLEL_MIN_ITEMS:
+            results = _check_chunk(texts)
+        else:
+            results = _check_parallel(texts, workers, progress)
+        for (i, _), result in zip(pending, results):
+            item_results[i] = result
+        checked += len(pending)
+
+    findings: List[Finding] = [f for result in item_results for f in result]
+    for name, (scope, severity, fn) in _rules.items():
+        if scope == "corpus":
+            findings.extend(_finding(name, severity, req_id, message) for req_id, message in fn(ids))
+    return {
+        "findings": findings,
+        "items": len(digests),
+        "requirements": len(ids),
+        "checked": checked,
+        "complete": True,
+        "clean": [d for d, result in zip(digests, item_results) if not result],
+        "dirty": {d.hex(): result for d, result in zip(digests, item_results) if result},
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Validate a requirements JSON corpus.")
+    parser.add_argument("json", nargs="?", default=str(DEFAULT_JSON), help="Requirements JSON file")
+    parser.add_argument("--db", default=str(DEFAULT_DB), help="SQLite requirement store to check as well")
+    parser.add_argument("--no-db", action="store_true", help="Only check the JSON corpus")
+    parser.add_argument("--out", default=None, help="Write the findings report as JSON here")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--no-cache", action="store_true", help="Check every record, ignoring the cache")
+    parser.add_argument(
+        "--fail-on", choices=["error", "warning", "never"], default="error",
+        help="Exit with status 1 if findings of this severity (or worse) exist"
+    )
+    args = parser.parse_args()
+
+    conn = None if args.no_db or not Path(args.db).exists() else sqlite3.connect(args.db)
+    report = validate(Path(args.json), conn=conn, use_cache=not args.no_cache, workers=args.workers)
+    if conn is not None:
+        conn.close()
+
+    if args.out:
+        Path(args.out).write_text(json.dumps(report, indent=2))
+    for f in report["findings"][:50]:
+        print(f"{f['severity']}: {f['id'] or '-'}: {f['rule']}: {f['message']}")
+    if len(report["findings"]) > 50:
+        print(f"... {len(report['findings']) - 50} more")
+    print(
+        f"{report['requirements']} requirements, {report['by_severity']['error']} errors, "
+        f"{report['by_severity']['warning']} warnings; {report['checked']} items checked, "
+        f"{report['cached']} cached, in {report['seconds']:.2f}s",
+        file=sys.stderr,
+    )
+    failing = {"error": ["error"], "warning": ["error", "warning"], "never": []}[args.fail_on]
+    sys.exit(1 if any(report["by_severity"][s] for s in failing) else 0)
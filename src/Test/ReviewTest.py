@@ -0,0 +1,126 @@
+import streamlit as st
+import pandas as pd
+import sqlite3
+from pathlib import Path
+import importlib.util
+import sys
+
+# Load shared modules by file path to avoid package import issues; reuse across reruns
+def _load_module(name, path):
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, str(path))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+run_history = _load_module("run_history", Path(__file__).parent / "run_history.py")
+db = _load_module("data_db", Path(__file__).parent.parent / "Data" / "db.py")
+instrumentation = _load_module("instrumentation", Path(__file__).parent.parent / "instrumentation.py")
+
+# Configure page
+st.set_page_config(page_title="Review Tests", layout="wide")
+st.title("📈 Review Tests")
+
+
+@st.cache_resource
+def install_history():
+    database = db.get_database()
+    with database.writer() as conn:
+        run_history.ensure_history_schema(conn)
+    return database
+
+
+try:
+    instrumentation.mark("load")
+    database = install_history()
+
+    # Sidebar filters
+    st.sidebar.header("Filters")
+    events = database.cached(("history_events",), run_history.history_events)
+    selected_event = st.sidebar.selectbox(
+        "Test Event",
+        [None] + events,
+        format_func=lambda e: "All Events" if e is None else e,
+        key="review_event"
+    )
+    window = st.sidebar.slider("Flaky window (last N runs)", 5, 50, 20, key="review_window")
+
+    # All aggregation happens in SQLite; only the summaries come back
+    summary = database.cached(
+        ("run_summary", selected_event),
+        lambda conn: run_history.run_summary(conn, selected_event)
+    )
+
+    instrumentation.mark("render")
+    if summary["runs"] == 0:
+        st.info("No test runs recorded yet. Run test cases on the Run Tests page to build history.")
+    else:
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Runs", summary["runs"])
+        with col2:
+            st.metric("Case Results", summary["results"])
+        with col3:
+            st.metric("Overall Pass Rate", f"{summary['passed'] / summary['results'] * 100:.1f}%")
+        with col4:
+            st.metric("Last Run", summary["last_run"])
+
+        st.divider()
+
+        # ============== PASS-RATE TREND ==============
+        st.subheader("Pass-Rate Trend")
+        trend_df = pd.DataFrame(database.cached(
+            ("pass_rate_trend", selected_event),
+            lambda conn: run_history.pass_rate_trend(conn, selected_event)
+        ))
+        trend_df["pass_rate"] = trend_df["pass_rate"] * 100
+        st.line_chart(trend_df.set_index("date")["pass_rate"], y_label="Pass rate (%)")
+
+        st.divider()
+
+        tab1, tab2 = st.tabs(["Flaky Cases", "Last Green Run"])
+
+        # ============== FLAKY CASES ==============
+        with tab1:
+            flaky_df = pd.DataFrame(database.cached(
+                ("flaky_cases", selected_event, window),
+                lambda conn: run_history.flaky_cases(conn, selected_event, window=window)
+            ))
+            if flaky_df.empty:
+                st.success("No flaky cases in the selected window.")
+            else:
+                st.write(f"**{len(flaky_df)}** cases both passed and failed in their last {window} runs")
+                st.dataframe(
+                    flaky_df,
+                    column_config={
+                        "pass_rate": st.column_config.ProgressColumn("Pass Rate", min_value=0, max_value=1, format="percent"),
+                        "flip_rate": st.column_config.NumberColumn("Flip Rate", format="percent"),
+                    },
+                    width='stretch',
+                    hide_index=True
+                )
+
+        # ============== LAST GREEN RUN ==============
+        with tab2:
+            green_df = pd.DataFrame(database.cached(
+                ("last_green", selected_event),
+                lambda conn: run_history.last_green(conn, selected_event)
+            ))
+            never = int(green_df["last_green"].isna().sum())
+            st.write(f"**{never}** cases have never passed; the rest are listed oldest green first")
+            st.dataframe(green_df, width='stretch', hide_index=True)
+
+            case_id = st.selectbox("Case history", green_df["case_id"].tolist(), key="review_case")
+            if case_id:
+                st.dataframe(
+                    pd.DataFrame(database.cached(
+                        ("case_history", case_id),
+                        lambda conn: run_history.case_history(conn, case_id)
+                    )),
+                    width='stretch',
+                    hide_index=True
+                )
+
+except sqlite3.Error as e:
+    st.error(f"Error reading test history: {str(e)}")
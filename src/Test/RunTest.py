@@ -1,28 +1,48 @@
 import streamlit as st
-import pandas as pd
 import json
 from datetime import datetime
 from pathlib import Path
 import importlib.util
 import sys
 
-# Load persistence module by file path to avoid package import issues
-_p_path = Path(__file__).parent / "persistence.py"
-spec = importlib.util.spec_from_file_location("test_persistence", str(_p_path))
-persistence = None
-if spec and spec.loader:
-    module = importlib.util.module_from_spec(spec)
-    sys.modules["test_persistence"] = module
-    spec.loader.exec_module(module)
-    persistence = module
-else:
-    persistence = None
+# Load shared modules by file path to avoid package import issues; reuse across reruns
+def _load_module(name, path):
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, str(path))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+persistence = _load_module("test_persistence", Path(__file__).parent / "persistence.py")
+instrumentation = _load_module("instrumentation", Path(__file__).parent.parent / "instrumentation.py")
 
 # Configure page
 st.set_page_config(page_title="Run System Tests", layout="wide")
 st.title("🧪 Run System Tests")
 
+
+# The run history store and the job queue are loaded where they are used, not at page load
+def _run_history():
+    return _load_module("run_history", Path(__file__).parent / "run_history.py")
+
+
+@st.cache_resource
+def install_history():
+    database = _load_module("data_db", Path(__file__).parent.parent / "Data" / "db.py").get_database()
+    with database.writer() as conn:
+        _run_history().ensure_history_schema(conn)
+    return database
+
+
+def _job_queue():
+    jobs = _load_module("jobs", Path(__file__).parent.parent / "jobs.py")
+    _load_module("job_handlers", Path(__file__).parent.parent / "job_handlers.py")
+    return jobs.get_queue()
+
+
 # Initialize session state for test execution tracking
+instrumentation.mark("load")
 if "test_events" not in st.session_state:
     # Default sample events: each event contains multiple test cases
     st.session_state.test_events = {
@@ -101,8 +121,10 @@ if "test_events" not in st.session_state:
 if "created_issues" not in st.session_state:
     st.session_state.created_issues = []
 
-# Try to pre-load saved events and issues if available (non-destructive)
-if persistence is not None:
+# Try to pre-load saved events and issues if available (non-destructive).
+# Done once per session so reruns don't re-read the files or clobber edits.
+if "persistence_loaded" not in st.session_state:
+    st.session_state.persistence_loaded = True
     try:
         saved_events = persistence.load_events()
         if saved_events:
@@ -118,8 +140,14 @@ if persistence is not None:
     except Exception:
         pass
 
+# Counters ride along with the events; only events without them are counted here
+event_counters = _load_module("event_counters", Path(__file__).parent / "event_counters.py")
+event_counters.ensure_counters(st.session_state.test_events)
+events = st.session_state.test_events
+
 # Sidebar statistics
 # Sidebar: select which event to work on
+instrumentation.mark("render")
 st.sidebar.header("Test Execution Summary")
 event_keys = list(st.session_state.test_events.keys())
 selected_event = st.sidebar.selectbox(
@@ -129,11 +157,12 @@ selected_event = st.sidebar.selectbox(
     key="selected_event"
 )
 
-# Compute stats for the selected event
+# Stats for the selected event come from its counters, not a scan of its cases
 selected_cases = st.session_state.test_events[selected_event]["cases"]
-total_tests = len(selected_cases)
-completed_tests = sum(1 for step in selected_cases.values() if step["completed"])
-failed_tests = sum(1 for step in selected_cases.values() if step["issue_found"])
+counters = event_counters.event_counters(st.session_state.test_events[selected_event])
+total_tests = counters["cases"]
+completed_tests = counters["completed"]
+failed_tests = counters["issue_found"]
 
 col1, col2, col3 = st.sidebar.columns(3)
 with col1:
@@ -170,6 +199,7 @@ with col_load:
         try:
             loaded = persistence.load_events()
             if loaded:
+                event_counters.ensure_counters(loaded)
                 st.session_state.test_events = loaded
                 st.success("Events loaded into session state")
                 st.experimental_rerun()
@@ -206,12 +236,14 @@ with tab1:
     st.subheader("Test Execution Steps")
     
     # Work on the selected event's cases
+    instrumentation.mark("filter")
     filtered_tests = selected_cases.copy()
     if filter_status != "All":
         if filter_status == "Failed":
             filtered_tests = {k: v for k, v in filtered_tests.items() if v["issue_found"]}
         else:
             filtered_tests = {k: v for k, v in filtered_tests.items() if v["status"] == filter_status}
+    instrumentation.mark("render")
 
     if len(filtered_tests) == 0:
         st.info("No tests match the selected filter.")
@@ -228,6 +260,17 @@ with tab1:
                 st.write("**Expected Result:**")
                 st.write(test_data['expected_result'])
 
+                # Traceability: requirement IDs this case verifies
+                links_text = st.text_input(
+                    "Verifies Requirements",
+                    value=", ".join(test_data.get("requirements", [])),
+                    key=f"requirements_{test_id}",
+                    placeholder="e.g. FUN-0001, FUN-0002"
+                )
+                links = [part.strip() for part in links_text.split(",") if part.strip()]
+                if links != test_data.get("requirements", []):
+                    st.session_state.test_events[selected_event]["cases"][test_id]["requirements"] = links
+
                 st.divider()
 
                 # Checklist steps (detailed test steps)
@@ -241,7 +284,7 @@ with tab1:
                             key=f"{test_id}_step_{step_id}"
                         )
                         if checked != step.get("completed", False):
-                            st.session_state.test_events[selected_event]["cases"][test_id]["steps"][step_id]["completed"] = checked
+                            event_counters.set_step(events, selected_event, test_id, step_id, checked)
                             # update case-level completion/state after a step change
                             st.rerun()
 
@@ -250,12 +293,9 @@ with tab1:
                     all_done = all(s.get("completed") for s in current_steps.values()) if current_steps else False
                     any_done = any(s.get("completed") for s in current_steps.values()) if current_steps else False
                     if all_done and not st.session_state.test_events[selected_event]["cases"][test_id].get("completed"):
-                        st.session_state.test_events[selected_event]["cases"][test_id]["completed"] = True
-                        st.session_state.test_events[selected_event]["cases"][test_id]["status"] = "Completed"
-                    elif any_done and not all_done:
-                        st.session_state.test_events[selected_event]["cases"][test_id]["status"] = "In Progress"
-                    elif not any_done:
-                        st.session_state.test_events[selected_event]["cases"][test_id]["status"] = st.session_state.test_events[selected_event]["cases"][test_id].get("status", "Not Started")
+                        event_counters.update_case(events, selected_event, test_id, completed=True, status="Completed")
+                    elif any_done and not all_done and test_data["status"] != "In Progress":
+                        event_counters.update_case(events, selected_event, test_id, status="In Progress")
 
                 # Test execution controls
                 col1, col2, col3 = st.columns([2, 1, 1])
@@ -270,7 +310,7 @@ with tab1:
                         key=f"status_{test_id}"
                     )
                     if new_status != test_data["status"]:
-                        st.session_state.test_events[selected_event]["cases"][test_id]["status"] = new_status
+                        event_counters.update_case(events, selected_event, test_id, status=new_status)
                         st.rerun()
 
                 with col2:
@@ -281,7 +321,7 @@ with tab1:
                         key=f"complete_{test_id}"
                     )
                     if completed != test_data["completed"]:
-                        st.session_state.test_events[selected_event]["cases"][test_id]["completed"] = completed
+                        event_counters.update_case(events, selected_event, test_id, completed=completed)
                         st.rerun()
 
                 with col3:
@@ -292,7 +332,7 @@ with tab1:
                         key=f"issue_{test_id}"
                     )
                     if issue_found != test_data["issue_found"]:
-                        st.session_state.test_events[selected_event]["cases"][test_id]["issue_found"] = issue_found
+                        event_counters.update_case(events, selected_event, test_id, issue_found=issue_found)
                         st.rerun()
 
                 st.divider()
@@ -358,18 +398,25 @@ with tab1:
         to_run = st.multiselect("Select test cases to run", case_keys, default=case_keys)
         if st.button("▶️ Run Selected Tests"):
             for cid in to_run:
-                st.session_state.test_events[selected_event]["cases"][cid]["status"] = "In Progress"
                 # Simulate a run: mark completed unless an issue flag is set
                 if st.session_state.test_events[selected_event]["cases"][cid].get("issue_found"):
-                    st.session_state.test_events[selected_event]["cases"][cid]["status"] = "Failed"
+                    event_counters.update_case(events, selected_event, cid, status="Failed")
                 else:
-                    st.session_state.test_events[selected_event]["cases"][cid]["status"] = "Completed"
-                    st.session_state.test_events[selected_event]["cases"][cid]["completed"] = True
+                    event_counters.update_case(events, selected_event, cid, status="Completed", completed=True)
+            # Keep every execution as its own run for the Review Tests page
+            if to_run:
+                try:
+                    with install_history().writer() as conn:
+                        _run_history().record_run(conn, selected_event, st.session_state.test_events[selected_event]["cases"], to_run)
+                except Exception as e:
+                    st.error(f"Failed to record run history: {e}")
             st.success("Selected tests executed (status updated)")
             st.rerun()
 
 # ============== TAB 2: TEST RESULTS ==============
 with tab2:
+    import pandas as pd
+
     st.subheader("Test Results Summary")
     
     # Summary statistics
@@ -404,32 +451,52 @@ with tab2:
     
     st.divider()
     
-    # Export test results
+    # Export test results in the background; the file stays available if you navigate away
     st.subheader("Export Results")
+    job_queue = _job_queue()
     col1, col2 = st.columns(2)
-    
+
+    export_params = {
+        "event_id": selected_event,
+        "cases": selected_cases,
+        "date": datetime.now().strftime("%Y-%m-%d"),
+    }
     with col1:
         if st.button("📥 Export as CSV"):
-            csv = results_df.to_csv(index=False)
-            st.download_button(
-                label="Download CSV",
-                data=csv,
-                file_name=f"test_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv"
+            st.session_state.export_job = job_queue.submit(
+                "export_results", {**export_params, "format": "csv"}, label=f"CSV export of {selected_event}"
             )
-    
+
     with col2:
         if st.button("📥 Export as JSON"):
-            # Export data for selected event
-            export_obj = { selected_event: selected_cases }
-            json_data = json.dumps(export_obj, indent=2)
-            st.download_button(
-                label="Download JSON",
-                data=json_data,
-                file_name=f"test_results_{selected_event}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                mime="application/json"
+            st.session_state.export_job = job_queue.submit(
+                "export_results", {**export_params, "format": "json"}, label=f"JSON export of {selected_event}"
             )
 
+    # Poll only while the export is pending; the finished state renders once, statically
+    @st.fragment(run_every=1)
+    def export_progress():
+        job = job_queue.get(st.session_state.export_job)
+        if job is None or job["status"] not in ("queued", "running"):
+            st.rerun()
+        st.progress(job["progress"], text=job["message"] or "Queued")
+
+    export_job = job_queue.get(st.session_state.export_job) if "export_job" in st.session_state else None
+    if export_job is not None:
+        if export_job["status"] in ("queued", "running"):
+            export_progress()
+        elif export_job["status"] == "failed":
+            st.error(f"Export failed: {export_job['error']}")
+        else:
+            path = job_queue.result_path(export_job["job_id"])
+            if path is not None:
+                st.download_button(
+                    label=f"Download {export_job['result_name']}",
+                    data=path.read_bytes,
+                    file_name=export_job["result_name"],
+                    mime=export_job["result_mime"]
+                )
+
 # ============== TAB 3: CREATED ISSUES ==============
 with tab3:
     st.subheader("Issues Created from Tests")
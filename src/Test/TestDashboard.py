@@ -0,0 +1,86 @@
+import streamlit as st
+import pandas as pd
+from pathlib import Path
+import importlib.util
+import sys
+
+# Load shared modules by file path to avoid package import issues; reuse across reruns
+def _load_module(name, path):
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, str(path))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+persistence = _load_module("test_persistence", Path(__file__).parent / "persistence.py")
+event_counters = _load_module("event_counters", Path(__file__).parent / "event_counters.py")
+instrumentation = _load_module("instrumentation", Path(__file__).parent.parent / "instrumentation.py")
+
+# Configure page
+st.set_page_config(page_title="Test Dashboard", layout="wide")
+st.title("📊 Test Dashboard")
+
+
+def percent(part, whole):
+    return round(part / whole * 100, 1) if whole else 0.0
+
+
+try:
+    instrumentation.mark("load")
+    # Everything below reads per-event counters only, never the cases
+    if "test_events" in st.session_state:
+        summaries = event_counters.summarize(st.session_state.test_events)
+        st.caption("Events in this session, including unsaved changes from Run Tests.")
+    else:
+        summaries = persistence.load_event_summaries()
+        st.caption("Saved events.")
+
+    if not summaries:
+        st.info("No test events yet. Create or load events on the Run Tests page.")
+        st.stop()
+
+    instrumentation.mark("render")
+    total = event_counters.totals(summaries.values())
+    col1, col2, col3, col4, col5, col6 = st.columns(6)
+    with col1:
+        st.metric("Events", f"{len(summaries):,}")
+    with col2:
+        st.metric("Test Cases", f"{total['cases']:,}")
+    with col3:
+        st.metric("Completed", f"{total['completed']:,}")
+    with col4:
+        st.metric("Passed", f"{total['passed']:,}")
+    with col5:
+        st.metric("Issues Found", f"{total['issue_found']:,}")
+    with col6:
+        st.metric("Steps Done", f"{percent(total['steps_completed'], total['steps']):.1f}%")
+    st.progress(percent(total["completed"], total["cases"]) / 100, text="Cases completed")
+
+    statuses = event_counters.STATUSES + sorted(set(total["status"]) - set(event_counters.STATUSES))
+    rows = []
+    for event_id, summary in summaries.items():
+        c = summary["counters"]
+        rows.append({
+            "Event": event_id,
+            "Name": summary["name"],
+            "Cases": c["cases"],
+            **{status: c["status"].get(status, 0) for status in statuses},
+            "Completed": c["completed"],
+            "Passed": c["passed"],
+            "Issues": c["issue_found"],
+            "Completion %": percent(c["completed"], c["cases"]),
+            "Steps Done %": percent(c["steps_completed"], c["steps"]),
+        })
+    df = pd.DataFrame(rows)
+
+    st.divider()
+
+    st.subheader("Status by Event")
+    st.bar_chart(df.set_index("Event")[statuses])
+
+    st.subheader("Events")
+    st.dataframe(df, width='stretch', hide_index=True)
+
+except ValueError as e:
+    st.error(f"Error reading test events: {str(e)}")
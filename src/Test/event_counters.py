@@ -0,0 +1,128 @@
+"""Aggregate counters per test event, kept up to date as cases change.
+
+Each event carries a "counters" dict next to its cases: how many cases there
+are, how many are in each status, completed, have an issue found or passed
+(completed without an issue), and how many steps exist and are done. A case
+mutation made through update_case()/set_step() subtracts the case's old
+contribution and adds its new one, so the counters never need a rescan; the
+counters are saved with the events and summarised in a small sidecar file
+(persistence.py), which the cross-event dashboard reads without parsing a
+single case.
+
+Global totals are the sum of the per-event counters: O(events).
+"""
+from typing import Any, Dict, Iterable
+
+STATUSES = ["Not Started", "In Progress", "Completed", "Failed"]
+COUNTER_FIELDS = ["cases", "completed", "issue_found", "passed", "steps", "steps_completed"]
+# Case fields that feed the counters; other edits (notes, links) skip the delta
+CASE_FIELDS = ("status", "completed", "issue_found")
+
+
+def empty_counters() -> Dict[str, Any]:
+    return {**{field: 0 for field in COUNTER_FIELDS}, "status": {}}
+
+
+def case_counts(case: Dict[str, Any]) -> Dict[str, Any]:
+    """One case's contribution to its event's counters."""
+    steps = case.get("steps", {})
+    completed = bool(case.get("completed"))
+    issue = bool(case.get("issue_found"))
+    return {
+        "cases": 1,
+        "completed": int(completed),
+        "issue_found": int(issue),
+        "passed": int(completed and not issue),
+        "steps": len(steps),
+        "steps_completed": sum(1 for s in steps.values() if s.get("completed")),
+        "status": {case.get("status", "Not Started"): 1},
+    }
+
+
+def _apply(counters: Dict[str, Any], counts: Dict[str, Any], sign: int) -> None:
+    for field in COUNTER_FIELDS:
+        counters[field] += sign * counts[field]
+    by_status = counters["status"]
+    for status, n in counts["status"].items():
+        by_status[status] = by_status.get(status, 0) + sign * n
+        if not by_status[status]:
+            del by_status[status]
+
+
+def recompute(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Rebuild an event's counters from its cases and store them on the event."""
+    counters = empty_counters()
+    for case in event.get("cases", {}).values():
+        _apply(counters, case_counts(case), +1)
+    event["counters"] = counters
+    return counters
+
+
+def _valid(event: Dict[str, Any]) -> bool:
+    counters = event.get("counters")
+    return (
+        isinstance(counters, dict)
+        and all(isinstance(counters.get(field), int) for field in COUNTER_FIELDS)
+        and isinstance(counters.get("status"), dict)
+        and counters["cases"] == len(event.get("cases", {}))
+    )
+
+
+def event_counters(event: Dict[str, Any]) -> Dict[str, Any]:
+    """The event's counters, rebuilt only if missing or clearly stale (files from before counters)."""
+    return event["counters"] if _valid(event) else recompute(event)
+
+
+def ensure_counters(events: Dict[str, Dict[str, Any]]) -> int:
+    """Give every event valid counters; returns how many had to be rebuilt."""
+    rebuilt = 0
+    for event in events.values():
+        if not _valid(event):
+            recompute(event)
+            rebuilt += 1
+    return rebuilt
+
+
+# ------------------------------
+# Mutations
+# ------------------------------
+def update_case(events: Dict[str, Dict[str, Any]], event_id: str, case_id: str, **changes: Any) -> None:
+    """Set case fields (status, completed, issue_found, ...) and adjust the event's counters."""
+    event = events[event_id]
+    counters = event_counters(event)
+    case = event["cases"][case_id]
+    if not any(field in CASE_FIELDS or field == "steps" for field in changes):
+        case.update(changes)
+        return
+    _apply(counters, case_counts(case), -1)
+    case.update(changes)
+    _apply(counters, case_counts(case), +1)
+
+
+def set_step(events: Dict[str, Dict[str, Any]], event_id: str, case_id: str, step_id: str, completed: bool) -> None:
+    """Tick or untick one step and adjust the event's step counters."""
+    event = events[event_id]
+    counters = event_counters(event)
+    step = event["cases"][case_id]["steps"][step_id]
+    was = bool(step.get("completed"))
+    step["completed"] = completed
+    counters["steps_completed"] += int(bool(completed)) - int(was)
+
+
+# ------------------------------
+# Summaries
+# ------------------------------
+def summarize(events: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Event ID -> {name, counters}: what the sidecar file holds."""
+    return {
+        event_id: {"name": event.get("name", ""), "counters": event_counters(event)}
+        for event_id, event in events.items()
+    }
+
+
+def totals(summaries: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Global counters across events; takes summarize() values or event counters alike."""
+    total = empty_counters()
+    for summary in summaries:
+        _apply(total, summary.get("counters", summary), +1)
+    return total
@@ -1,6 +1,8 @@
+import importlib.util
 import json
+import sys
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 DATA_DIR = Path.cwd() / "data"
 ISSUES_DIR = DATA_DIR / "issues"
@@ -8,26 +10,112 @@ ISSUES_DIR = DATA_DIR / "issues"
 EVENTS_FILE = DATA_DIR / "test_events.json"
 ISSUES_FILE = ISSUES_DIR / "test_issues.json"
 
+# Optional callback(path, nbytes) run after each file read; set by diagnostics
+on_read = None
+
+
+def _notify_read(path: Path) -> None:
+    if on_read is not None:
+        on_read(path, path.stat().st_size)
+
 
 def ensure_dirs():
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     ISSUES_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _counters():
+    if "event_counters" not in sys.modules:
+        spec = importlib.util.spec_from_file_location("event_counters", str(Path(__file__).parent / "event_counters.py"))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["event_counters"] = module
+        spec.loader.exec_module(module)
+    return sys.modules["event_counters"]
+
+
+def _summaries_file() -> Path:
+    # Derived from EVENTS_FILE so redirecting it (benchmarks) moves both
+    return EVENTS_FILE.with_name(EVENTS_FILE.stem + ".counters.json")
+
+
+def _stamp(path: Path) -> Dict[str, int]:
+    stat = path.stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _write_summaries(summaries: Dict[str, Any]) -> None:
+    with open(_summaries_file(), "w", encoding="utf-8") as f:
+        json.dump({"events_file": _stamp(EVENTS_FILE), "events": summaries}, f, ensure_ascii=False)
+
+
 def save_events(events: Dict[str, Any]) -> Path:
-    """Save test events to JSON and return the file path."""
+    """Save test events, with their counters, to JSON and return the file path."""
     ensure_dirs()
+    _counters().ensure_counters(events)
     with open(EVENTS_FILE, "w", encoding="utf-8") as f:
         json.dump(events, f, indent=2, ensure_ascii=False)
+    _write_summaries(_counters().summarize(events))
     return EVENTS_FILE
 
 
+def _read_events() -> Dict[str, Any]:
+    with open(EVENTS_FILE, "r", encoding="utf-8") as f:
+        events = json.load(f)
+    _notify_read(EVENTS_FILE)
+    return events
+
+
+def _recount(events: Dict[str, Any]) -> None:
+    for event in events.values():
+        _counters().recompute(event)
+
+
+def _saved_summaries() -> Optional[Dict[str, Any]]:
+    """The sidecar's summaries if it was written with the current events file, else None."""
+    path = _summaries_file()
+    if not path.exists():
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            saved = json.load(f)
+        _notify_read(path)
+        if saved.get("events_file") == _stamp(EVENTS_FILE):
+            return saved["events"]
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+    return None
+
+
 def load_events() -> Dict[str, Any]:
-    """Load test events from JSON. Returns empty dict if not found."""
+    """Load test events from JSON. Returns empty dict if not found.
+
+    Saved counters are only trusted while the events file is the one
+    save_events() wrote; after an edit made elsewhere they are rebuilt.
+    """
     if not EVENTS_FILE.exists():
         return {}
-    with open(EVENTS_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
+    events = _read_events()
+    if _saved_summaries() is None:
+        _recount(events)
+    return events
+
+
+def load_event_summaries() -> Dict[str, Any]:
+    """Event ID -> {name, counters} for every saved event, without loading the cases.
+
+    Reads the sidecar written by save_events(); if it is missing or the events
+    file changed behind its back, falls back to one full load and rewrites it.
+    """
+    if not EVENTS_FILE.exists():
+        return {}
+    summaries = _saved_summaries()
+    if summaries is not None:
+        return summaries
+    events = _read_events()
+    _recount(events)
+    summaries = _counters().summarize(events)
+    _write_summaries(summaries)
+    return summaries
 
 
 def save_issues(issues: List[Dict[str, Any]]) -> Path:
@@ -43,4 +131,6 @@ def load_issues() -> List[Dict[str, Any]]:
     if not ISSUES_FILE.exists():
         return []
     with open(ISSUES_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
+        issues = json.load(f)
+    _notify_read(ISSUES_FILE)
+    return issues
@@ -0,0 +1,181 @@
+import sqlite3
+from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional
+
+# Append-only: a run and its results are written once and never changed.
+# Results carry their run time so per-case history is one index range scan.
+HISTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS test_run (
+    run_id INTEGER PRIMARY KEY,
+    event_id TEXT NOT NULL,
+    run_at TEXT NOT NULL,
+    case_count INTEGER NOT NULL,
+    passed_count INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS test_run_result (
+    run_id INTEGER NOT NULL REFERENCES test_run(run_id),
+    case_id TEXT NOT NULL,
+    event_id TEXT NOT NULL,
+    run_at TEXT NOT NULL,
+    status TEXT NOT NULL,
+    passed INTEGER NOT NULL,
+    PRIMARY KEY (run_id, case_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_test_run_event_time ON test_run(event_id, run_at);
+CREATE INDEX IF NOT EXISTS idx_test_run_time ON test_run(run_at);
+-- run_id breaks ties between runs recorded in the same second; passed is
+-- included so the trend queries below are answered from the index alone
+DROP INDEX IF EXISTS idx_test_result_case_time;
+CREATE INDEX IF NOT EXISTS idx_test_result_case_run ON test_run_result(case_id, run_at, run_id, passed);
+
+CREATE TRIGGER IF NOT EXISTS trg_test_run_no_update BEFORE UPDATE ON test_run
+BEGIN SELECT RAISE(ABORT, 'test_run is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS trg_test_run_no_delete BEFORE DELETE ON test_run
+BEGIN SELECT RAISE(ABORT, 'test_run is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS trg_test_result_no_update BEFORE UPDATE ON test_run_result
+BEGIN SELECT RAISE(ABORT, 'test_run_result is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS trg_test_result_no_delete BEFORE DELETE ON test_run_result
+BEGIN SELECT RAISE(ABORT, 'test_run_result is append-only'); END;
+"""
+
+PASSED_STATUS = "Completed"
+
+
+def ensure_history_schema(conn: sqlite3.Connection) -> None:
+    conn.executescript(HISTORY_SCHEMA)
+
+
+def record_run(
+    conn: sqlite3.Connection,
+    event_id: str,
+    cases: Dict[str, Dict[str, Any]],
+    case_ids: Iterable[str],
+    run_at: Optional[str] = None,
+) -> int:
+    """Record the outcome of `case_ids` (RunTest.py case layout) as a new run; returns run_id."""
+    run_at = run_at or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    results = [
+        (case_id, cases[case_id]["status"], int(cases[case_id]["status"] == PASSED_STATUS))
+        for case_id in case_ids
+    ]
+    with conn:
+        cur = conn.execute(
+            "INSERT INTO test_run(event_id, run_at, case_count, passed_count) VALUES (?, ?, ?, ?)",
+            (event_id, run_at, len(results), sum(r[2] for r in results)),
+        )
+        run_id = cur.lastrowid
+        conn.executemany(
+            "INSERT INTO test_run_result(run_id, case_id, event_id, run_at, status, passed) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [(run_id, case_id, event_id, run_at, status, passed) for case_id, status, passed in results],
+        )
+    return run_id
+
+
+# ------------------------------
+# Trend queries
+# ------------------------------
+def _event_filter(event_id: Optional[str], alias: str = "") -> str:
+    # Restrict results through test_run so the (run_id, case_id) key does the work
+    if event_id is None:
+        return ""
+    return f"WHERE {alias}run_id IN (SELECT run_id FROM test_run WHERE event_id = :event_id)"
+
+
+def history_events(conn: sqlite3.Connection) -> List[str]:
+    return [e for (e,) in conn.execute("SELECT DISTINCT event_id FROM test_run ORDER BY event_id")]
+
+
+def run_summary(conn: sqlite3.Connection, event_id: Optional[str] = None) -> Dict[str, Any]:
+    row = conn.execute(
+        "SELECT COUNT(*), COALESCE(SUM(case_count), 0), COALESCE(SUM(passed_count), 0), MAX(run_at) "
+        "FROM test_run" + (" WHERE event_id = :event_id" if event_id else ""),
+        {"event_id": event_id},
+    ).fetchone()
+    return {"runs": row[0], "results": row[1], "passed": row[2], "last_run": row[3]}
+
+
+def pass_rate_trend(conn: sqlite3.Connection, event_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Daily pass rate, from the per-run counts (no result rows are read)."""
+    rows = conn.execute(
+        "SELECT substr(run_at, 1, 10) AS day, COUNT(*), SUM(case_count), SUM(passed_count) "
+        "FROM test_run" + (" WHERE event_id = :event_id" if event_id else "")
+        + " GROUP BY day ORDER BY day",
+        {"event_id": event_id},
+    ).fetchall()
+    return [
+        {"date": day, "runs": runs, "results": total, "pass_rate": passed / total if total else None}
+        for day, runs, total, passed in rows
+    ]
+
+
+def flaky_cases(
+    conn: sqlite3.Connection,
+    event_id: Optional[str] = None,
+    window: int = 20,
+    min_runs: int = 5,
+) -> List[Dict[str, Any]]:
+    """Cases that both passed and failed in their last `window` runs, most flips first."""
+    # One pass over the covering (case_id, run_at, run_id, passed) index gives
+    # each case's outcomes in run order; window functions over the same rows
+    # are several times slower in SQLite. group_concat() over an ordered
+    # subquery is not guaranteed to keep that order, so the strings are built here.
+    rows = conn.execute(
+        f"""
+        SELECT case_id, passed FROM test_run_result
+        {_event_filter(event_id)}
+        ORDER BY case_id, run_at, run_id
+        """,
+        {"event_id": event_id},
+    )
+    flaky = []
+    for case_id, results in groupby(rows, key=itemgetter(0)):
+        recent = "".join(str(passed) for _, passed in results)[-window:]
+        runs, passes = len(recent), recent.count("1")
+        if runs < min_runs or passes in (0, runs):
+            continue
+        flips = sum(a != b for a, b in zip(recent, recent[1:]))
+        flaky.append({
+            "case_id": case_id,
+            "runs": runs,
+            "pass_rate": passes / runs,
+            "flips": flips,
+            "flip_rate": flips / (runs - 1),
+        })
+    flaky.sort(key=lambda c: (-c["flips"], c["case_id"]))
+    return flaky
+
+
+def last_green(conn: sqlite3.Connection, event_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Per case: last run, last passing run (None if never green) and the latest status."""
+    rows = conn.execute(
+        f"""
+        SELECT r.case_id, MAX(r.run_at) AS last_run,
+               MAX(CASE WHEN r.passed THEN r.run_at END) AS last_green,
+               (SELECT status FROM test_run_result
+                WHERE case_id = r.case_id {"AND event_id = :event_id" if event_id is not None else ""}
+                ORDER BY run_at DESC, run_id DESC LIMIT 1) AS last_status
+        FROM test_run_result r
+        {_event_filter(event_id, "r.")}
+        GROUP BY r.case_id
+        ORDER BY last_green IS NOT NULL, last_green, r.case_id
+        """,
+        {"event_id": event_id},
+    ).fetchall()
+    return [
+        {"case_id": case_id, "last_run": last_run, "last_green": green, "last_status": status}
+        for case_id, last_run, green, status in rows
+    ]
+
+
+def case_history(conn: sqlite3.Connection, case_id: str, limit: int = 50) -> List[Dict[str, Any]]:
+    rows = conn.execute(
+        "SELECT run_id, run_at, status FROM test_run_result "
+        "WHERE case_id = ? ORDER BY run_at DESC, run_id DESC LIMIT ?",
+        (case_id, limit),
+    ).fetchall()
+    return [{"run_id": run_id, "run_at": run_at, "status": status} for run_id, run_at, status in rows]
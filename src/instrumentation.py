@@ -0,0 +1,187 @@
+import cProfile
+import io
+import marshal
+import os
+import pstats
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import streamlit as st
+
+# Opt-in: SYSENG_DIAGNOSTICS=1 for every session, or the toggle on the Diagnostics page
+ENV_FLAG = "SYSENG_DIAGNOSTICS"
+MAX_RUNS = 50
+
+# Modules exposing an `on_read(path, nbytes)` hook for file reads
+READ_HOOK_MODULES = ("test_persistence", "requirements_loader")
+# Modules exposing an `on_cache(name, hit)` hook for their shared caches
+CACHE_HOOK_MODULES = ("requirements_loader", "requirements_corpus")
+
+# Each Streamlit session reruns in its own thread, so the current run is thread-local
+_local = threading.local()
+
+
+def enabled_by_env() -> bool:
+    return os.environ.get(ENV_FLAG) == "1"
+
+
+def enabled() -> bool:
+    if enabled_by_env():
+        return True
+    try:
+        return bool(st.session_state.get("diagnostics_enabled", False))
+    except Exception:  # no session outside a script run
+        return False
+
+
+def _current() -> Optional[Dict[str, Any]]:
+    return getattr(_local, "run", None)
+
+
+def _record_read(path: Path, nbytes: int) -> None:
+    run = _current()
+    if run is not None:
+        key = str(path)
+        run["bytes_read"][key] = run["bytes_read"].get(key, 0) + nbytes
+
+
+def _record_cache(name: str, hit: bool) -> None:
+    run = _current()
+    if run is not None:
+        counts = run["cache_hits" if hit else "cache_misses"]
+        counts[name] = counts.get(name, 0) + 1
+
+
+def _widget_count() -> Optional[int]:
+    """Widgets registered in this run; relies on Streamlit internals, so best effort."""
+    try:
+        from streamlit.runtime.scriptrunner_utils.script_run_context import get_script_run_ctx
+
+        ctx = get_script_run_ctx()
+        ids = getattr(getattr(ctx, "shared", ctx), "widget_ids_this_run", None)
+        if ids is None:
+            return None
+        return len(ids.snapshot()) if hasattr(ids, "snapshot") else len(ids)
+    except Exception:
+        return None
+
+
+# ------------------------------
+# Rerun lifecycle (driven by streamlit_app.py)
+# ------------------------------
+def begin_rerun(page: str) -> None:
+    if not enabled():
+        _local.run = None
+        return
+    now = time.perf_counter()
+    _local.run = {
+        "page": page,
+        "started": datetime.now().strftime("%H:%M:%S"),
+        "sections": {},
+        "cache_hits": {},
+        "cache_misses": {},
+        "bytes_read": {},
+        "_t0": now,
+        "_section": None,
+        "_section_t0": now,
+    }
+    _attach_hooks()
+
+
+def _attach_hooks() -> None:
+    # Pages load their modules on first use, often after begin_rerun(); the
+    # hooks record nothing outside a recorded run, so they can stay attached
+    for name in READ_HOOK_MODULES:
+        module = sys.modules.get(name)
+        if module is not None and getattr(module, "on_read", None) is None:
+            module.on_read = _record_read
+    for name in CACHE_HOOK_MODULES:
+        module = sys.modules.get(name)
+        if module is not None and getattr(module, "on_cache", None) is None:
+            module.on_cache = _record_cache
+
+
+def mark(name: Optional[str]) -> None:
+    """Start timing section `name`; the previous section ends here."""
+    run = _current()
+    if run is None:
+        return
+    # Modules loaded since the last mark (pages load theirs just before "load")
+    _attach_hooks()
+    now = time.perf_counter()
+    previous = run["_section"]
+    if previous is not None:
+        run["sections"][previous] = run["sections"].get(previous, 0.0) + now - run["_section_t0"]
+    run["_section"] = name
+    run["_section_t0"] = now
+
+
+@contextmanager
+def section(name: str):
+    """Time a block as section `name`."""
+    run = _current()
+    if run is None:
+        yield
+        return
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        run["sections"][name] = run["sections"].get(name, 0.0) + time.perf_counter() - t0
+
+
+def end_rerun() -> None:
+    run = _current()
+    if run is None:
+        return
+    mark(None)
+    run["wall_s"] = time.perf_counter() - run.pop("_t0")
+    run.pop("_section")
+    run.pop("_section_t0")
+    run["widgets"] = _widget_count()
+    _local.run = None
+    try:
+        runs = st.session_state.setdefault("diagnostics_runs", [])
+        runs.append(run)
+        del runs[:-MAX_RUNS]
+    except Exception:
+        pass
+
+
+# ------------------------------
+# Single-rerun cProfile capture
+# ------------------------------
+def request_profile() -> None:
+    """Profile the next rerun of this session."""
+    st.session_state["diagnostics_profile_next"] = True
+
+
+@contextmanager
+def maybe_profile(page: str):
+    if not st.session_state.get("diagnostics_profile_next", False):
+        yield
+        return
+    st.session_state["diagnostics_profile_next"] = False
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.create_stats()
+        # Same format as Profile.dump_stats(), so pstats/snakeviz can open it.
+        # Serialize first: pstats.Stats() takes ownership of profiler.stats.
+        data = marshal.dumps(profiler.stats)
+        summary = io.StringIO()
+        pstats.Stats(profiler, stream=summary).sort_stats("cumulative").print_stats(25)
+        st.session_state["diagnostics_profile"] = {
+            "page": page,
+            "captured": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "data": data,
+            "summary": summary.getvalue(),
+        }
@@ -0,0 +1,138 @@
+import csv
+import importlib.util
+import io
+import json
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+SRC_DIR = Path(__file__).resolve().parent
+
+
+def load_module(name: str, path: Path):
+    """Load a module by file path once per process."""
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, str(path))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+
+jobs = load_module("jobs", SRC_DIR / "jobs.py")
+BURNDOWN_SCRIPT = SRC_DIR.parent / "data" / "requirements" / "fun_burndown.py"
+SYNC_MODULE = SRC_DIR / "Requirements" / "sync.py"
+VALIDATION_MODULE = SRC_DIR / "Requirements" / "validation.py"
+SIMILARITY_MODULE = SRC_DIR / "Requirements" / "similarity.py"
+
+Progress = Callable[[float, str], None]
+
+
+# ------------------------------
+# Test results export (Run Tests page)
+# ------------------------------
+def export_results(params: Dict[str, Any], progress: Progress) -> Tuple[bytes, str, str]:
+    """params: event_id, format ("csv" or "json"), cases (RunTest.py layout), date."""
+    event_id, cases = params["event_id"], params["cases"]
+    # Dated rather than timestamped, so the same export on the same day is one job
+    name = f"test_results_{event_id}_{params['date'].replace('-', '')}"
+    if params["format"] == "json":
+        progress(0.5, "Serializing")
+        return json.dumps({event_id: cases}, indent=2).encode("utf-8"), f"{name}.json", "application/json"
+
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(["Test ID", "Name", "Status", "Completed", "Issue", "Last Updated"])
+    for i, (test_id, test_data) in enumerate(cases.items()):
+        writer.writerow([
+            test_id,
+            test_data["name"],
+            test_data["status"],
+            "✅" if test_data["completed"] else "❌",
+            "⚠️" if test_data["issue_found"] else "✓",
+            params["date"],
+        ])
+        if i % 1000 == 0:
+            progress(i / len(cases), f"{i} of {len(cases)} cases")
+    return out.getvalue().encode("utf-8"), f"{name}.csv", "text/csv"
+
+
+# ------------------------------
+# Burndown report (data/requirements/fun_burndown.py)
+# ------------------------------
+def burndown_report(params: Dict[str, Any], progress: Progress) -> Tuple[bytes, str, str]:
+    """params: path of a fun_requirements.json style file."""
+    burndown = load_module("fun_burndown", BURNDOWN_SCRIPT)
+    progress(0.05, "Loading closure history")
+    df = burndown.load_history(Path(params["path"]))
+    latest = burndown.latest_status(df)
+    progress(0.25, "Building burndown")
+    burndown_df = burndown.build_burndown(df, latest)
+    progress(0.8, "Counting daily closures")
+    daily_closures = burndown.daily_closure_counts(df, latest)
+    progress(0.85, "Forecasting completion")
+    forecast = burndown.load_forecast_module().forecast(burndown_df, daily_closures, latest)
+    progress(0.9, "Rendering chart")
+    fig = burndown.build_figure(burndown_df, daily_closures, forecast)
+    html = fig.to_html(include_plotlyjs="cdn", full_html=True)
+    return html.encode("utf-8"), f"burndown_{Path(params['path']).stem}.html", "text/html"
+
+
+# ------------------------------
+# Requirements JSON -> SQLite sync (src/Requirements/sync.py)
+# ------------------------------
+def requirements_sync(params: Dict[str, Any], progress: Progress) -> Tuple[bytes, str, str]:
+    """params: json_path, db_path, optional system_id."""
+    sync = load_module("requirements_sync", SYNC_MODULE)
+    progress(0.1, "Syncing requirements")
+    conn = sqlite3.connect(params["db_path"], timeout=30)
+    try:
+        summary = sync.sync_requirements(conn, Path(params["json_path"]), system_id=params.get("system_id"))
+    finally:
+        conn.close()
+    return json.dumps(summary, indent=2).encode("utf-8"), "requirements_sync.json", "application/json"
+
+
+# ------------------------------
+# Requirements corpus validation (src/Requirements/validation.py)
+# ------------------------------
+def requirements_validation(params: Dict[str, Any], progress: Progress) -> Tuple[bytes, str, str]:
+    """params: json_path, optional db_path."""
+    validation = load_module("requirements_validation", VALIDATION_MODULE)
+    conn = sqlite3.connect(params["db_path"], timeout=30) if params.get("db_path") else None
+    try:
+        # In-process: forking the app's threaded process for a pool is not safe; the CLI uses the pool
+        report = validation.validate(Path(params["json_path"]), conn=conn, workers=1, progress=progress)
+    finally:
+        if conn is not None:
+            conn.close()
+    return json.dumps(report, indent=2).encode("utf-8"), "requirements_validation.json", "application/json"
+
+
+# ------------------------------
+# Near-duplicate report (src/Requirements/similarity.py)
+# ------------------------------
+def duplicate_report(params: Dict[str, Any], progress: Progress) -> Tuple[bytes, str, str]:
+    """params: db_path, optional threshold."""
+    similarity = load_module("requirements_similarity", SIMILARITY_MODULE)
+    conn = sqlite3.connect(params["db_path"], timeout=30)
+    try:
+        similarity.ensure_similarity(conn)
+        similarity.update_index(conn, lambda f, m: progress(0.8 * f, m))
+        progress(0.85, "Grouping near-duplicates")
+        report = similarity.duplicate_report(conn, params.get("threshold", similarity.DEFAULT_THRESHOLD))
+    finally:
+        conn.close()
+    return report.to_csv(index=False).encode("utf-8"), "duplicate_requirements.csv", "text/csv"
+
+
+jobs.register("export_results", export_results)
+jobs.register("burndown_report", burndown_report, inputs=lambda p: [p["path"]])
+jobs.register("requirements_sync", requirements_sync, inputs=lambda p: [p["json_path"], p["db_path"]])
+jobs.register(
+    "requirements_validation",
+    requirements_validation,
+    inputs=lambda p: [p["json_path"]] + ([p["db_path"]] if p.get("db_path") else []),
+)
+jobs.register("duplicate_report", duplicate_report, inputs=lambda p: [p["db_path"]])
@@ -0,0 +1,238 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Jobs get their own SQLite file: progress writes are frequent and would
+# otherwise invalidate every cached query on the requirement store.
+DEFAULT_JOBS_DIR = Path(__file__).resolve().parents[1] / "data" / "jobs"
+JOBS_DIR = Path(os.environ.get("SYSENG_JOBS_DIR", DEFAULT_JOBS_DIR))
+
+DEFAULT_WORKERS = 2
+PROGRESS_INTERVAL = 0.25  # seconds between progress writes
+
+logger = logging.getLogger("syseng.jobs")
+
+JOB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS job (
+    job_id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    label TEXT,
+    status TEXT NOT NULL CHECK(status IN ('queued', 'running', 'done', 'failed')),
+    progress REAL NOT NULL DEFAULT 0,
+    message TEXT,
+    params TEXT NOT NULL,
+    submitted_at TEXT NOT NULL,
+    started_at TEXT,
+    finished_at TEXT,
+    result_file TEXT,
+    result_name TEXT,
+    result_mime TEXT,
+    error TEXT,
+    worker_pid INTEGER
+);
+
+CREATE INDEX IF NOT EXISTS idx_job_fingerprint ON job(fingerprint, status);
+CREATE INDEX IF NOT EXISTS idx_job_submitted ON job(submitted_at);
+"""
+
+JOB_COLUMNS = [
+    "job_id", "kind", "fingerprint", "label", "status", "progress", "message",
+    "submitted_at", "started_at", "finished_at", "result_name", "result_mime", "error",
+]
+
+# A handler gets (params, progress) and returns (content bytes, file name, mime type).
+# progress(fraction, message) may be called as often as convenient; writes are throttled.
+Handler = Callable[[Dict[str, Any], Callable[[float, str], None]], Tuple[bytes, str, str]]
+
+_handlers: Dict[str, Tuple[Handler, Optional[Callable[[Dict[str, Any]], Iterable[Path]]]]] = {}
+
+
+def register(kind: str, handler: Handler, inputs: Optional[Callable[[Dict[str, Any]], Iterable[Path]]] = None) -> None:
+    """Register a job kind. `inputs(params)` lists files whose state is part of the fingerprint."""
+    _handlers[kind] = (handler, inputs)
+
+
+def _now() -> str:
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def fingerprint(kind: str, params: Dict[str, Any]) -> str:
+    """Hash of the job kind, its parameters and the current state of its input files."""
+    h = hashlib.sha256()
+    h.update(kind.encode("utf-8"))
+    h.update(json.dumps(params, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8"))
+    _, inputs = _handlers.get(kind, (None, None))
+    for path in (inputs(params) if inputs else ()):
+        path = Path(path)
+        stat = path.stat() if path.exists() else None
+        h.update(f"{path}:{stat.st_mtime_ns if stat else 0}:{stat.st_size if stat else 0}".encode("utf-8"))
+    return h.hexdigest()
+
+
+class JobQueue:
+    """Thread pool running registered jobs, with state kept in SQLite.
+
+    Submitting a job whose fingerprint matches a queued, running or finished
+    job returns that job instead of starting another one, so identical
+    requests from different sessions share one run and one result file.
+    """
+
+    def __init__(self, jobs_dir: Path = JOBS_DIR, workers: int = DEFAULT_WORKERS):
+        self.jobs_dir = Path(jobs_dir)
+        self.results_dir = self.jobs_dir / "results"
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.jobs_dir / "jobs.db"
+        self._local = threading.local()
+        self._submit_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="syseng-job")
+
+        conn = self._conn()
+        conn.executescript(JOB_SCHEMA)
+        # Jobs left active by a process that has since exited will never finish
+        stale = [
+            (_now(), job_id)
+            for job_id, pid in conn.execute(
+                "SELECT job_id, worker_pid FROM job WHERE status IN ('queued', 'running')"
+            )
+            if not _pid_alive(pid)
+        ]
+        with conn:
+            conn.executemany(
+                "UPDATE job SET status = 'failed', error = 'Interrupted by a restart', finished_at = ? "
+                "WHERE job_id = ?",
+                stale,
+            )
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=10)
+            conn.execute("PRAGMA journal_mode = WAL")
+            self._local.conn = conn
+        return conn
+
+    # ------------------------------
+    # Submitting and reading jobs
+    # ------------------------------
+    def submit(self, kind: str, params: Dict[str, Any], label: Optional[str] = None) -> int:
+        """Queue a job, or return the id of an identical active or finished one."""
+        if kind not in _handlers:
+            raise KeyError(f"Unknown job kind: {kind}")
+        fp = fingerprint(kind, params)
+        conn = self._conn()
+        with self._submit_lock:
+            for job_id, status, result_file in conn.execute(
+                "SELECT job_id, status, result_file FROM job WHERE fingerprint = ? "
+                "AND status IN ('queued', 'running', 'done') ORDER BY job_id DESC",
+                (fp,),
+            ):
+                if status != "done" or (self.results_dir / result_file).exists():
+                    return job_id
+            with conn:
+                job_id = conn.execute(
+                    "INSERT INTO job(kind, fingerprint, label, status, params, submitted_at, worker_pid) "
+                    "VALUES (?, ?, ?, 'queued', ?, ?, ?)",
+                    (kind, fp, label or kind, json.dumps(params, default=str), _now(), os.getpid()),
+                ).lastrowid
+        self._executor.submit(self._run, job_id, kind, fp, params)
+        return job_id
+
+    def get(self, job_id: int) -> Optional[Dict[str, Any]]:
+        row = self._conn().execute(
+            f"SELECT {', '.join(JOB_COLUMNS)} FROM job WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        return dict(zip(JOB_COLUMNS, row)) if row else None
+
+    def jobs(self, limit: int = 50, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        sql = f"SELECT {', '.join(JOB_COLUMNS)} FROM job"
+        params: Tuple = ()
+        if kind is not None:
+            sql += " WHERE kind = ?"
+            params = (kind,)
+        rows = self._conn().execute(sql + " ORDER BY job_id DESC LIMIT ?", params + (limit,))
+        return [dict(zip(JOB_COLUMNS, row)) for row in rows]
+
+    def result_path(self, job_id: int) -> Optional[Path]:
+        """Result file of a finished job, if it is still on disk."""
+        row = self._conn().execute(
+            "SELECT result_file FROM job WHERE job_id = ? AND status = 'done'", (job_id,)
+        ).fetchone()
+        if row is None or not (self.results_dir / row[0]).exists():
+            return None
+        return self.results_dir / row[0]
+
+    def result(self, job_id: int) -> Optional[bytes]:
+        path = self.result_path(job_id)
+        return path.read_bytes() if path is not None else None
+
+    # ------------------------------
+    # Worker side
+    # ------------------------------
+    def _update(self, job_id: int, **fields: Any) -> None:
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                f"UPDATE job SET {', '.join(f'{k} = ?' for k in fields)} WHERE job_id = ?",
+                list(fields.values()) + [job_id],
+            )
+
+    def _run(self, job_id: int, kind: str, fp: str, params: Dict[str, Any]) -> None:
+        handler, _ = _handlers[kind]
+        self._update(job_id, status="running", started_at=_now())
+        last = [0.0]
+
+        def progress(fraction: float, message: str = "") -> None:
+            now = time.monotonic()
+            if now - last[0] >= PROGRESS_INTERVAL:
+                last[0] = now
+                self._update(job_id, progress=max(0.0, min(1.0, fraction)), message=message)
+
+        t0 = time.perf_counter()
+        try:
+            content, name, mime = handler(params, progress)
+            result_file = f"{fp}{Path(name).suffix}"
+            tmp = self.results_dir / f"{result_file}.tmp"
+            tmp.write_bytes(content)
+            tmp.replace(self.results_dir / result_file)
+            self._update(
+                job_id, status="done", progress=1.0, message="Done", finished_at=_now(),
+                result_file=result_file, result_name=name, result_mime=mime,
+            )
+            logger.info("job %s (%s) done in %.2fs", job_id, kind, time.perf_counter() - t0)
+        except Exception as e:
+            self._update(job_id, status="failed", error=str(e), finished_at=_now())
+            logger.exception("job %s (%s) failed", job_id, kind)
+
+
+_queue: Optional[JobQueue] = None
+_queue_lock = threading.Lock()
+
+
+def get_queue() -> JobQueue:
+    """Process-wide queue shared by every session."""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = JobQueue()
+        return _queue
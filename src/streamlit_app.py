@@ -1,18 +1,37 @@
 import streamlit as st
+import time
+
+import instrumentation
+import warmup
+
+
+@st.cache_resource
+def start_prewarm():
+    # Runs once per server process, in the background, on the first visit
+    return warmup.start_prewarm()
+
+
+start_prewarm()
 
 
 pages = {
     "Home": [
         st.Page("/home/myintsai/Documents/syseng-toolkit/src/HomeBar/Home.py", title= "Home"),
         st.Page("/home/myintsai/Documents/syseng-toolkit/src/HomeBar/About.py", title= "About"),
+        st.Page("/home/myintsai/Documents/syseng-toolkit/src/HomeBar/Jobs.py", title= "Jobs"),
+        st.Page("/home/myintsai/Documents/syseng-toolkit/src/HomeBar/Diagnostics.py", title= "Diagnostics", url_path="diagnostics", visibility="hidden"),
     ],
     "Requirements": [
         st.Page("/home/myintsai/Documents/syseng-toolkit/src/Requirements/RequirementsMgmt.py", title= "Requirements Management"),
-        st.Page("/home/myintsai/Documents/syseng-toolkit/src/Requirements/RequirementsView.py", title= "View Requirements")        
+        st.Page("/home/myintsai/Documents/syseng-toolkit/src/Requirements/RequirementsView.py", title= "View Requirements"),
+        st.Page("/home/myintsai/Documents/syseng-toolkit/src/Requirements/VerificationCoverage.py", title= "Verification Coverage"),
+        st.Page("/home/myintsai/Documents/syseng-toolkit/src/Requirements/Traceability.py", title= "Traceability"),
+        st.Page("/home/myintsai/Documents/syseng-toolkit/src/Requirements/ScheduleSlip.py", title= "Schedule Slip")
     ],
     "Test": [
         st.Page("/home/myintsai/Documents/syseng-toolkit/src/Test/RunTest.py", title= "Run Tests"),
-        st.Page("/home/myintsai/Documents/syseng-toolkit/src/Test/ReviewTest.py", title= "Review Tests")
+        st.Page("/home/myintsai/Documents/syseng-toolkit/src/Test/ReviewTest.py", title= "Review Tests"),
+        st.Page("/home/myintsai/Documents/syseng-toolkit/src/Test/TestDashboard.py", title= "Test Dashboard")
     ],
     "Issues": [
         st.Page("/home/myintsai/Documents/syseng-toolkit/src/Issues/IssuesMgmt.py", title= "Issue Management"),
@@ -20,4 +39,14 @@ pages = {
 }
 
 pg =st.navigation(pages,position="top")
-pg.run()
\ No newline at end of file
+
+# Page run times; the first run of each page in the process is the cold start.
+# Per-rerun diagnostics are opt-in, see the hidden /diagnostics page.
+_t0 = time.perf_counter()
+instrumentation.begin_rerun(pg.title)
+try:
+    with instrumentation.maybe_profile(pg.title):
+        pg.run()
+finally:
+    instrumentation.end_rerun()
+    warmup.record_page(pg.title, time.perf_counter() - _t0)
\ No newline at end of file
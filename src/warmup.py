@@ -0,0 +1,134 @@
+import importlib
+import importlib.util
+import logging
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+SRC_DIR = Path(__file__).resolve().parent
+
+logger = logging.getLogger("syseng.startup")
+
+# Third-party modules the pages pull in on first use
+HEAVY_MODULES = ["pandas", "numpy", "plotly.graph_objects"]
+
+# Shared library modules, registered under the same names the pages use
+LIBRARY_MODULES = {
+    "requirements_loader": SRC_DIR / "Requirements" / "loader.py",
+    "requirements_corpus": SRC_DIR / "Requirements" / "corpus.py",
+    "requirements_coverage": SRC_DIR / "Requirements" / "coverage.py",
+    "data_db": SRC_DIR / "Data" / "db.py",
+    "test_persistence": SRC_DIR / "Test" / "persistence.py",
+}
+
+_lock = threading.Lock()
+_timings: Dict[str, Dict[str, Any]] = {"imports": {}, "prewarm": {}, "pages": {}}
+
+
+def load_module(name: str, path: Path):
+    """Load a module by file path once per process."""
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, str(path))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+
+def _timed(section: str, name: str, fn):
+    t0 = time.perf_counter()
+    try:
+        result = fn()
+        error = None
+    except Exception as e:  # a missing optional dependency must not stop the warm-up
+        result, error = None, str(e)
+    elapsed = time.perf_counter() - t0
+    with _lock:
+        _timings[section][name] = {"seconds": elapsed, "error": error}
+    if error:
+        logger.warning("%s %s failed after %.3fs: %s", section, name, elapsed, error)
+    else:
+        logger.info("%s %s took %.3fs", section, name, elapsed)
+    return result
+
+
+def prewarm() -> Dict[str, Dict[str, Any]]:
+    """Import heavy dependencies and fill the requirement and DB caches."""
+    for name in HEAVY_MODULES:
+        _timed("imports", name, lambda: importlib.import_module(name))
+
+    modules = {}
+    for name, path in LIBRARY_MODULES.items():
+        modules[name] = _timed("imports", name, lambda: load_module(name, path))
+
+    loader = modules.get("requirements_loader")
+    corpus = modules.get("requirements_corpus")
+    if loader is not None:
+        # Every requirements file, as View Requirements reads them
+        # In-process (workers=1): this runs inside the app's threaded server
+        if corpus is not None:
+            _timed("prewarm", "requirements", lambda: corpus.load_corpus(workers=1))
+        else:
+            _timed("prewarm", "requirements", loader.load_requirements_frame)
+        def warm_slip():
+            if corpus is not None:
+                analytics = corpus.slip_analytics(workers=1)
+            else:
+                analytics = loader.load_slip_analytics()
+            analytics.by_priority()
+            analytics.by_tag()
+        _timed("prewarm", "slip", warm_slip)
+
+    # Saved events and issues are not pre-warmed: each session loads and edits
+    # its own copy, so there is no shared cache to fill
+
+    db = modules.get("data_db")
+    coverage = modules.get("requirements_coverage")
+    if db is not None and db.DB_PATH.exists():
+        def warm_db():
+            database = db.get_database()
+            for query in ("systems", "verification_methods"):
+                database.query(query)
+            # Read-only: the coverage schema is installed by the ETL and the
+            # Verification Coverage page, never from here
+            if coverage is not None and database.reader().execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'verification_coverage'"
+            ).fetchone():
+                database.cached(("coverage_matrix",), coverage.coverage_matrix)
+        _timed("prewarm", "database", warm_db)
+
+    return timings()
+
+
+def start_prewarm() -> threading.Thread:
+    """Run prewarm() in a daemon thread so the first page is not held up."""
+    thread = threading.Thread(target=prewarm, name="syseng-prewarm", daemon=True)
+    thread.start()
+    return thread
+
+
+def record_page(title: str, seconds: float) -> None:
+    """Record one page run; the first run in the process is the cold one."""
+    with _lock:
+        page = _timings["pages"].setdefault(
+            title, {"cold_seconds": seconds, "last_seconds": seconds, "runs": 0}
+        )
+        page["last_seconds"] = seconds
+        page["runs"] += 1
+        cold = page["runs"] == 1
+    if cold:
+        logger.info("page %s cold run took %.3fs", title, seconds)
+
+
+def timings() -> Dict[str, Dict[str, Any]]:
+    with _lock:
+        return {section: dict(values) for section, values in _timings.items()}
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    t0 = time.perf_counter()
+    prewarm()
+    print(f"Pre-warm finished in {time.perf_counter() - t0:.3f}s")
@@ -0,0 +1,37 @@
+import importlib.util
+import runpy
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _load_module(name, relative_path):
+    # Same by-path loading (and module names) as the pages use
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, str(ROOT / relative_path))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+
+@pytest.fixture
+def load_module():
+    return _load_module
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """A fresh, empty requirement store built by data/sqlite-etl.py."""
+    path = tmp_path / "systems_of_systems.db"
+    monkeypatch.setenv("SYSENG_DB_PATH", str(path))
+    runpy.run_path(str(ROOT / "data" / "sqlite-etl.py"), run_name="__main__")
+    conn = sqlite3.connect(path)
+    conn.execute("INSERT INTO system(id, name) VALUES (1, 'System 1'), (2, 'System 2')")
+    conn.commit()
+    yield conn
+    conn.close()
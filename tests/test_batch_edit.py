@@ -0,0 +1,68 @@
+import pytest
+
+
+@pytest.fixture
+def batch_edit(load_module):
+    return load_module("requirements_batch", "src/Requirements/batch_edit.py")
+
+
+@pytest.fixture
+def conn(store, batch_edit):
+    batch_edit.ensure_batch_schema(store)
+    store.executemany(
+        "INSERT INTO requirement(id, system_id, level, description, name, priority, status, tags) "
+        "VALUES (?, 1, 'functional', ?, ?, ?, ?, ?)",
+        [
+            (1, "First", "Alpha", "High", "Open", "security"),
+            # Synced records store '' for empty text fields
+            (2, "Second", "Beta", "", "Open", ""),
+        ],
+    )
+    store.commit()
+    return store
+
+
+def edit(rows, requirement_id, **values):
+    return [dict(row, **values) if row["id"] == requirement_id else dict(row) for row in rows]
+
+
+def value(conn, requirement_id, column):
+    return conn.execute(f"SELECT {column} FROM requirement WHERE id = ?", (requirement_id,)).fetchone()[0]
+
+
+def test_apply_and_undo(conn, batch_edit):
+    rows = batch_edit.load_rows(conn)
+    changes = batch_edit.diff_rows(rows, edit(rows, 1, status="Closed", owner="Ada"))
+    assert sorted(changes) == [(1, "owner", None, "Ada"), (1, "status", "Open", "Closed")]
+
+    batch_id = batch_edit.apply_batch(conn, changes)
+    assert (value(conn, 1, "status"), value(conn, 1, "owner")) == ("Closed", "Ada")
+    assert batch_edit.last_batch(conn)["batch_id"] == batch_id
+
+    assert batch_edit.undo_last_batch(conn) == batch_id
+    assert (value(conn, 1, "status"), value(conn, 1, "owner")) == ("Open", None)
+    assert batch_edit.last_batch(conn) is None
+
+
+def test_edit_of_empty_string_cell(conn, batch_edit):
+    # Regression: '' loads as empty and the guard has to accept it
+    rows = batch_edit.load_rows(conn)
+    changes = batch_edit.diff_rows(rows, edit(rows, 2, tags="ui", priority="Low"))
+    batch_edit.apply_batch(conn, changes)
+    assert (value(conn, 2, "tags"), value(conn, 2, "priority")) == ("ui", "Low")
+
+
+def test_conflicting_edit_writes_nothing(conn, batch_edit):
+    rows = batch_edit.load_rows(conn)
+    changes = batch_edit.diff_rows(rows, edit(edit(rows, 1, status="Closed"), 2, status="Failed"))
+    conn.execute("UPDATE requirement SET status = 'In Progress' WHERE id = 2")
+    conn.commit()
+    with pytest.raises(batch_edit.EditConflict):
+        batch_edit.apply_batch(conn, changes)
+    assert value(conn, 1, "status") == "Open"
+    assert batch_edit.last_batch(conn) is None
+
+
+def test_non_editable_column_is_rejected(conn, batch_edit):
+    with pytest.raises(ValueError):
+        batch_edit.apply_batch(conn, [(1, "level", "functional", "system")])
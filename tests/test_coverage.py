@@ -0,0 +1,113 @@
+import pytest
+
+
+@pytest.fixture
+def coverage(load_module):
+    return load_module("requirements_coverage", "src/Requirements/coverage.py")
+
+
+def add_requirement(conn, requirement_id, system_id, level, *methods):
+    conn.execute(
+        "INSERT INTO requirement(id, system_id, level, description) VALUES (?, ?, ?, ?)",
+        (requirement_id, system_id, level, f"Requirement {requirement_id}"),
+    )
+    conn.executemany(
+        "INSERT INTO requirement_verification(requirement_id, verification_method_id) VALUES (?, ?)",
+        [(requirement_id, method) for method in methods],
+    )
+
+
+def snapshot(conn):
+    # Triggers leave zero-count rows behind where a rebuild writes none
+    return {
+        "coverage": conn.execute(
+            "SELECT system_id, level, verification_method_id, requirement_count "
+            "FROM verification_coverage WHERE requirement_count > 0 ORDER BY 1, 2, 3"
+        ).fetchall(),
+        "total": conn.execute(
+            "SELECT system_id, level, requirement_count, uncovered_count "
+            "FROM verification_coverage_total WHERE requirement_count > 0 ORDER BY 1, 2"
+        ).fetchall(),
+        "uncovered": conn.execute(
+            "SELECT requirement_id, system_id, level FROM verification_uncovered ORDER BY 1"
+        ).fetchall(),
+    }
+
+
+def assert_matches_rebuild(conn, coverage):
+    conn.commit()
+    tracked = snapshot(conn)
+    coverage.rebuild_coverage(conn)
+    assert tracked == snapshot(conn)
+    return tracked
+
+
+def test_inserts(store, coverage):
+    add_requirement(store, 1, 1, "system", 1, 2)
+    add_requirement(store, 2, 1, "system")
+    add_requirement(store, 3, 2, "functional", 3)
+    add_requirement(store, 4, None, "functional")
+    tracked = assert_matches_rebuild(store, coverage)
+    assert tracked["total"] == [(0, "functional", 1, 1), (1, "system", 2, 1), (2, "functional", 1, 0)]
+    assert coverage.uncovered_requirements(store) == [2, 4]
+
+
+def test_link_and_unlink(store, coverage):
+    add_requirement(store, 1, 1, "system", 1)
+    add_requirement(store, 2, 1, "system")
+    store.execute("INSERT INTO requirement_verification VALUES (2, 2)")
+    store.execute("INSERT INTO requirement_verification VALUES (2, 3)")
+    store.execute("DELETE FROM requirement_verification WHERE requirement_id = 2 AND verification_method_id = 2")
+    store.execute("DELETE FROM requirement_verification WHERE requirement_id = 1")
+    assert_matches_rebuild(store, coverage)
+    assert coverage.uncovered_requirements(store) == [1]
+
+
+def test_link_update(store, coverage):
+    add_requirement(store, 1, 1, "system", 1)
+    add_requirement(store, 2, 1, "system")
+    store.execute("UPDATE requirement_verification SET verification_method_id = 3 WHERE requirement_id = 1")
+    store.execute("UPDATE requirement_verification SET requirement_id = 2 WHERE requirement_id = 1")
+    assert_matches_rebuild(store, coverage)
+    assert coverage.uncovered_requirements(store) == [1]
+
+
+def test_requirement_moves_and_deletes(store, coverage):
+    add_requirement(store, 1, 1, "system", 1, 2)
+    add_requirement(store, 2, 1, "system")
+    add_requirement(store, 3, 2, "functional", 3)
+    store.execute("UPDATE requirement SET system_id = 2, level = 'functional' WHERE id = 1")
+    store.execute("UPDATE requirement SET system_id = NULL WHERE id = 2")
+    store.execute("UPDATE requirement SET description = 'Reworded' WHERE id = 3")
+    store.execute("DELETE FROM requirement WHERE id = 3")
+    tracked = assert_matches_rebuild(store, coverage)
+    assert tracked["total"] == [(0, "system", 1, 1), (2, "functional", 1, 0)]
+
+
+def test_matrix_reads_the_summary(store, coverage):
+    add_requirement(store, 1, 1, "system", 1, 2)
+    add_requirement(store, 2, 1, "system", 1)
+    add_requirement(store, 3, 1, "system")
+    store.commit()
+    [row] = coverage.coverage_matrix(store)
+    assert row == {
+        "system_id": 1, "system": "System 1", "level": "system", "requirements": 3,
+        "demonstration": 2, "inspection": 1, "analysis": 0, "uncovered": 1,
+    }
+
+
+def test_ensure_coverage_backfills_existing_rows(store, coverage):
+    add_requirement(store, 1, 1, "system", 1)
+    add_requirement(store, 2, 2, "functional")
+    store.commit()
+    expected = snapshot(store)
+    store.executescript(
+        "".join(f"DROP TABLE {t};" for t in coverage.COVERAGE_TABLES)
+        + "".join(
+            f"DROP TRIGGER {name};"
+            for (name,) in store.execute("SELECT name FROM sqlite_master WHERE name LIKE 'trg_cov_%'").fetchall()
+        )
+    )
+    assert coverage.ensure_coverage(store) is True
+    assert snapshot(store) == expected
+    assert coverage.ensure_coverage(store) is False
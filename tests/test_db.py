@@ -0,0 +1,80 @@
+import sqlite3
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def db(load_module):
+    return load_module("data_db", "src/Data/db.py")
+
+
+@pytest.fixture
+def database(db, tmp_path):
+    path = tmp_path / "store.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE item (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.commit()
+    conn.close()
+    database = db.Database(path)
+    yield database
+    database.close()
+
+
+def count_items(conn):
+    return conn.execute("SELECT COUNT(*) FROM item").fetchone()[0]
+
+
+def external_insert(path, n):
+    conn = sqlite3.connect(path)
+    conn.executemany("INSERT INTO item(name) VALUES (?)", [(f"item {i}",) for i in range(n)])
+    conn.commit()
+    conn.close()
+
+
+def in_thread(fn):
+    result = []
+    thread = threading.Thread(target=lambda: result.append(fn()))
+    thread.start()
+    thread.join()
+    return result[0]
+
+
+def test_cached_value_is_reused(database):
+    assert database.cached(("count",), count_items) == 0
+    assert database.cached(("count",), count_items) == 0
+    assert (database.hits, database.misses) == (1, 1)
+
+
+def test_writer_invalidates_cache(database):
+    assert database.cached(("count",), count_items) == 0
+    with database.writer() as conn:
+        conn.execute("INSERT INTO item(name) VALUES ('a')")
+    assert database.cached(("count",), count_items) == 1
+
+
+def test_external_write_seen_by_same_thread(database):
+    assert database.cached(("count",), count_items) == 0
+    external_insert(database.path, 3)
+    assert database.cached(("count",), count_items) == 3
+
+
+def test_external_write_seen_by_new_thread(database):
+    # This thread caches and keeps its reader; another process commits; a new
+    # thread leases a fresh reader, which has not seen any version yet
+    assert database.cached(("count",), count_items, ttl=float("inf")) == 0
+    external_insert(database.path, 5)
+    assert in_thread(lambda: database.cached(("count",), count_items, ttl=float("inf"))) == 5
+
+
+def test_readers_are_reused_across_threads(database):
+    first = in_thread(lambda: id(database.reader()))
+    second = in_thread(lambda: id(database.reader()))
+    assert first == second
+
+
+def test_read_only_database_rejects_writes(db, database):
+    read_only = db.Database(database.path, read_only=True)
+    with pytest.raises(PermissionError):
+        with read_only.writer():
+            pass
@@ -0,0 +1,55 @@
+import json
+
+import pytest
+
+
+@pytest.fixture
+def persistence(load_module, tmp_path, monkeypatch):
+    module = load_module("test_persistence", "src/Test/persistence.py")
+    monkeypatch.setattr(module, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(module, "ISSUES_DIR", tmp_path / "issues")
+    monkeypatch.setattr(module, "EVENTS_FILE", tmp_path / "test_events.json")
+    return module
+
+
+def events():
+    return {
+        "EVT-1": {
+            "name": "Integration",
+            "cases": {
+                "TC-1": {"status": "Completed", "completed": True, "issue_found": False, "steps": {}},
+                "TC-2": {"status": "Not Started", "completed": False, "issue_found": False, "steps": {}},
+            },
+        }
+    }
+
+
+def edit_events_file(persistence):
+    # An edit made outside the app: status changed, saved counters left as they were
+    data = json.loads(persistence.EVENTS_FILE.read_text(encoding="utf-8"))
+    data["EVT-1"]["cases"]["TC-2"].update(status="Completed", completed=True, issue_found=True)
+    persistence.EVENTS_FILE.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+def test_saved_counters_are_used(persistence):
+    persistence.save_events(events())
+    counters = persistence.load_events()["EVT-1"]["counters"]
+    assert (counters["completed"], counters["passed"]) == (1, 1)
+    assert persistence.load_event_summaries()["EVT-1"]["counters"] == counters
+
+
+def test_external_edit_rebuilds_counters(persistence):
+    persistence.save_events(events())
+    edit_events_file(persistence)
+    counters = persistence.load_events()["EVT-1"]["counters"]
+    assert (counters["completed"], counters["issue_found"], counters["passed"]) == (2, 1, 1)
+    assert counters["status"] == {"Completed": 2}
+
+
+def test_external_edit_rebuilds_summaries(persistence):
+    persistence.save_events(events())
+    edit_events_file(persistence)
+    summary = persistence.load_event_summaries()["EVT-1"]["counters"]
+    assert (summary["completed"], summary["issue_found"]) == (2, 1)
+    # The rewritten sidecar matches the edited file from now on
+    assert persistence.load_event_summaries()["EVT-1"]["counters"] == summary
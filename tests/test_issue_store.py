@@ -0,0 +1,63 @@
+import sqlite3
+
+import pytest
+
+
+@pytest.fixture
+def issue_store(load_module):
+    return load_module("issue_store", "src/Issues/issue_store.py")
+
+
+@pytest.fixture
+def conn(issue_store):
+    conn = sqlite3.connect(":memory:")
+    issue_store.ensure_issue_schema(conn)
+    yield conn
+    conn.close()
+
+
+def issue(issue_id, **values):
+    record = {
+        "issue_id": issue_id,
+        "event_id": "EVT-1",
+        "test_id": "TC-1",
+        "test_name": "Startup",
+        "title": "Fails on boot",
+        "severity": "High",
+        "status": "Open",
+        "created_date": "2026-01-05 10:00:00",
+    }
+    record.update(values)
+    return record
+
+
+def status(conn, issue_id):
+    return conn.execute("SELECT status FROM issue WHERE issue_id = ?", (issue_id,)).fetchone()[0]
+
+
+def test_new_issues_are_added(conn, issue_store):
+    result = issue_store.import_issues(conn, [issue("ISS-0001"), issue("ISS-0002", test_id="TC-2")])
+    assert result == {"added": 2, "kept": [], "conflicts": []}
+    assert issue_store.count_issues(conn, {}) == 2
+
+
+def test_reimport_of_same_issues_reports_nothing(conn, issue_store):
+    issue_store.import_issues(conn, [issue("ISS-0001")])
+    result = issue_store.import_issues(conn, [issue("ISS-0001"), issue("ISS-0001")])
+    assert result == {"added": 0, "kept": [], "conflicts": []}
+
+
+def test_changed_issue_keeps_stored_triage_and_is_reported(conn, issue_store):
+    issue_store.import_issues(conn, [issue("ISS-0001")])
+    issue_store.bulk_update(conn, ["ISS-0001"], status="In Progress")
+    result = issue_store.import_issues(conn, [issue("ISS-0001", status="Resolved")])
+    assert result == {"added": 0, "kept": ["ISS-0001"], "conflicts": []}
+    assert status(conn, "ISS-0001") == "In Progress"
+
+
+def test_reused_id_from_another_session_is_reported(conn, issue_store):
+    issue_store.import_issues(conn, [issue("ISS-0001")])
+    other = issue("ISS-0001", event_id="EVT-2", created_date="2026-01-06 09:00:00", title="Other")
+    result = issue_store.import_issues(conn, [other])
+    assert result == {"added": 0, "kept": [], "conflicts": ["ISS-0001"]}
+    assert conn.execute("SELECT title FROM issue").fetchall() == [("Fails on boot",)]
@@ -0,0 +1,57 @@
+import sqlite3
+
+import pytest
+
+
+@pytest.fixture
+def run_history(load_module):
+    return load_module("run_history", "src/Test/run_history.py")
+
+
+@pytest.fixture
+def conn(run_history):
+    conn = sqlite3.connect(":memory:")
+    run_history.ensure_history_schema(conn)
+    yield conn
+    conn.close()
+
+
+def record(run_history, conn, statuses, run_at):
+    for status in statuses:
+        cases = {"TC-1": {"status": status}}
+        run_history.record_run(conn, "EVT-1", cases, ["TC-1"], run_at=run_at)
+
+
+def test_flaky_cases_keep_run_order_within_a_second(run_history, conn):
+    # Six runs in the same second: pass, fail, pass, fail, pass, fail
+    record(run_history, conn, ["Completed", "Failed"] * 3, run_at="2026-03-01 12:00:00")
+    [case] = run_history.flaky_cases(conn, min_runs=2)
+    assert (case["runs"], case["flips"]) == (6, 5)
+
+
+def test_flaky_cases_window_takes_the_latest_runs(run_history, conn):
+    record(run_history, conn, ["Failed", "Completed"], run_at="2026-03-01 12:00:00")
+    record(run_history, conn, ["Completed"] * 4, run_at="2026-03-02 12:00:00")
+    assert run_history.flaky_cases(conn, window=4, min_runs=2) == []
+    [case] = run_history.flaky_cases(conn, window=6, min_runs=2)
+    assert (case["runs"], case["flips"]) == (6, 1)
+
+
+def test_latest_status_breaks_same_second_ties_by_run(run_history, conn):
+    record(run_history, conn, ["Completed", "Failed"], run_at="2026-03-01 12:00:00")
+    [row] = run_history.last_green(conn)
+    assert row["last_status"] == "Failed"
+    assert [r["status"] for r in run_history.case_history(conn, "TC-1")] == ["Failed", "Completed"]
+
+
+def test_old_case_index_is_replaced(run_history):
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        "CREATE TABLE test_run_result (run_id INTEGER, case_id TEXT, event_id TEXT, run_at TEXT, "
+        "status TEXT, passed INTEGER, PRIMARY KEY (run_id, case_id)) WITHOUT ROWID"
+    )
+    conn.execute("CREATE INDEX idx_test_result_case_time ON test_run_result(case_id, run_at, passed)")
+    run_history.ensure_history_schema(conn)
+    indexes = {name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert "idx_test_result_case_time" not in indexes
+    assert "idx_test_result_case_run" in indexes
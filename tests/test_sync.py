@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+
+@pytest.fixture
+def sync(load_module):
+    return load_module("requirements_sync", "src/Requirements/sync.py")
+
+
+def record(name, status="Open", **values):
+    return {"name": name, "description": f"{name} shall work", "priority": "High",
+            "status": status, "tags": ["core"], **values}
+
+
+def write_corpus(path, records):
+    path.write_text(json.dumps([{k: v} for k, v in records.items()]), encoding="utf-8")
+    return path
+
+
+def requirements(conn):
+    return dict(conn.execute("SELECT req_key, status FROM requirement ORDER BY req_key").fetchall())
+
+
+def test_first_sync_inserts_and_second_is_unchanged(store, sync, tmp_path):
+    corpus = write_corpus(tmp_path / "a.json", {"REQ-1": record("One"), "REQ-2": record("Two")})
+    result = sync.sync_requirements(store, corpus, system_id=1)
+    assert (result["inserted"], result["unchanged"]) == (2, False)
+    assert requirements(store) == {"REQ-1": "Open", "REQ-2": "Open"}
+    assert sync.sync_requirements(store, corpus)["unchanged"] is True
+
+
+def test_only_changed_records_are_written(store, sync, tmp_path):
+    corpus = write_corpus(tmp_path / "a.json", {"REQ-1": record("One"), "REQ-2": record("Two")})
+    sync.sync_requirements(store, corpus)
+    write_corpus(corpus, {"REQ-1": record("One", status="Closed"), "REQ-3": record("Three")})
+    result = sync.sync_requirements(store, corpus)
+    assert {k: result[k] for k in ("inserted", "updated", "deleted", "conflicts")} == {
+        "inserted": 1, "updated": 1, "deleted": 1, "conflicts": 0,
+    }
+    assert requirements(store) == {"REQ-1": "Closed", "REQ-3": "Open"}
+
+
+def test_dry_run_writes_nothing(store, sync, tmp_path):
+    corpus = write_corpus(tmp_path / "a.json", {"REQ-1": record("One")})
+    result = sync.sync_requirements(store, corpus, dry_run=True)
+    assert result["inserted"] == 1
+    assert requirements(store) == {}
+    assert store.execute("SELECT COUNT(*) FROM sync_watermark").fetchone()[0] == 0
+
+
+def test_files_are_synced_independently(store, sync, tmp_path):
+    a = write_corpus(tmp_path / "a.json", {"REQ-1": record("One")})
+    b = write_corpus(tmp_path / "b.json", {"REQ-2": record("Two")})
+    sync.sync_requirements(store, a)
+    sync.sync_requirements(store, b)
+    assert requirements(store) == {"REQ-1": "Open", "REQ-2": "Open"}
+    write_corpus(b, {})
+    assert sync.sync_requirements(store, b)["deleted"] == 1
+    assert requirements(store) == {"REQ-1": "Open"}
+
+
+def test_key_owned_by_another_file_is_a_conflict(store, sync, tmp_path):
+    a = write_corpus(tmp_path / "a.json", {"REQ-1": record("One")})
+    b = write_corpus(tmp_path / "b.json", {"REQ-1": record("One", status="Closed"), "REQ-2": record("Two")})
+    sync.sync_requirements(store, a)
+    result = sync.sync_requirements(store, b)
+    assert (result["inserted"], result["conflicts"]) == (1, 1)
+    assert requirements(store) == {"REQ-1": "Open", "REQ-2": "Open"}
+
+
+def test_unowned_rows_are_claimed_not_deleted(store, sync, tmp_path):
+    a = write_corpus(tmp_path / "a.json", {"REQ-1": record("One"), "REQ-2": record("Two")})
+    sync.sync_requirements(store, a)
+    # As left by a store synced before rows recorded their source
+    store.execute("UPDATE requirement_sync SET source = NULL")
+    store.execute("DELETE FROM sync_watermark")
+    store.commit()
+    b = write_corpus(tmp_path / "b.json", {"REQ-2": record("Two")})
+    result = sync.sync_requirements(store, b)
+    assert {k: result[k] for k in ("inserted", "updated", "deleted")} == {"inserted": 0, "updated": 0, "deleted": 0}
+    assert requirements(store) == {"REQ-1": "Open", "REQ-2": "Open"}
+    sources = dict(store.execute("SELECT req_key, source FROM requirement_sync").fetchall())
+    assert sources == {"REQ-1": None, "REQ-2": str(b.resolve())}
+
+
+def test_synced_rows_feed_the_coverage_summary(store, sync, tmp_path, load_module):
+    coverage = load_module("requirements_coverage", "src/Requirements/coverage.py")
+    corpus = write_corpus(tmp_path / "a.json", {"REQ-1": record("One"), "REQ-2": record("Two")})
+    sync.sync_requirements(store, corpus, system_id=2)
+    [row] = coverage.coverage_matrix(store)
+    assert (row["system_id"], row["level"], row["requirements"], row["uncovered"]) == (2, "functional", 2, 2)